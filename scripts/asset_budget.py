@@ -0,0 +1,460 @@
+#!/usr/bin/env python3
+"""
+Budget de poids des assets (``assets/``, références Stitch).
+
+Chaque fichier des dossiers budgétés est mesuré : taille sur disque et, pour
+les images PNG / JPEG / WebP / GIF, dimensions lues dans l'en-tête du
+fichier (``mmap``, aucun pixel décodé ; un JPEG est parcouru segment par
+segment jusqu'au marqueur SOF). La taille décodée (largeur x hauteur x 4
+octets) donne le coût mémoire au démarrage.
+
+Les budgets sont définis par dossier dans ``scripts/asset_budgets.json`` ;
+un fichier suit le budget du dossier le plus précis qui le contient, sinon
+le budget ``default`` :
+
+- ``max_file_kb`` : taille maximale d'un fichier ;
+- ``max_total_kb`` : taille totale du dossier ;
+- ``max_width`` / ``max_height`` : résolution maximale d'une image.
+
+Les assets déclarés dans ``pubspec.yaml`` (section ``flutter:``, ``assets``
+et ``fonts``) sont marqués « embarqués » : un dépassement sur l'un d'eux
+est de gravité ``high`` et fait échouer la commande.
+
+Usage:
+    python scripts/asset_budget.py
+    python scripts/asset_budget.py --budgets scripts/asset_budgets.json --json
+"""
+
+import os
+import re
+import sys
+import json
+import mmap
+import struct
+import argparse
+from dataclasses import dataclass, asdict
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from project_index import ProjectIndex
+
+BUDGET_FILE = "scripts/asset_budgets.json"
+PUBSPEC_FILE = "pubspec.yaml"
+DEFAULT_BUDGET = "(défaut)"
+# Sous-dossiers de variantes de résolution (``2.0x/``), inclus avec leur dossier
+_VARIANT_DIR_RE = re.compile(r"^\d+(\.\d+)?x$")
+BUDGET_KEYS = {"max_file_kb", "max_total_kb", "max_width", "max_height"}
+# Marqueurs JPEG Start Of Frame (hors DHT, JPG et DAC)
+_JPEG_SOF = {0xC0, 0xC1, 0xC2, 0xC3, 0xC5, 0xC6, 0xC7, 0xC9, 0xCA, 0xCB, 0xCD, 0xCE, 0xCF}
+
+
+class BudgetConfigError(Exception):
+    """Fichier de budgets absent ou invalide : aucun budget ne peut être vérifié."""
+
+
+@dataclass
+class AssetInfo:
+    """Mesure d'un fichier d'asset."""
+    path: str
+    size: int
+    budget: str
+    shipped: bool
+    format: Optional[str] = None
+    width: Optional[int] = None
+    height: Optional[int] = None
+
+    @property
+    def decoded_bytes(self) -> int:
+        """Taille de l'image décodée en RGBA (0 hors image)."""
+        return (self.width or 0) * (self.height or 0) * 4
+
+
+@dataclass
+class BudgetViolation:
+    """Dépassement d'un budget."""
+    path: str
+    budget: str
+    rule: str
+    value: int
+    limit: int
+    shipped: bool
+
+    @property
+    def severity(self) -> str:
+        return "high" if self.shipped else "medium"
+
+
+def _probe_png(data) -> Optional[Tuple[int, int]]:
+    if data[12:16] != b"IHDR":
+        return None
+    return struct.unpack(">II", data[16:24])
+
+
+def _probe_gif(data) -> Optional[Tuple[int, int]]:
+    return struct.unpack("<HH", data[6:10])
+
+
+def _probe_webp(data) -> Optional[Tuple[int, int]]:
+    chunk = data[12:16]
+    if chunk == b"VP8 " and data[23:26] == b"\x9d\x01\x2a":
+        width, height = struct.unpack("<HH", data[26:30])
+        return width & 0x3FFF, height & 0x3FFF
+    if chunk == b"VP8L" and data[20] == 0x2F:
+        bits = int.from_bytes(data[21:25], "little")
+        return (bits & 0x3FFF) + 1, ((bits >> 14) & 0x3FFF) + 1
+    if chunk == b"VP8X":
+        width = int.from_bytes(data[24:27], "little") + 1
+        height = int.from_bytes(data[27:30], "little") + 1
+        return width, height
+    return None
+
+
+def _probe_jpeg(data) -> Optional[Tuple[int, int]]:
+    pos, size = 2, len(data)
+    while pos + 4 <= size:
+        if data[pos] != 0xFF:
+            return None
+        marker = data[pos + 1]
+        if marker == 0xFF:
+            pos += 1
+            continue
+        if marker == 0x01 or 0xD0 <= marker <= 0xD8:
+            pos += 2
+            continue
+        if marker in (0xD9, 0xDA):
+            return None
+        length = struct.unpack(">H", data[pos + 2:pos + 4])[0]
+        if marker in _JPEG_SOF:
+            if pos + 9 > size:
+                return None
+            height, width = struct.unpack(">HH", data[pos + 5:pos + 9])
+            return width, height
+        pos += 2 + length
+    return None
+
+
+def probe_image(path: Path) -> Optional[Tuple[str, int, int]]:
+    """(format, largeur, hauteur) lus dans l'en-tête, ou None hors image.
+
+    Le fichier est projeté en mémoire : seules les pages de l'en-tête (et
+    des segments JPEG parcourus) sont lues.
+    """
+    try:
+        with open(path, "rb") as handle:
+            if os.fstat(handle.fileno()).st_size < 30:
+                return None
+            with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                if data[:8] == b"\x89PNG\r\n\x1a\n":
+                    kind, size = "png", _probe_png(data)
+                elif data[:3] == b"\xff\xd8\xff":
+                    kind, size = "jpeg", _probe_jpeg(data)
+                elif data[:4] == b"RIFF" and data[8:12] == b"WEBP":
+                    kind, size = "webp", _probe_webp(data)
+                elif data[:6] in (b"GIF87a", b"GIF89a"):
+                    kind, size = "gif", _probe_gif(data)
+                else:
+                    return None
+    except (OSError, ValueError, struct.error, IndexError):
+        return None
+    return (kind, size[0], size[1]) if size else None
+
+
+def _yaml_value(text: str) -> str:
+    """Valeur scalaire YAML sans commentaire ni guillemets."""
+    text = re.sub(r"\s+#.*$", "", text).strip()
+    return text.strip("'\"")
+
+
+def pubspec_assets(text: str) -> List[str]:
+    """Entrées ``assets`` et polices (``asset:``) de la section ``flutter:`` du pubspec.
+
+    Lecture ligne à ligne (pas de dépendance YAML) : seules les formes
+    utilisées par Flutter sont reconnues (``- chemin``, ``- path: chemin``,
+    ``asset: chemin``).
+    """
+    entries: List[str] = []
+    in_flutter = False
+    section = None
+    section_indent = item_indent = 0
+    for line in text.splitlines():
+        stripped = line.strip()
+        if not stripped or stripped.startswith("#"):
+            continue
+        indent = len(line) - len(line.lstrip())
+        if indent == 0:
+            in_flutter = stripped.startswith("flutter:")
+            section = None
+            continue
+        if not in_flutter:
+            continue
+        if section and indent <= section_indent:
+            section = None
+        if section is None:
+            key = stripped.split(":", 1)[0]
+            if key in ("assets", "fonts"):
+                section, section_indent, item_indent = key, indent, 0
+            continue
+        if section == "assets" and stripped.startswith("-"):
+            # Les listes imbriquées (``flavors:``) sont plus indentées que les entrées
+            item_indent = item_indent or indent
+            if indent > item_indent:
+                continue
+            value = stripped[1:].strip()
+            if value.startswith("path:"):
+                value = value[len("path:"):]
+            value = _yaml_value(value)
+            if value and not value.endswith(":"):
+                entries.append(value)
+        elif section == "assets" and stripped.startswith("path:"):
+            entries.append(_yaml_value(stripped[len("path:"):]))
+        elif section == "fonts":
+            item = stripped.lstrip("- ")
+            if item.startswith("asset:"):
+                entries.append(_yaml_value(item[len("asset:"):]))
+    return entries
+
+
+def shipped_files(index: ProjectIndex, entries: List[str]) -> Set[str]:
+    """Fichiers embarqués par les entrées du pubspec.
+
+    Comme Flutter : un dossier n'inclut que ses fichiers directs non cachés
+    et ses variantes de résolution (``2.0x/``), pas ses autres sous-dossiers.
+    """
+    shipped: Set[str] = set()
+    for entry in entries:
+        rel = entry.strip("/")
+        if entry.endswith("/") or index.is_dir(rel):
+            directories = [rel] + [f"{rel}/{d}" for d in index.subdirs(rel) if _VARIANT_DIR_RE.match(d)]
+            shipped.update(
+                f"{directory}/{name}"
+                for directory in directories
+                for name in index.files(directory)
+                if not name.startswith(".")
+            )
+        else:
+            shipped.add(rel)
+    return shipped
+
+
+def _check_limits(limits: Any, where: str) -> Dict[str, int]:
+    if not isinstance(limits, dict):
+        raise BudgetConfigError(f"{where} : objet attendu")
+    unknown = set(limits) - BUDGET_KEYS
+    if unknown:
+        raise BudgetConfigError(f"{where} : clés inconnues {', '.join(sorted(unknown))}")
+    for key, value in limits.items():
+        if isinstance(value, bool) or not isinstance(value, int) or value < 0:
+            raise BudgetConfigError(f"{where}.{key} : entier positif attendu")
+    return limits
+
+
+def load_budgets(path: Path) -> Dict[str, Any]:
+    """Budgets ``{"default": {...}, "directories": {dossier: {...}}}``.
+
+    Lève ``BudgetConfigError`` si le fichier est absent, illisible ou mal
+    formé : un budget mal saisi ne doit pas désactiver silencieusement le
+    contrôle.
+    """
+    try:
+        config = json.loads(path.read_text(encoding="utf-8"))
+    except OSError as e:
+        raise BudgetConfigError(f"{path} illisible : {e.strerror or e}") from e
+    except ValueError as e:
+        raise BudgetConfigError(f"{path} : JSON invalide ({e})") from e
+    if not isinstance(config, dict) or not isinstance(config.get("directories"), dict):
+        raise BudgetConfigError(f"{path} : objet avec une clé \"directories\" attendu")
+    return {
+        "default": _check_limits(config.get("default", {}), "default"),
+        "directories": {
+            key.strip("/"): _check_limits(value, f"directories.{key}")
+            for key, value in config["directories"].items()
+        },
+    }
+
+
+def budget_for(path: str, budgets: Dict[str, Any]) -> str:
+    """Dossier budgété le plus précis contenant ``path`` (ou ``DEFAULT_BUDGET``)."""
+    best = DEFAULT_BUDGET
+    for directory in budgets["directories"]:
+        if path.startswith(directory + "/") and (best == DEFAULT_BUDGET or len(directory) > len(best)):
+            best = directory
+    return best
+
+
+def _limits(budget: str, budgets: Dict[str, Any]) -> Dict[str, int]:
+    return budgets["default"] if budget == DEFAULT_BUDGET else budgets["directories"][budget]
+
+
+def measure_assets(index: ProjectIndex, budgets: Dict[str, Any], shipped: Set[str]) -> List[AssetInfo]:
+    """Mesure les fichiers des dossiers budgétés et les fichiers embarqués."""
+    paths = set(shipped)
+    for directory in budgets["directories"]:
+        # Fichiers cachés (``.gitkeep``) ignorés, sauf s'ils sont déclarés
+        paths.update(p for p in index.files_under(directory) if not p.rsplit("/", 1)[-1].startswith("."))
+    assets = []
+    for rel_path in sorted(paths):
+        full_path = index.path(rel_path)
+        try:
+            size = full_path.stat().st_size
+        except OSError:
+            continue
+        asset = AssetInfo(rel_path, size, budget_for(rel_path, budgets), rel_path in shipped)
+        image = probe_image(full_path)
+        if image:
+            asset.format, asset.width, asset.height = image
+        assets.append(asset)
+    return assets
+
+
+def check_budgets(assets: List[AssetInfo], budgets: Dict[str, Any]) -> List[BudgetViolation]:
+    """Dépassements par fichier (taille, résolution) puis par dossier (total)."""
+    violations: List[BudgetViolation] = []
+    totals: Dict[str, int] = {}
+    shipped_budgets: Set[str] = set()
+    for asset in assets:
+        limits = _limits(asset.budget, budgets)
+        totals[asset.budget] = totals.get(asset.budget, 0) + asset.size
+        if asset.shipped:
+            shipped_budgets.add(asset.budget)
+        checks = [("file_size", asset.size, limits.get("max_file_kb", 0) * 1024)]
+        if asset.width is not None:
+            checks.append(("width", asset.width, limits.get("max_width", 0)))
+            checks.append(("height", asset.height, limits.get("max_height", 0)))
+        for rule, value, limit in checks:
+            if limit and value > limit:
+                violations.append(BudgetViolation(asset.path, asset.budget, rule, value, limit, asset.shipped))
+    for budget, total in totals.items():
+        limit = _limits(budget, budgets).get("max_total_kb", 0) * 1024
+        if limit and total > limit:
+            violations.append(BudgetViolation(
+                budget, budget, "directory_total", total, limit, budget in shipped_budgets
+            ))
+    violations.sort(key=lambda v: (not v.shipped, v.budget, v.path, v.rule))
+    return violations
+
+
+def summarize_assets(assets: List[AssetInfo], violations: List[BudgetViolation],
+                     budgets: Dict[str, Any]) -> Dict[str, Any]:
+    """Totaux globaux et par budget (forme JSON du rapport)."""
+    def totals(items: List[AssetInfo]) -> Dict[str, int]:
+        return {
+            "files": len(items),
+            "bytes": sum(a.size for a in items),
+            "images": sum(1 for a in items if a.width is not None),
+            "decoded_bytes": sum(a.decoded_bytes for a in items),
+        }
+
+    by_budget: Dict[str, List[AssetInfo]] = {}
+    for asset in assets:
+        by_budget.setdefault(asset.budget, []).append(asset)
+    directories = {}
+    for budget in sorted(by_budget):
+        entry = totals(by_budget[budget])
+        entry["shipped_bytes"] = sum(a.size for a in by_budget[budget] if a.shipped)
+        entry["limits"] = _limits(budget, budgets)
+        entry["violations"] = sum(1 for v in violations if v.budget == budget)
+        directories[budget] = entry
+
+    shipped = [a for a in assets if a.shipped]
+    summary_totals = totals(assets)
+    summary_totals.update({
+        "shipped_files": len(shipped),
+        "shipped_bytes": sum(a.size for a in shipped),
+        "shipped_decoded_bytes": sum(a.decoded_bytes for a in shipped),
+    })
+    return {
+        "totals": summary_totals,
+        "directories": directories,
+        "violations": [dict(asdict(v), severity=v.severity) for v in violations],
+        "largest": [asdict(a) for a in sorted(assets, key=lambda a: -a.size)[:10]],
+    }
+
+
+def budget_inputs(project_root: Path, budget_file: str = BUDGET_FILE) -> Tuple[str, ...]:
+    """Chemins dont dépend le rapport : pubspec, budgets, dossiers budgétés et entrées du pubspec.
+
+    Sert d'entrées de mémoïsation à l'Overseer : un asset déclaré hors des
+    dossiers budgétés (``.env``...) doit lui aussi invalider le résultat.
+    """
+    inputs = [PUBSPEC_FILE, budget_file]
+    try:
+        inputs.extend(load_budgets(project_root / budget_file)["directories"])
+    except BudgetConfigError:
+        pass
+    try:
+        entries = pubspec_assets((project_root / PUBSPEC_FILE).read_text(encoding="utf-8"))
+    except OSError:
+        entries = []
+    inputs.extend(entry.strip("/") for entry in entries)
+    return tuple(dict.fromkeys(path for path in inputs if path))
+
+
+def analyze_project(index: ProjectIndex, budget_file: str = BUDGET_FILE) -> Dict[str, Any]:
+    """Rapport complet pour l'Overseer."""
+    budgets = load_budgets(index.path(budget_file))
+    entries: List[str] = []
+    if index.exists(PUBSPEC_FILE):
+        entries = pubspec_assets(index.path(PUBSPEC_FILE).read_text(encoding="utf-8"))
+    assets = measure_assets(index, budgets, shipped_files(index, entries))
+    summary = summarize_assets(assets, check_budgets(assets, budgets), budgets)
+    summary["budget_file"] = budget_file
+    summary["pubspec_entries"] = entries
+    return summary
+
+
+def format_size(size: int) -> str:
+    """Taille lisible (o, Ko, Mo)."""
+    if size < 1024:
+        return f"{size} o"
+    if size < 1024 * 1024:
+        return f"{size / 1024:.1f} Ko"
+    return f"{size / (1024 * 1024):.1f} Mo"
+
+
+def format_violation(violation: Dict[str, Any]) -> str:
+    """Valeur et limite d'un dépassement, dans l'unité de la règle."""
+    if violation["rule"] in ("width", "height"):
+        return f"{violation['value']} px > {violation['limit']} px"
+    return f"{format_size(violation['value'])} > {format_size(violation['limit'])}"
+
+
+def main():
+    """Point d'entrée principal."""
+    parser = argparse.ArgumentParser(description="Budget de poids des assets")
+    parser.add_argument("--budgets", default=BUDGET_FILE, help=f"Fichier de budgets (défaut : {BUDGET_FILE})")
+    parser.add_argument("--json", action="store_true", help="Sortie JSON")
+    args = parser.parse_args()
+
+    project_root = Path(__file__).parent.parent
+    try:
+        summary = analyze_project(ProjectIndex.build(project_root), args.budgets)
+    except BudgetConfigError as e:
+        print(f"❌ Budgets non vérifiés : {e}", file=sys.stderr)
+        return 2
+    shipped_violations = [v for v in summary["violations"] if v["shipped"]]
+
+    if args.json:
+        print(json.dumps(summary, indent=2, ensure_ascii=False))
+        return 1 if shipped_violations else 0
+
+    totals = summary["totals"]
+    print(f"📦 {totals['files']} fichiers, {format_size(totals['bytes'])} "
+          f"(embarqués : {totals['shipped_files']}, {format_size(totals['shipped_bytes'])} ; "
+          f"images décodées : {format_size(totals['shipped_decoded_bytes'])})")
+    print(f"\n{'Dossier':<40} {'Fichiers':>8} {'Taille':>10} {'Décodé':>10} {'Dépassements':>12}")
+    for name, entry in summary["directories"].items():
+        print(f"{name:<40} {entry['files']:>8} {format_size(entry['bytes']):>10} "
+              f"{format_size(entry['decoded_bytes']):>10} {entry['violations']:>12}")
+    if summary["violations"]:
+        print()
+    for violation in summary["violations"]:
+        origin = "embarqué" if violation["shipped"] else "non embarqué"
+        print(f"[{violation['severity']}] {violation['path']} {violation['rule']} : "
+              f"{format_violation(violation)} ({origin})")
+    return 1 if shipped_violations else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
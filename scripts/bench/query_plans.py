@@ -0,0 +1,533 @@
+#!/usr/bin/env python3
+"""
+Plans des requêtes critiques sur une base Postgres locale et jetable.
+
+1. ``initdb`` crée un cluster temporaire, démarré par ``pg_ctl`` sur une
+   socket Unix privée (``listen_addresses=''`` : aucun accès réseau).
+2. Un socle Supabase minimal (schéma ``auth``, ``auth.uid()``, rôles) est
+   créé, puis les migrations ``supabase/migrations/*.sql`` sont appliquées
+   dans l'ordre, chacune dans sa transaction. Une migration en échec (ex.
+   extension PostGIS absente) est signalée sans arrêter le banc.
+3. La base est remplie par synthetic_db.py à l'échelle demandée.
+4. Chaque requête de ``HOT_QUERIES`` passe sous
+   ``EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON)`` ; le temps médian, les blocs
+   lus, la forme du plan (type de nœud, table, index) et les parcours
+   séquentiels sont enregistrés en JSON dans ``.cache/bench/``.
+
+``--compare`` signale les régressions par rapport à un résultat de
+référence : nouveau parcours séquentiel, index qui n'est plus utilisé ou
+supprimé par une migration, forme de plan différente, requête plus lente
+ou plus coûteuse en blocs. Le code de sortie vaut 1 en cas de régression.
+
+Les binaires ``initdb``, ``pg_ctl`` et ``psql`` sont cherchés dans
+``--pg-bin``, le PATH puis ``pg_config --bindir``. ``initdb`` refuse de
+s'exécuter en root.
+
+Usage:
+    python scripts/bench/query_plans.py --scale small
+    python scripts/bench/query_plans.py --scale medium --compare .cache/bench/plans-medium-baseline.json
+"""
+
+import os
+import sys
+import json
+import shutil
+import statistics
+import subprocess
+import tempfile
+import argparse
+import contextlib
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from synthetic_db import SCALES, HOST_EVERY, entity_id, resolve_sizes, seed_sql
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
+MIGRATIONS_DIR = PROJECT_ROOT / "supabase" / "migrations"
+DEFAULT_RESULTS_DIR = Path(".cache") / "bench"
+DEFAULT_PORT = 54329
+# Fichier déposé dans un --workdir créé par cet outil : seul un tel dossier est réinitialisé
+WORKDIR_MARKER = ".campbnb-query-plans"
+
+# Tables remplies : un parcours séquentiel y est signalé
+SEEDED_TABLES = ("listings", "reservations", "reviews")
+# Régression de temps : au moins +50 % et +1 ms ; de blocs : +50 %
+SLOWER_RATIO = 1.5
+SLOWER_MIN_MS = 1.0
+BUFFERS_RATIO = 1.5
+
+# Stand-ins des objets fournis par Supabase et utilisés par les migrations
+SUPABASE_SHIM = """
+DO $$
+DECLARE
+    role_name TEXT;
+BEGIN
+    FOREACH role_name IN ARRAY ARRAY['anon', 'authenticated', 'service_role'] LOOP
+        IF NOT EXISTS (SELECT 1 FROM pg_roles WHERE rolname = role_name) THEN
+            EXECUTE format('CREATE ROLE %I NOLOGIN', role_name);
+        END IF;
+    END LOOP;
+END
+$$;
+
+CREATE SCHEMA IF NOT EXISTS auth;
+
+CREATE TABLE IF NOT EXISTS auth.users (
+    id UUID PRIMARY KEY,
+    email TEXT,
+    raw_user_meta_data JSONB DEFAULT '{}'::jsonb,
+    created_at TIMESTAMPTZ DEFAULT NOW()
+);
+
+CREATE OR REPLACE FUNCTION auth.uid() RETURNS UUID LANGUAGE sql STABLE AS $$
+    SELECT NULLIF(current_setting('request.jwt.claim.sub', true), '')::uuid
+$$;
+
+CREATE OR REPLACE FUNCTION auth.role() RETURNS TEXT LANGUAGE sql STABLE AS $$
+    SELECT NULLIF(current_setting('request.jwt.claim.role', true), '')
+$$;
+
+CREATE OR REPLACE FUNCTION auth.jwt() RETURNS JSONB LANGUAGE sql STABLE AS $$
+    SELECT COALESCE(NULLIF(current_setting('request.jwt.claims', true), ''), '{}')::jsonb
+$$;
+"""
+
+
+class PostgresError(Exception):
+    """Échec d'une commande Postgres (initdb, pg_ctl, psql)."""
+
+
+@dataclass
+class HotQuery:
+    """Requête critique du catalogue, et d'où elle vient."""
+    name: str
+    sql: str
+    source: str
+
+
+# Identifiants visés : une annonce, un hôte (premier profil hôte) et un voyageur
+QUERY_PARAMS = {
+    "listing": entity_id("listing", 42),
+    "host": entity_id("profile", HOST_EVERY),
+    "guest": entity_id("profile", 17),
+}
+
+HOT_QUERIES: List[HotQuery] = [
+    HotQuery("listings_search", """
+        SELECT * FROM public.listings
+        WHERE status = 'active' AND is_available = true
+          AND city ILIKE '%Québec%' AND province = 'QC'
+        ORDER BY created_at DESC LIMIT 20
+    """, "supabase/functions/listings/index.ts"),
+    HotQuery("listings_price_type", """
+        SELECT * FROM public.listings
+        WHERE status = 'active' AND is_available = true
+          AND property_type = 'cabin' AND base_price_per_night BETWEEN 80 AND 200
+        ORDER BY created_at DESC LIMIT 20
+    """, "supabase/functions/listings/index.ts"),
+    HotQuery("listings_fulltext", """
+        SELECT l.id, l.title,
+               ts_rank(to_tsvector('french', coalesce(l.title, '') || ' ' || coalesce(l.description, '')),
+                       plainto_tsquery('french', 'lac')) AS relevance_score
+        FROM public.listings l
+        WHERE l.status = 'active' AND l.is_available = true
+          AND (to_tsvector('french', coalesce(l.title, '') || ' ' || coalesce(l.description, ''))
+                   @@ plainto_tsquery('french', 'lac')
+               OR l.title ILIKE '%lac%' OR l.description ILIKE '%lac%' OR l.city ILIKE '%lac%')
+        ORDER BY relevance_score DESC, l.average_rating DESC NULLS LAST, l.created_at DESC
+        LIMIT 20
+    """, "supabase/migrations/007_search_optimization.sql (search_listings_fulltext)"),
+    HotQuery("listings_amenities", """
+        SELECT l.id, l.title, l.amenities FROM public.listings l
+        WHERE l.status = 'active' AND l.is_available = true
+          AND l.amenities ?| ARRAY['spa', 'kayak']
+        ORDER BY l.average_rating DESC NULLS LAST, l.base_price_per_night ASC
+        LIMIT 20
+    """, "supabase/migrations/007_search_optimization.sql (search_listings_by_amenities)"),
+    HotQuery("listing_detail", """
+        SELECT * FROM public.listings WHERE id = {listing} AND status = 'active'
+    """, "supabase/functions/listings/index.ts"),
+    HotQuery("host_listings", """
+        SELECT id FROM public.listings WHERE host_id = {host} AND status = 'active'
+    """, "supabase/functions/profiles/index.ts"),
+    HotQuery("guest_reservations", """
+        SELECT * FROM public.reservations WHERE guest_id = {guest}
+        ORDER BY created_at DESC
+    """, "supabase/functions/reservations/index.ts"),
+    HotQuery("host_pending_reservations", """
+        SELECT id FROM public.reservations WHERE host_id = {host} AND status = 'pending'
+    """, "supabase/functions/profiles/index.ts"),
+    HotQuery("listing_availability", """
+        SELECT COUNT(*) FROM public.reservations
+        WHERE listing_id = {listing}
+          AND status IN ('pending', 'confirmed')
+          AND check_in_date < current_date + 7 AND check_out_date > current_date
+    """, "supabase/migrations/002_row_level_security.sql (is_listing_available)"),
+    HotQuery("pending_timeouts", """
+        SELECT id FROM public.reservations
+        WHERE status = 'pending' AND requested_at < now() - interval '24 hours'
+    """, "supabase/functions/reservation-timeouts/index.ts"),
+    HotQuery("listing_reviews", """
+        SELECT * FROM public.reviews
+        WHERE is_public = true AND listing_id = {listing}
+        ORDER BY created_at DESC LIMIT 20
+    """, "supabase/functions/reviews/index.ts"),
+    HotQuery("reviewee_reviews", """
+        SELECT * FROM public.reviews
+        WHERE is_public = true AND reviewee_id = {host}
+        ORDER BY created_at DESC LIMIT 20
+    """, "supabase/functions/reviews/index.ts"),
+]
+HOT_QUERY_NAMES = [query.name for query in HOT_QUERIES]
+
+
+def find_binary(name: str, bin_dir: Optional[Path] = None) -> str:
+    """Chemin d'un binaire Postgres : ``bin_dir``, PATH, puis ``pg_config --bindir``."""
+    if bin_dir:
+        candidate = bin_dir / name
+        if candidate.exists():
+            return str(candidate)
+    found = shutil.which(name)
+    if found:
+        return found
+    pg_config = shutil.which("pg_config")
+    if pg_config:
+        result = subprocess.run([pg_config, "--bindir"], capture_output=True, text=True)
+        candidate = Path(result.stdout.strip()) / name
+        if result.returncode == 0 and candidate.exists():
+            return str(candidate)
+    raise PostgresError(f"{name} introuvable (installez Postgres ou utilisez --pg-bin)")
+
+
+def prepare_workdir(workdir: Path) -> Path:
+    """Crée ou réinitialise le dossier du cluster.
+
+    Un dossier existant n'est effacé que s'il porte ``WORKDIR_MARKER`` (créé
+    par une exécution précédente) ; tout autre dossier non vide est refusé.
+    """
+    workdir = workdir.resolve()
+    if workdir.exists():
+        if not workdir.is_dir():
+            raise PostgresError(f"--workdir {workdir} n'est pas un dossier")
+        if (workdir / WORKDIR_MARKER).is_file():
+            shutil.rmtree(workdir)
+        elif any(workdir.iterdir()):
+            raise PostgresError(
+                f"--workdir {workdir} n'est pas vide et n'a pas été créé par query_plans.py "
+                f"({WORKDIR_MARKER} absent) : choisissez un dossier vide ou inexistant"
+            )
+    workdir.mkdir(parents=True, exist_ok=True)
+    (workdir / WORKDIR_MARKER).write_text("query_plans.py\n", encoding="utf-8")
+    return workdir
+
+
+class LocalPostgres:
+    """Cluster Postgres temporaire, joignable uniquement par une socket Unix privée."""
+
+    def __init__(self, workdir: Path, bin_dir: Optional[Path] = None, port: int = DEFAULT_PORT):
+        self.workdir = workdir
+        self.data_dir = workdir / "data"
+        self.socket_dir = workdir / "socket"
+        self.log_file = workdir / "postgres.log"
+        self.port = port
+        self.initdb = find_binary("initdb", bin_dir)
+        self.pg_ctl = find_binary("pg_ctl", bin_dir)
+        self.psql_bin = find_binary("psql", bin_dir)
+        self.running = False
+
+    def _run(self, args: List[str], **kwargs) -> subprocess.CompletedProcess:
+        result = subprocess.run(args, capture_output=True, text=True, **kwargs)
+        if result.returncode != 0:
+            message = (result.stderr or result.stdout).strip().splitlines()
+            raise PostgresError(f"{Path(args[0]).name} : {message[-1] if message else 'échec'}")
+        return result
+
+    def start(self):
+        """Initialise et démarre le cluster (durabilité désactivée : base jetable)."""
+        if hasattr(os, "geteuid") and os.geteuid() == 0:
+            raise PostgresError("initdb refuse de s'exécuter en root : lancez le banc avec un autre utilisateur")
+        self.socket_dir.mkdir(parents=True, exist_ok=True)
+        self._run([self.initdb, "-D", str(self.data_dir), "-U", "postgres", "-A", "trust",
+                   "-E", "UTF8", "--no-locale"])
+        options = " ".join([
+            "-c listen_addresses=''", f"-k {self.socket_dir}", f"-p {self.port}",
+            "-c fsync=off", "-c synchronous_commit=off", "-c full_page_writes=off",
+        ])
+        self._run([self.pg_ctl, "-D", str(self.data_dir), "-l", str(self.log_file),
+                   "-o", options, "-w", "start"])
+        self.running = True
+
+    def stop(self):
+        if self.running:
+            subprocess.run([self.pg_ctl, "-D", str(self.data_dir), "-m", "immediate", "stop"],
+                           capture_output=True)
+            self.running = False
+
+    def psql(self, sql: Optional[str] = None, file: Optional[Path] = None,
+             single_transaction: bool = False, tuples: bool = False) -> str:
+        """Exécute du SQL (ou un fichier) et retourne la sortie ; lève PostgresError en cas d'erreur.
+
+        Le SQL passe par l'entrée standard (et non ``-c``) pour que la sortie
+        de chaque instruction soit affichée.
+        """
+        args = [self.psql_bin, "-X", "-q", "-v", "ON_ERROR_STOP=1",
+                "-h", str(self.socket_dir), "-p", str(self.port), "-U", "postgres", "-d", "postgres"]
+        if single_transaction:
+            args.append("-1")
+        if tuples:
+            args += ["-A", "-t"]
+        args += ["-f", str(file) if file else "-"]
+        return self._run(args, input=None if file else (sql or "")).stdout
+
+    def __enter__(self) -> "LocalPostgres":
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+
+def apply_migrations(db: LocalPostgres, migrations_dir: Path = MIGRATIONS_DIR) -> Dict[str, str]:
+    """Applique le socle Supabase puis les migrations, par ordre de nom : fichier -> ok / erreur."""
+    db.psql(SUPABASE_SHIM)
+    status = {}
+    for path in sorted(migrations_dir.glob("*.sql")):
+        try:
+            db.psql(file=path, single_transaction=True)
+            status[path.name] = "ok"
+        except PostgresError as e:
+            status[path.name] = str(e)
+    return status
+
+
+def list_indexes(db: LocalPostgres) -> List[str]:
+    """Index du schéma public (``table.index``), triés."""
+    output = db.psql(
+        "SELECT tablename || '.' || indexname FROM pg_indexes WHERE schemaname = 'public' ORDER BY 1",
+        tuples=True,
+    )
+    return [line for line in output.splitlines() if line]
+
+
+def _walk(node: Dict[str, Any], depth: int = 0):
+    yield depth, node
+    for child in node.get("Plans", []):
+        yield from _walk(child, depth + 1)
+
+
+def plan_shape(plan: Dict[str, Any]) -> List[str]:
+    """Forme d'un plan : une ligne par nœud (type, table, index), indentée par profondeur."""
+    shape = []
+    for depth, node in _walk(plan):
+        label = node["Node Type"]
+        if node.get("Relation Name"):
+            label += f" on {node['Relation Name']}"
+        if node.get("Index Name"):
+            label += f" using {node['Index Name']}"
+        shape.append("  " * depth + label)
+    return shape
+
+
+def summarize_plan(explained: Dict[str, Any]) -> Dict[str, Any]:
+    """Résumé d'une sortie ``EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON)``."""
+    plan = explained["Plan"]
+    nodes = [node for _, node in _walk(plan)]
+    return {
+        "planning_ms": explained.get("Planning Time", 0.0),
+        "execution_ms": explained.get("Execution Time", 0.0),
+        "buffers": {
+            "shared_hit": plan.get("Shared Hit Blocks", 0),
+            "shared_read": plan.get("Shared Read Blocks", 0),
+        },
+        "rows": plan.get("Actual Rows", 0),
+        "shape": plan_shape(plan),
+        "seq_scans": sorted({n["Relation Name"] for n in nodes if n["Node Type"] == "Seq Scan"}),
+        "indexes": sorted({n["Index Name"] for n in nodes if n.get("Index Name")}),
+    }
+
+
+def explain(db: LocalPostgres, query: HotQuery, repeat: int) -> Dict[str, Any]:
+    """Exécute ``query`` sous EXPLAIN ANALYZE (une passe de chauffe, puis ``repeat``)."""
+    sql = " ".join(query.sql.format(**QUERY_PARAMS).split())
+    statement = f"EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) {sql};"
+    output = db.psql(statement * (repeat + 1), tuples=True)
+
+    decoder = json.JSONDecoder()
+    runs, position = [], 0
+    while True:
+        while position < len(output) and output[position].isspace():
+            position += 1
+        if position >= len(output):
+            break
+        value, position = decoder.raw_decode(output, position)
+        runs.append(summarize_plan(value[0]))
+    runs = runs[1:] or runs  # la première passe remplit le cache
+
+    result = runs[-1]
+    result["execution_ms"] = statistics.median(run["execution_ms"] for run in runs)
+    result["planning_ms"] = statistics.median(run["planning_ms"] for run in runs)
+    result["source"] = query.source
+    result["sql"] = sql
+    return result
+
+
+def run_catalog(db: LocalPostgres, names: List[str], repeat: int) -> Dict[str, Dict[str, Any]]:
+    """Plans du catalogue ; une requête en erreur est rapportée avec son message."""
+    results = {}
+    for query in HOT_QUERIES:
+        if query.name not in names:
+            continue
+        try:
+            results[query.name] = explain(db, query, repeat)
+        except (PostgresError, ValueError, KeyError, IndexError) as e:
+            results[query.name] = {"source": query.source, "error": str(e)}
+    return results
+
+
+def compare_plans(current: Dict[str, Any], baseline: Dict[str, Any]) -> List[Dict[str, str]]:
+    """Régressions de ``current`` par rapport à ``baseline`` (résultats JSON complets)."""
+    regressions = []
+
+    def flag(query: str, kind: str, detail: str):
+        regressions.append({"query": query, "kind": kind, "detail": detail})
+
+    for index in sorted(set(baseline.get("indexes", [])) - set(current.get("indexes", []))):
+        flag("-", "index_dropped", f"{index} n'existe plus après les migrations")
+    for name, migration in current.get("migrations", {}).items():
+        if migration != "ok" and baseline.get("migrations", {}).get(name) == "ok":
+            flag("-", "migration_error", f"{name} : {migration}")
+
+    for name, after in current.get("queries", {}).items():
+        before = baseline.get("queries", {}).get(name)
+        if not before:
+            continue
+        if after.get("error"):
+            if not before.get("error"):
+                flag(name, "error", after["error"])
+            continue
+        if before.get("error"):
+            continue
+        for table in sorted(set(after["seq_scans"]) - set(before["seq_scans"])):
+            flag(name, "seq_scan", f"parcours séquentiel de {table}")
+        for index in sorted(set(before["indexes"]) - set(after["indexes"])):
+            flag(name, "index_lost", f"{index} n'est plus utilisé")
+        if after["shape"] != before["shape"]:
+            flag(name, "plan_changed", " / ".join(line.strip() for line in after["shape"]))
+        if (after["execution_ms"] >= before["execution_ms"] * SLOWER_RATIO
+                and after["execution_ms"] - before["execution_ms"] >= SLOWER_MIN_MS):
+            flag(name, "slower", f"{before['execution_ms']:.2f} -> {after['execution_ms']:.2f} ms")
+        blocks_before = sum(before["buffers"].values())
+        blocks_after = sum(after["buffers"].values())
+        if blocks_before and blocks_after >= blocks_before * BUFFERS_RATIO:
+            flag(name, "buffers", f"{blocks_before} -> {blocks_after} blocs")
+    return regressions
+
+
+def print_results(results: Dict[str, Any], regressions: Optional[List[Dict[str, str]]] = None):
+    """Tableau des requêtes, puis migrations en échec et régressions."""
+    header = f"{'Requête':<28} {'Exéc. (ms)':>10} {'Plan (ms)':>9} {'Blocs':>8}  Accès"
+    print(header)
+    print("-" * len(header))
+    for name, result in results["queries"].items():
+        if result.get("error"):
+            print(f"{name:<28} ❌ {result['error']}")
+            continue
+        blocks = sum(result["buffers"].values())
+        seq = [t for t in result["seq_scans"] if t in SEEDED_TABLES]
+        access = ", ".join(result["indexes"]) or "-"
+        if seq:
+            access = f"⚠️ Seq Scan {', '.join(seq)}" + (f" + {access}" if result["indexes"] else "")
+        print(f"{name:<28} {result['execution_ms']:>10.2f} {result['planning_ms']:>9.2f} {blocks:>8}  {access}")
+
+    failed = {name: status for name, status in results["migrations"].items() if status != "ok"}
+    if failed:
+        print("\n⚠️  Migrations en échec :")
+        for name, status in failed.items():
+            print(f"   {name} : {status}")
+
+    if regressions is not None:
+        if regressions:
+            print(f"\n❌ {len(regressions)} régression(s) :")
+            for item in regressions:
+                print(f"   [{item['kind']}] {item['query']} : {item['detail']}")
+        else:
+            print("\n✅ Aucune régression par rapport à la référence")
+
+
+def main():
+    """Point d'entrée principal."""
+    parser = argparse.ArgumentParser(description="Plans des requêtes critiques sur un Postgres local")
+    parser.add_argument("--scale", choices=list(SCALES), default="small")
+    for table in SCALES["small"]:
+        parser.add_argument(f"--{table}", type=int, default=None,
+                            help=f"Nombre de lignes de {table} (défaut : selon --scale)")
+    parser.add_argument("--only", nargs="+", choices=HOT_QUERY_NAMES, default=None,
+                        help="Requêtes à exécuter (toutes par défaut)")
+    parser.add_argument("--repeat", type=int, default=3, help="Exécutions par requête (temps médian)")
+    parser.add_argument("--pg-bin", type=str, default=None, help="Dossier des binaires Postgres")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT, help="Port de la socket Unix")
+    parser.add_argument("--workdir", type=str, default=None,
+                        help="Dossier du cluster (conservé, vide ou créé par cet outil) ; "
+                             "temporaire par défaut")
+    parser.add_argument("--output", type=str, default=None, help="Fichier JSON de résultats")
+    parser.add_argument("--compare", type=str, default=None, help="Résultats JSON de référence à comparer")
+    args = parser.parse_args()
+
+    sizes = resolve_sizes(args.scale, {table: getattr(args, table) for table in SCALES["small"]})
+    names = args.only or HOT_QUERY_NAMES
+
+    try:
+        with contextlib.ExitStack() as stack:
+            if args.workdir:
+                workdir = prepare_workdir(Path(args.workdir))
+            else:
+                workdir = Path(stack.enter_context(tempfile.TemporaryDirectory(prefix="campbnb-pg-")))
+            db = stack.enter_context(LocalPostgres(workdir, Path(args.pg_bin) if args.pg_bin else None, args.port))
+            version = db.psql("SHOW server_version", tuples=True).strip()
+            print(f"Postgres {version} : application des migrations...")
+            migrations = apply_migrations(db)
+            print(f"Données synthétiques '{args.scale}' : "
+                  + ", ".join(f"{count} {table}" for table, count in sizes.items()))
+            seed_file = workdir / "seed.sql"
+            seed_file.write_text(seed_sql(sizes), encoding="utf-8")
+            db.psql(file=seed_file)
+            indexes = list_indexes(db)
+            queries = run_catalog(db, names, max(args.repeat, 1))
+    except PostgresError as e:
+        print(f"❌ {e}")
+        return 2
+
+    results = {
+        "timestamp": datetime.now().isoformat(),
+        "postgres": version,
+        "scale": args.scale,
+        "sizes": sizes,
+        "migrations": migrations,
+        "indexes": indexes,
+        "queries": queries,
+    }
+
+    regressions = None
+    if args.compare:
+        with open(args.compare, 'r', encoding='utf-8') as f:
+            regressions = compare_plans(results, json.load(f))
+        results["regressions"] = regressions
+
+    print()
+    print_results(results, regressions)
+
+    output = Path(args.output) if args.output else (
+        DEFAULT_RESULTS_DIR / f"plans-{args.scale}-{datetime.now().strftime('%Y%m%d-%H%M%S')}.json"
+    )
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(results, indent=2, ensure_ascii=False), encoding="utf-8")
+    print(f"\nRésultats sauvegardés : {output}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
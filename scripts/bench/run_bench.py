@@ -0,0 +1,259 @@
+#!/usr/bin/env python3
+"""
+Benchmarks des outils de scripts/ sur des arborescences synthétiques.
+
+Chaque benchmark s'exécute dans un processus séparé pour que le pic de
+mémoire (RSS) mesuré lui soit propre. Le temps mesuré exclut la préparation
+(génération de l'arborescence, manifest de référence, etc.).
+
+Les résultats sont affichés (temps, débit, pic RSS) et enregistrés en JSON ;
+``--compare`` affiche l'écart avec un résultat précédent.
+
+Usage:
+    python scripts/bench/run_bench.py --scale small
+    python scripts/bench/run_bench.py --scale medium --workdir /tmp/bench-medium \\
+        --compare .cache/bench/medium-20250101-120000.json
+"""
+
+import io
+import os
+import sys
+import json
+import time
+import shutil
+import tempfile
+import argparse
+import contextlib
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+SCRIPTS_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(SCRIPTS_DIR))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from synthetic_tree import SCALES, generate_tree
+
+DEFAULT_RESULTS_DIR = Path(".cache") / "bench"
+
+# (résultat, temps réel, temps CPU)
+Timed = Tuple[int, float, float]
+
+
+def timed(func: Callable[[], int]) -> Timed:
+    """Exécute ``func`` et retourne (nombre d'éléments traités, wall, cpu)."""
+    wall = time.perf_counter()
+    cpu = time.process_time()
+    items = func()
+    return items, time.perf_counter() - wall, time.process_time() - cpu
+
+
+def peak_rss_mb() -> Optional[float]:
+    """Pic de mémoire résidente du processus courant, en Mo."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux : Ko, macOS : octets
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def bench_scan_stitch_screens(root: Path) -> Timed:
+    import sync_stitch_screens as sync
+    os.chdir(root)
+    return timed(lambda: len(sync.scan_stitch_screens()))
+
+
+def bench_scan_stitch_screens_incremental(root: Path) -> Timed:
+    import sync_stitch_screens as sync
+    os.chdir(root)
+    stat_cache = {}
+    previous = sync.scan_stitch_screens(stat_cache=stat_cache)
+    return timed(lambda: len(sync.scan_stitch_screens(previous, stat_cache=stat_cache)))
+
+
+def bench_compare_manifests(root: Path) -> Timed:
+    import sync_stitch_screens as sync
+    os.chdir(root)
+    old = sync.scan_stitch_screens()
+    new = {}
+    for i, (name, entry) in enumerate(sorted(old.items())):
+        # 10% modifiés, 5% supprimés, autant d'ajouts
+        if i % 20 == 1:
+            continue
+        entry = dict(entry)
+        if i % 10 == 0:
+            entry["code_hash"] = "0" * 64
+        new[name] = entry
+        if i % 20 == 2:
+            new[f"{name}_copy"] = dict(entry, name=f"{name}_copy")
+    return timed(lambda: (sync.compare_manifests(old, new), len(old))[1])
+
+
+def bench_project_index_build(root: Path) -> Timed:
+    from project_index import ProjectIndex
+    return timed(lambda: len(ProjectIndex.build(root).dirs))
+
+
+def bench_project_index_cached(root: Path) -> Timed:
+    from project_index import ProjectIndex
+    with tempfile.TemporaryDirectory() as tmp:
+        cache_file = Path(tmp) / "project_index.json"
+        ProjectIndex.build(root).save(cache_file)
+        return timed(lambda: len(ProjectIndex.load(root, cache_file).dirs))
+
+
+def bench_overseer_status_report(root: Path) -> Timed:
+    from overseer_status_check import OverseerStatusChecker
+    return timed(lambda: len(OverseerStatusChecker(root).generate_status_report().screens_coverage))
+
+
+def bench_stitch_check_coverage(root: Path) -> Timed:
+    from check_stitch_screens_coverage import StitchScreenChecker
+    return timed(lambda: len(StitchScreenChecker(root).check_coverage()))
+
+
+def bench_emoji_check_dart(root: Path) -> Timed:
+    from emoji_rewrite import process_files
+    from project_index import iter_files
+    from remove_emojis_dart import clean_dart_line
+    files = list(iter_files(root / "lib", ".dart"))
+    return timed(lambda: (process_files(files, clean_dart_line, mode="check"), len(files))[1])
+
+
+def bench_emoji_write_markdown(root: Path) -> Timed:
+    from emoji_rewrite import process_files
+    from project_index import iter_files
+    from remove_emojis import clean_markdown_line
+    with tempfile.TemporaryDirectory() as tmp:
+        # Copie : l'arborescence de référence ne doit pas être modifiée
+        docs = Path(tmp) / "docs"
+        shutil.copytree(root / "docs", docs)
+        files = list(iter_files(docs, ".md"))
+        return timed(lambda: (process_files(files, clean_markdown_line), len(files))[1])
+
+
+BENCHMARKS: Dict[str, Callable[[Path], Timed]] = {
+    "scan_stitch_screens": bench_scan_stitch_screens,
+    "scan_stitch_screens_incremental": bench_scan_stitch_screens_incremental,
+    "compare_manifests": bench_compare_manifests,
+    "project_index_build": bench_project_index_build,
+    "project_index_cached": bench_project_index_cached,
+    "overseer_status_report": bench_overseer_status_report,
+    "stitch_check_coverage": bench_stitch_check_coverage,
+    "emoji_check_dart": bench_emoji_check_dart,
+    "emoji_write_markdown": bench_emoji_write_markdown,
+}
+
+
+def _run_benchmark(name: str, root: Path) -> Dict:
+    """Exécute un benchmark (dans le processus enfant)."""
+    with contextlib.redirect_stdout(io.StringIO()):
+        items, wall, cpu = BENCHMARKS[name](root)
+    return {
+        "name": name,
+        "items": items,
+        "wall_s": round(wall, 6),
+        "cpu_s": round(cpu, 6),
+        "items_per_s": round(items / wall, 1) if wall > 0 else None,
+        "peak_rss_mb": round(peak_rss_mb(), 1) if resource is not None else None,
+    }
+
+
+def run_benchmarks(root: Path, names: List[str], repeat: int) -> List[Dict]:
+    """Exécute chaque benchmark ``repeat`` fois et garde le meilleur temps."""
+    results = []
+    for name in names:
+        best = None
+        for _ in range(repeat):
+            with ProcessPoolExecutor(max_workers=1) as executor:
+                result = executor.submit(_run_benchmark, name, root).result()
+            if best is None or result["wall_s"] < best["wall_s"]:
+                best = result
+        results.append(best)
+    return results
+
+
+def print_results(results: List[Dict], baseline: Optional[Dict[str, Dict]] = None):
+    """Affiche un tableau des résultats, avec l'écart au précédent si fourni."""
+    header = f"{'Benchmark':<34} {'Éléments':>9} {'Temps (s)':>10} {'Élém./s':>12} {'RSS (Mo)':>9}"
+    if baseline:
+        header += f" {'Écart':>8}"
+    print(header)
+    print("-" * len(header))
+    for result in results:
+        rss = f"{result['peak_rss_mb']:.1f}" if result["peak_rss_mb"] is not None else "-"
+        rate = f"{result['items_per_s']:.1f}" if result["items_per_s"] is not None else "-"
+        line = (f"{result['name']:<34} {result['items']:>9} {result['wall_s']:>10.4f} "
+                f"{rate:>12} {rss:>9}")
+        previous = (baseline or {}).get(result["name"])
+        if previous and previous.get("wall_s"):
+            delta = (result["wall_s"] - previous["wall_s"]) / previous["wall_s"] * 100
+            line += f" {delta:>+7.1f}%"
+        print(line)
+
+
+def main():
+    """Point d'entrée principal."""
+    parser = argparse.ArgumentParser(description="Benchmarks des outils de scripts/")
+    parser.add_argument("--scale", choices=sorted(SCALES), default="small")
+    parser.add_argument(
+        "--workdir",
+        type=str,
+        default=None,
+        help="Dossier de l'arborescence synthétique (réutilisée si déjà générée) ; "
+             "temporaire par défaut"
+    )
+    parser.add_argument(
+        "--only",
+        nargs="+",
+        choices=sorted(BENCHMARKS),
+        default=None,
+        help="Benchmarks à exécuter (tous par défaut)"
+    )
+    parser.add_argument("--repeat", type=int, default=1, help="Nombre d'exécutions (meilleur temps retenu)")
+    parser.add_argument("--output", type=str, default=None, help="Fichier JSON de résultats")
+    parser.add_argument("--compare", type=str, default=None, help="Résultats JSON précédents à comparer")
+    args = parser.parse_args()
+
+    names = args.only or list(BENCHMARKS)
+
+    with contextlib.ExitStack() as stack:
+        if args.workdir:
+            root = Path(args.workdir).resolve()
+        else:
+            root = Path(stack.enter_context(tempfile.TemporaryDirectory(prefix="campbnb-bench-")))
+        print(f"Préparation de l'arborescence '{args.scale}' dans {root}...")
+        params = generate_tree(root, args.scale)
+        results = run_benchmarks(root, names, max(args.repeat, 1))
+
+    baseline = None
+    if args.compare:
+        with open(args.compare, 'r', encoding='utf-8') as f:
+            baseline = {r["name"]: r for r in json.load(f)["results"]}
+
+    print()
+    print_results(results, baseline)
+
+    output = Path(args.output) if args.output else (
+        DEFAULT_RESULTS_DIR / f"{args.scale}-{datetime.now().strftime('%Y%m%d-%H%M%S')}.json"
+    )
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps({
+        "timestamp": datetime.now().isoformat(),
+        "python": sys.version.split()[0],
+        "platform": sys.platform,
+        "cpu_count": os.cpu_count(),
+        "tree": params,
+        "results": results,
+    }, indent=2, ensure_ascii=False), encoding="utf-8")
+    print(f"\nRésultats sauvegardés : {output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""
+Données synthétiques pour les plans de requêtes (voir query_plans.py).
+
+Génère le SQL qui remplit ``auth.users``, ``profiles``, ``listings``,
+``reservations`` et ``reviews`` à une échelle donnée. Les lignes sont
+produites côté serveur (``generate_series``) : rien ne transite par Python,
+et la graine fixe (``setseed``) rend deux générations identiques.
+
+Les identifiants sont déterministes (``md5('listing-42')::uuid``) pour que
+le catalogue de requêtes puisse viser une annonce, un hôte ou un voyageur
+précis. Les profils dont le numéro est un multiple de ``HOST_EVERY`` sont
+des hôtes.
+
+Usage:
+    python scripts/bench/synthetic_db.py --scale small > /tmp/seed.sql
+    python scripts/bench/synthetic_db.py --scale medium --reservations 500000
+"""
+
+import argparse
+from typing import Dict, Optional
+
+SCALES: Dict[str, Dict[str, int]] = {
+    "small": {"profiles": 2_000, "listings": 5_000, "reservations": 20_000, "reviews": 8_000},
+    "medium": {"profiles": 20_000, "listings": 50_000, "reservations": 200_000, "reviews": 80_000},
+    "large": {"profiles": 200_000, "listings": 500_000, "reservations": 2_000_000, "reviews": 800_000},
+}
+SEED = 0.42
+HOST_EVERY = 5
+
+# Villes pondérées par leur position (les premières sont les plus fréquentes)
+CITIES = [
+    "Québec", "Montréal", "Tremblant", "Gatineau", "Sherbrooke", "Saguenay",
+    "Trois-Rivières", "Tadoussac", "Baie-Saint-Paul", "Percé", "Rimouski", "Magog",
+]
+TITLE_KINDS = ["Chalet", "Yourte", "Camping", "Refuge", "Cabane", "Prêt-à-camper"]
+TITLE_WORDS = ["du lac", "en forêt", "au bord de la rivière", "avec vue", "des Laurentides", "rustique"]
+AMENITIES = ["wifi", "foyer", "spa", "bbq", "kayak", "electricite", "eau_courante", "animaux"]
+
+
+def entity_id(kind: str, number: int) -> str:
+    """Identifiant (UUID) déterministe d'une ligne synthétique, en littéral SQL."""
+    return f"md5('{kind}-{number}')::uuid"
+
+
+def _array(values) -> str:
+    return "ARRAY[" + ", ".join("'" + v.replace("'", "''") + "'" for v in values) + "]"
+
+
+def _pick(values, weight: str = "random()") -> str:
+    """Élément d'un tableau SQL choisi par ``weight`` (valeur dans [0, 1))."""
+    return f"({_array(values)})[1 + floor({weight} * {len(values)})::int]"
+
+
+def resolve_sizes(scale: str, overrides: Optional[Dict[str, Optional[int]]] = None) -> Dict[str, int]:
+    """Tailles de l'échelle ``scale``, avec les valeurs de ``overrides`` qui ne sont pas None."""
+    sizes = dict(SCALES[scale])
+    sizes.update({key: value for key, value in (overrides or {}).items() if value is not None})
+    sizes["profiles"] = max(sizes["profiles"], HOST_EVERY)
+    sizes["reviews"] = min(sizes["reviews"], sizes["reservations"])
+    return sizes
+
+
+def seed_sql(sizes: Dict[str, int], seed: float = SEED) -> str:
+    """SQL de remplissage (triggers et contraintes de clé étrangère désactivés)."""
+    profiles, listings = sizes["profiles"], sizes["listings"]
+    hosts = profiles // HOST_EVERY
+    host_of = f"md5('profile-' || ({HOST_EVERY} * (1 + (k % {hosts}))))::uuid"
+    return f"""
+SET session_replication_role = replica;
+SELECT setseed({seed});
+
+INSERT INTO auth.users (id, email)
+SELECT md5('profile-' || i)::uuid, 'user' || i || '@example.com'
+FROM generate_series(1, {profiles}) AS i;
+
+INSERT INTO public.profiles (id, email, first_name, last_name, is_host, city, province, created_at)
+SELECT md5('profile-' || i)::uuid, 'user' || i || '@example.com', 'Prenom' || i, 'Nom' || i,
+       i % {HOST_EVERY} = 0, {_pick(CITIES)}, 'QC', now() - (i % 1000) * interval '1 day'
+FROM generate_series(1, {profiles}) AS i;
+
+INSERT INTO public.listings (
+    id, host_id, title, description, property_type, latitude, longitude,
+    address_line1, city, province, postal_code, max_guests, amenities,
+    base_price_per_night, is_available, status, average_rating, created_at
+)
+SELECT md5('listing-' || k)::uuid, {host_of},
+       {_pick(TITLE_KINDS)} || ' ' || {_pick(TITLE_WORDS)} || ' ' || x.city,
+       'Séjour ' || {_pick(TITLE_WORDS)} || ' près de ' || x.city || ', idéal pour se ressourcer au ' ||
+           {_pick(["lac", "mont", "parc national", "fjord", "village"])},
+       {_pick(["tent", "rv", "cabin", "yurt", "treehouse", "other"])},
+       45 + random() * 5, -79 + random() * 15,
+       k || ' rue Principale', x.city,
+       CASE WHEN random() < 0.9 THEN 'QC' ELSE 'ON' END, 'G1A 1A1',
+       1 + floor(random() * 12)::int,
+       to_jsonb(ARRAY(SELECT a FROM unnest({_array(AMENITIES)}) AS a WHERE random() < 0.3 + 0 * k)),
+       30 + round((random() * 370)::numeric, 2),
+       random() < 0.85,
+       CASE WHEN x.r < 0.7 THEN 'active' WHEN x.r < 0.8 THEN 'draft'
+            WHEN x.r < 0.9 THEN 'pending' ELSE 'suspended' END,
+       round((3 + random() * 2)::numeric, 2),
+       now() - random() * interval '730 days'
+FROM generate_series(1, {listings}) AS k,
+     LATERAL (SELECT random() + 0 * k AS r, {_pick(CITIES, "power(random() + 0 * k, 2)")} AS city) AS x;
+
+INSERT INTO public.reservations (
+    id, listing_id, guest_id, host_id, check_in_date, check_out_date,
+    number_of_guests, number_of_adults, base_price, service_fee, total_price,
+    status, requested_at, created_at
+)
+SELECT md5('reservation-' || i)::uuid, md5('listing-' || x.k)::uuid,
+       md5('profile-' || (1 + floor(random() * {profiles})::int))::uuid,
+       md5('profile-' || ({HOST_EVERY} * (1 + (x.k % {hosts}))))::uuid,
+       x.check_in, x.check_in + x.nights,
+       x.guests, x.guests, x.nights * 100, x.nights * 10, x.nights * 110,
+       CASE WHEN x.r < 0.1 THEN 'pending' WHEN x.r < 0.5 THEN 'confirmed'
+            WHEN x.r < 0.85 THEN 'completed' WHEN x.r < 0.95 THEN 'cancelled' ELSE 'rejected' END,
+       x.check_in - (1 + floor(random() * 60)::int) * interval '1 day',
+       x.check_in - (1 + floor(random() * 60)::int) * interval '1 day'
+FROM generate_series(1, {sizes["reservations"]}) AS i,
+     LATERAL (
+         SELECT 1 + floor(random() * {listings})::int + 0 * i AS k,
+                current_date - 365 + floor(random() * 730)::int AS check_in,
+                1 + floor(random() * 14)::int AS nights,
+                1 + floor(random() * 6)::int AS guests,
+                random() AS r
+     ) AS x;
+
+INSERT INTO public.reviews (
+    id, reservation_id, listing_id, reviewer_id, reviewee_id, review_type,
+    rating_overall, comment, is_public, created_at
+)
+SELECT md5('review-' || r.n)::uuid, r.id, r.listing_id, r.guest_id, r.host_id, 'guest',
+       least(5, 2 + floor(random() * 4)::int),
+       'Très beau séjour ' || {_pick(TITLE_WORDS)},
+       random() < 0.95,
+       r.check_out_date + (floor(random() * 20)::int) * interval '1 day'
+FROM (
+    SELECT res.*, row_number() OVER (ORDER BY res.id) AS n
+    FROM public.reservations AS res
+    ORDER BY res.id
+    LIMIT {sizes["reviews"]}
+) AS r;
+
+SET session_replication_role = DEFAULT;
+VACUUM ANALYZE;
+"""
+
+
+def main():
+    """Point d'entrée principal."""
+    parser = argparse.ArgumentParser(description="SQL de données synthétiques pour les plans de requêtes")
+    parser.add_argument("--scale", choices=list(SCALES), default="small")
+    for table in SCALES["small"]:
+        parser.add_argument(f"--{table}", type=int, default=None, help=f"Nombre de lignes de {table}")
+    args = parser.parse_args()
+    print(seed_sql(resolve_sizes(args.scale, {table: getattr(args, table) for table in SCALES["small"]})))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+"""
+Générateur d'arborescences synthétiques pour les benchmarks de scripts/.
+
+L'arborescence imite la structure du projet :
+- lib/features/<feature>/{presentation/screens,data/services,widgets}/*.dart
+- test/**/*_test.dart
+- docs/*.md (avec emojis)
+- stitch_reservation_process_screen/<screen>/{code.html,screen.png}
+
+Le contenu est déterministe (graine fixe) pour que deux générations d'une
+même échelle donnent des fichiers identiques.
+
+Usage:
+    python scripts/bench/synthetic_tree.py --scale small --output /tmp/bench-tree
+"""
+
+import json
+import random
+import argparse
+from pathlib import Path
+from typing import Dict
+
+SCALES: Dict[str, Dict[str, int]] = {
+    "small": {"dart_files": 1_000, "stitch_screens": 100},
+    "medium": {"dart_files": 10_000, "stitch_screens": 1_000},
+    "large": {"dart_files": 100_000, "stitch_screens": 10_000},
+}
+
+# Tailles moyennes observées dans stitch_reservation_process_screen/
+CODE_HTML_SIZE = 8 * 1024
+SCREEN_PNG_SIZE = 330 * 1024
+
+DART_FILES_PER_FEATURE = 50
+MARKER_FILE = ".bench_tree.json"
+
+PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+
+HTML_BOILERPLATE = """<!DOCTYPE html>
+<html class="light" lang="fr"><head>
+<meta charset="utf-8"/>
+<script src="https://cdn.tailwindcss.com?plugins=forms,container-queries"></script>
+<title>{title}</title>
+</head>
+<body class="bg-background-light dark:bg-background-dark font-display">
+"""
+
+HTML_BLOCK = (
+    '<div class="flex items-center gap-4 px-4 min-h-14 justify-between">'
+    '<p class="text-[#111418] text-base font-normal leading-normal flex-1 truncate">{text}</p>'
+    '</div>\n'
+)
+
+DART_SCREEN = """import 'package:flutter/material.dart';
+
+class {cls} extends StatelessWidget {{
+  const {cls}({{super.key}});
+
+  @override
+  Widget build(BuildContext context) {{
+    return Scaffold(
+      appBar: AppBar(title: const Text('{title}')),
+      body: ListView(
+        children: [
+          Image.network('https://example.com/{name}.png'),
+          const Text('{label}'),
+        ],
+      ),
+    );
+  }}
+}}
+"""
+
+DART_TEST = """import 'package:flutter_test/flutter_test.dart';
+
+void main() {{
+  test('{name}', () {{
+    expect(1 + 1, 2);
+  }});
+}}
+"""
+
+
+def _camel(name: str) -> str:
+    return "".join(part.capitalize() for part in name.split("_"))
+
+
+def _write_dart_files(root: Path, count: int):
+    features = max(1, count // DART_FILES_PER_FEATURE)
+    layouts = ("presentation/screens", "data/services", "presentation/widgets")
+    for i in range(count):
+        feature = f"feature_{i % features:04d}"
+        layout = layouts[i % len(layouts)]
+        suffix = "_screen" if layout == "presentation/screens" else ""
+        name = f"item_{i:06d}{suffix}"
+        directory = root / "lib" / "features" / feature / layout
+        directory.mkdir(parents=True, exist_ok=True)
+        # Un fichier sur 20 contient un emoji dans une string
+        label = f"Statut {i} ✅" if i % 20 == 0 else f"Statut {i}"
+        (directory / f"{name}.dart").write_text(
+            DART_SCREEN.format(cls=_camel(name), title=name, name=name, label=label),
+            encoding="utf-8",
+        )
+    for i in range(count // 10):
+        directory = root / "test" / "features" / f"feature_{i % features:04d}"
+        directory.mkdir(parents=True, exist_ok=True)
+        (directory / f"item_{i:06d}_test.dart").write_text(
+            DART_TEST.format(name=f"item_{i:06d}"), encoding="utf-8"
+        )
+
+
+def _write_docs(root: Path, count: int):
+    docs = root / "docs"
+    docs.mkdir(parents=True, exist_ok=True)
+    for i in range(count):
+        lines = [f"# 📊 Document {i}", ""]
+        lines.extend(f"- ✅ Élément {j} : description de l'élément" for j in range(40))
+        (docs / f"doc_{i:05d}.md").write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+
+def _write_stitch_screens(root: Path, count: int, rng: random.Random,
+                          code_size: int, png_size: int):
+    stitch = root / "stitch_reservation_process_screen"
+    for i in range(count):
+        name = f"screen_{i:05d}_details"
+        directory = stitch / name
+        directory.mkdir(parents=True, exist_ok=True)
+        html = [HTML_BOILERPLATE.format(title=name)]
+        size = len(html[0])
+        while size < code_size:
+            block = HTML_BLOCK.format(text=f"{name} ligne {size}")
+            html.append(block)
+            size += len(block)
+        html.append("</body></html>\n")
+        (directory / "code.html").write_text("".join(html), encoding="utf-8")
+        (directory / "screen.png").write_bytes(
+            PNG_SIGNATURE + rng.randbytes(max(png_size - len(PNG_SIGNATURE), 0))
+        )
+
+
+def generate_tree(root: Path, scale: str, code_size: int = CODE_HTML_SIZE,
+                  png_size: int = SCREEN_PNG_SIZE) -> Dict[str, int]:
+    """Génère (ou réutilise) une arborescence synthétique et retourne ses paramètres."""
+    params = dict(SCALES[scale], scale=scale, code_size=code_size, png_size=png_size)
+    marker = root / MARKER_FILE
+    if marker.exists():
+        try:
+            if json.loads(marker.read_text(encoding="utf-8")) == params:
+                return params
+        except ValueError:
+            pass
+        raise FileExistsError(f"{root} contient déjà une autre arborescence de benchmark")
+    if root.exists() and any(root.iterdir()):
+        raise FileExistsError(f"{root} n'est pas vide")
+
+    rng = random.Random(42)
+    root.mkdir(parents=True, exist_ok=True)
+    _write_dart_files(root, params["dart_files"])
+    _write_docs(root, max(1, params["dart_files"] // 10))
+    _write_stitch_screens(root, params["stitch_screens"], rng, code_size, png_size)
+    (root / "README.md").write_text("# 🏕️ Projet synthétique\n", encoding="utf-8")
+    marker.write_text(json.dumps(params), encoding="utf-8")
+    return params
+
+
+def main():
+    """Point d'entrée principal."""
+    parser = argparse.ArgumentParser(description="Génère une arborescence de benchmark")
+    parser.add_argument("--scale", choices=sorted(SCALES), default="small")
+    parser.add_argument("--output", type=str, required=True, help="Dossier de destination")
+    args = parser.parse_args()
+
+    params = generate_tree(Path(args.output), args.scale)
+    print(f"Arborescence '{args.scale}' prête dans {args.output} : "
+          f"{params['dart_files']} fichiers Dart, {params['stitch_screens']} screens Stitch")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+"""
+Mémoïsation des vérifications de l'Overseer par empreinte de leurs entrées.
+
+L'empreinte d'une vérification couvre :
+- l'ensemble des fichiers sous chacune de ses entrées déclarées (``Check.inputs``),
+  avec leur taille et leur mtime (ns) ;
+- le fichier source de la fonction de vérification et ceux des modules qui
+  font le travail (``Check.sources``), avec les modules de ``scripts/``
+  qu'ils importent : une modification du code invalide le résultat.
+
+Le résultat d'une vérification réussie est conservé dans
+``.cache/overseer_checks.json`` avec son empreinte ; tant que l'empreinte ne
+change pas, il est repris sans réexécuter la vérification.
+"""
+
+import os
+import sys
+import json
+import hashlib
+import inspect
+import threading
+from dataclasses import asdict, is_dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+MEMO_FILE = Path(".cache") / "overseer_checks.json"
+MEMO_VERSION = 1
+# Seuls les modules de ce dossier (scripts/) comptent dans l'empreinte du code
+LOCAL_SOURCE_DIR = Path(__file__).resolve().parent
+
+
+def to_jsonable(value: Any) -> Any:
+    """Convertit un résultat (dataclasses, listes, dicts) en valeur JSON."""
+    if is_dataclass(value) and not isinstance(value, type):
+        return asdict(value)
+    if isinstance(value, (list, tuple)):
+        return [to_jsonable(item) for item in value]
+    if isinstance(value, dict):
+        return {str(key): to_jsonable(item) for key, item in value.items()}
+    return value
+
+
+def _stat_line(path: Path, label: str) -> str:
+    try:
+        st = os.stat(path)
+    except OSError:
+        return f"{label}\0absent\n"
+    return f"{label}\0{st.st_size}\0{st.st_mtime_ns}\n"
+
+
+def _local_source(module) -> Optional[Path]:
+    """Fichier source de ``module`` s'il se trouve sous ``LOCAL_SOURCE_DIR``."""
+    source = getattr(module, "__file__", None)
+    if not source:
+        return None
+    path = Path(source).resolve()
+    try:
+        path.relative_to(LOCAL_SOURCE_DIR)
+    except ValueError:
+        return None
+    return path
+
+
+def source_files(objects: Iterable[Any]) -> List[Path]:
+    """Fichiers source des modules de ``objects`` et des modules locaux qu'ils utilisent.
+
+    Les dépendances sont suivies par les noms globaux de chaque module
+    (modules importés, fonctions et classes importées), seulement sous
+    ``LOCAL_SOURCE_DIR`` : la bibliothèque standard n'est jamais parcourue.
+    """
+    found: Dict[str, Path] = {}
+    stack = [inspect.getmodule(obj) for obj in objects]
+    while stack:
+        module = stack.pop()
+        if module is None or module.__name__ in found:
+            continue
+        path = _local_source(module)
+        if path is None:
+            continue
+        found[module.__name__] = path
+        for value in list(vars(module).values()):
+            if inspect.ismodule(value):
+                stack.append(value)
+            elif inspect.isfunction(value) or inspect.isclass(value):
+                stack.append(sys.modules.get(value.__module__))
+    return sorted(set(found.values()))
+
+
+def fingerprint_inputs(index, inputs: Iterable[str], func=None, sources: Iterable[Any] = ()) -> str:
+    """Empreinte SHA-256 des fichiers sous ``inputs`` (chemins relatifs de l'index).
+
+    ``func`` (son fichier source) et ``sources`` (voir ``source_files``)
+    ajoutent le code de la vérification à l'empreinte.
+    """
+    digest = hashlib.sha256()
+    for rel_path in sorted(set(inputs)):
+        rel_path = rel_path.strip("/")
+        if index.is_dir(rel_path):
+            digest.update(f"dir\0{rel_path}\n".encode("utf-8", "surrogateescape"))
+            for file_path in index.files_under(rel_path):
+                digest.update(_stat_line(index.path(file_path), file_path)
+                              .encode("utf-8", "surrogateescape"))
+        else:
+            digest.update(_stat_line(index.path(rel_path), rel_path)
+                          .encode("utf-8", "surrogateescape"))
+    if func is not None:
+        try:
+            source = inspect.getsourcefile(func)
+        except TypeError:
+            source = None
+        if source:
+            digest.update(_stat_line(Path(source), f"source:{Path(source).name}")
+                          .encode("utf-8", "surrogateescape"))
+    for path in source_files(sources):
+        label = path.relative_to(LOCAL_SOURCE_DIR).as_posix()
+        digest.update(_stat_line(path, f"source:{label}").encode("utf-8", "surrogateescape"))
+    return digest.hexdigest()
+
+
+class CheckMemo:
+    """Résultats de vérifications indexés par nom et empreinte."""
+
+    def __init__(self, memo_file: Path, entries: Optional[Dict[str, Dict]] = None):
+        self.memo_file = memo_file
+        self.entries: Dict[str, Dict] = entries or {}
+        self.stats: Dict[str, int] = {"hits": 0, "misses": 0}
+        self._lock = threading.Lock()
+        self._dirty = False
+
+    @classmethod
+    def load(cls, memo_file: Path) -> "CheckMemo":
+        """Charge le cache (vide s'il est absent, illisible ou d'une autre version)."""
+        entries = {}
+        try:
+            with open(memo_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get("version") == MEMO_VERSION:
+                entries = data.get("checks", {})
+        except (OSError, ValueError):
+            entries = {}
+        return cls(memo_file, entries)
+
+    def lookup(self, name: str, fingerprint: str) -> Tuple[bool, Any]:
+        """(True, valeur JSON) si le résultat de ``name`` est connu pour cette empreinte."""
+        with self._lock:
+            entry = self.entries.get(name)
+            if entry is not None and entry.get("fingerprint") == fingerprint:
+                self.stats["hits"] += 1
+                return True, entry.get("value")
+            self.stats["misses"] += 1
+            return False, None
+
+    def store(self, name: str, fingerprint: str, value: Any):
+        """Enregistre le résultat de ``name`` pour cette empreinte."""
+        with self._lock:
+            self.entries[name] = {"fingerprint": fingerprint, "value": to_jsonable(value)}
+            self._dirty = True
+
+    def save(self):
+        """Écrit le cache s'il a changé (écriture atomique)."""
+        if not self._dirty:
+            return
+        self.memo_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = self.memo_file.with_suffix(self.memo_file.suffix + ".tmp")
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            json.dump({"version": MEMO_VERSION, "checks": self.entries}, f,
+                      ensure_ascii=False, separators=(",", ":"))
+        os.replace(tmp_file, self.memo_file)
+        self._dirty = False
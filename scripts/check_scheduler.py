@@ -0,0 +1,207 @@
+#!/usr/bin/env python3
+"""
+Ordonnanceur de vérifications concurrentes.
+
+Chaque vérification est un plugin ``Check`` : une fonction sans argument,
+ses entrées déclarées (chemins relatifs au projet qu'elle lit), les
+vérifications dont elle dépend, un délai maximal et une valeur de repli.
+
+``CheckScheduler.run()`` lance en parallèle (``jobs`` threads au plus) les
+vérifications dont les dépendances sont terminées. Politique d'échec
+partiel : une vérification qui lève une exception ou dépasse son délai
+produit une entrée « error » / « timeout » avec sa valeur de repli, sans
+bloquer les autres ni le rapport. Les threads sont des démons : une
+vérification bloquée n'empêche pas le processus de se terminer.
+
+Avec un ``CheckMemo`` (voir check_memo.py), une vérification dont les
+entrées n'ont pas changé reprend son résultat précédent sans s'exécuter.
+
+Usage:
+    scheduler = CheckScheduler(jobs=4, timeout=60)
+    scheduler.register(Check("check_tests", checker.check_tests, inputs=("lib", "test"), default=0.0))
+    outcomes = scheduler.run()
+    outcomes["check_tests"].value
+"""
+
+import os
+import queue
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+DEFAULT_CHECK_JOBS = min(8, os.cpu_count() or 1)
+DEFAULT_CHECK_TIMEOUT = 120.0
+# Attente maximale entre deux contrôles d'échéance (permet timeout=math.inf)
+MAX_WAIT = 60.0
+
+
+@dataclass
+class Check:
+    """Vérification enregistrée auprès du ``CheckScheduler``."""
+    name: str
+    func: Callable[[], Any]
+    inputs: Tuple[str, ...] = ()
+    sources: Tuple[Any, ...] = ()  # fonctions/modules qui calculent le résultat (empreinte du code)
+    depends_on: Tuple[str, ...] = ()
+    timeout: Optional[float] = None  # None = délai par défaut de l'ordonnanceur
+    default: Any = None  # valeur utilisée si la vérification échoue
+    decode: Optional[Callable[[Any], Any]] = None  # valeur JSON mémoïsée -> résultat
+
+
+@dataclass
+class CheckOutcome:
+    """Résultat d'une vérification."""
+    name: str
+    status: str  # ok, error, timeout, skipped
+    value: Any = None
+    error: str = ""
+    wall_ms: float = 0.0
+    cached: bool = False
+    fingerprint: str = ""
+
+    def summary(self) -> Dict[str, Any]:
+        """Forme sérialisable, sans la valeur (rapportée ailleurs)."""
+        data = {"status": self.status, "wall_ms": round(self.wall_ms, 3), "cached": self.cached}
+        if self.fingerprint:
+            data["fingerprint"] = self.fingerprint
+        if self.error:
+            data["error"] = self.error
+        return data
+
+
+class CheckScheduler:
+    """Exécute les vérifications enregistrées, en parallèle quand c'est possible."""
+
+    def __init__(self, jobs: int = DEFAULT_CHECK_JOBS,
+                 timeout: float = DEFAULT_CHECK_TIMEOUT, timer=None,
+                 memo=None, fingerprint: Optional[Callable[[Check], str]] = None):
+        self.jobs = max(jobs, 1)
+        self.timeout = timeout
+        self.timer = timer
+        self.memo = memo
+        self.fingerprint = fingerprint
+        self.checks: Dict[str, Check] = {}
+
+    def register(self, check: Check) -> Check:
+        """Ajoute une vérification (son nom doit être unique)."""
+        if check.name in self.checks:
+            raise ValueError(f"Vérification déjà enregistrée : {check.name}")
+        self.checks[check.name] = check
+        return check
+
+    def _order(self) -> List[str]:
+        """Ordre topologique stable (ordre d'enregistrement à dépendances égales)."""
+        order: List[str] = []
+        state: Dict[str, str] = {}
+
+        def visit(name: str, path: Tuple[str, ...]):
+            if state.get(name) == "done":
+                return
+            if state.get(name) == "visiting":
+                raise ValueError(f"Dépendance circulaire : {' -> '.join(path + (name,))}")
+            if name not in self.checks:
+                raise ValueError(f"Dépendance inconnue : {name} (requise par {path[-1]})")
+            state[name] = "visiting"
+            for dependency in self.checks[name].depends_on:
+                visit(dependency, path + (name,))
+            state[name] = "done"
+            order.append(name)
+
+        for name in self.checks:
+            visit(name, ())
+        return order
+
+    def _evaluate(self, check: Check) -> CheckOutcome:
+        """Résultat mémoïsé si les entrées sont inchangées, sinon exécution."""
+        fingerprint = ""
+        if self.memo is not None and self.fingerprint is not None and check.inputs:
+            fingerprint = self.fingerprint(check)
+            hit, value = self.memo.lookup(check.name, fingerprint)
+            if hit:
+                value = check.decode(value) if check.decode else value
+                return CheckOutcome(check.name, "ok", value, cached=True, fingerprint=fingerprint)
+        value = check.func()
+        if fingerprint:
+            self.memo.store(check.name, fingerprint, value)
+        return CheckOutcome(check.name, "ok", value, fingerprint=fingerprint)
+
+    def _execute(self, check: Check, done: "queue.Queue[CheckOutcome]"):
+        """Exécute ``check`` dans un thread de travail et publie son résultat."""
+        start = time.perf_counter()
+        try:
+            if self.timer is not None:
+                with self.timer.phase(check.name):
+                    outcome = self._evaluate(check)
+            else:
+                outcome = self._evaluate(check)
+        except Exception as e:
+            outcome = CheckOutcome(
+                check.name, "error", check.default,
+                error=f"{type(e).__name__}: {e}",
+            )
+        outcome.wall_ms = (time.perf_counter() - start) * 1000
+        done.put(outcome)
+
+    def run(self) -> Dict[str, CheckOutcome]:
+        """Exécute toutes les vérifications et retourne leurs résultats, par nom."""
+        order = self._order()
+        outcomes: Dict[str, CheckOutcome] = {}
+        done: "queue.Queue[CheckOutcome]" = queue.Queue()
+        running: Dict[str, Tuple[float, float]] = {}  # nom -> (début, échéance)
+        pending = list(order)
+
+        while pending or running:
+            # Démarrer les vérifications prêtes, dans la limite de ``jobs``
+            for name in list(pending):
+                if len(running) >= self.jobs:
+                    break
+                check = self.checks[name]
+                dependencies = [outcomes.get(dep) for dep in check.depends_on]
+                if any(dep is None for dep in dependencies):
+                    continue
+                pending.remove(name)
+                failed = [dep.name for dep in dependencies if dep.status != "ok"]
+                if failed:
+                    outcomes[name] = CheckOutcome(
+                        name, "skipped", check.default,
+                        error=f"dépendance en échec : {', '.join(failed)}",
+                    )
+                    continue
+                timeout = check.timeout if check.timeout is not None else self.timeout
+                now = time.perf_counter()
+                running[name] = (now, now + timeout)
+                threading.Thread(
+                    target=self._execute, args=(check, done),
+                    name=f"check-{name}", daemon=True,
+                ).start()
+
+            if not running:
+                continue
+
+            # Attendre le prochain résultat ou la prochaine échéance
+            next_deadline = min(deadline for _, deadline in running.values())
+            wait = min(max(next_deadline - time.perf_counter(), 0), MAX_WAIT)
+            try:
+                outcome = done.get(timeout=wait)
+            except queue.Empty:
+                outcome = None
+            if outcome is not None:
+                if outcome.name in running:
+                    running.pop(outcome.name)
+                    outcomes[outcome.name] = outcome
+                continue
+
+            now = time.perf_counter()
+            for name, (start, deadline) in list(running.items()):
+                if now >= deadline:
+                    # Le thread continue en arrière-plan ; son résultat sera ignoré
+                    running.pop(name)
+                    check = self.checks[name]
+                    outcomes[name] = CheckOutcome(
+                        name, "timeout", check.default,
+                        error=f"délai dépassé ({deadline - start:.1f} s)",
+                        wall_ms=(now - start) * 1000,
+                    )
+
+        return {name: outcomes[name] for name in order}
@@ -11,11 +11,16 @@ Usage:
 
 import os
 import re
+import sys
 from pathlib import Path
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Set, Tuple
 from dataclasses import dataclass
 from datetime import datetime
 
+sys.path.insert(0, str(Path(__file__).parent))
+
+from project_index import ProjectIndex
+
 @dataclass
 class ScreenStatus:
     """Statut d'un screen Stitch."""
@@ -24,68 +29,140 @@ class ScreenStatus:
     flutter_file: str = ""
     status: str = "missing"  # implemented, partial, missing
     notes: str = ""
+    score: float = 0.0
+
+def normalize_name(name: str) -> str:
+    """Normalise un nom de screen pour la correspondance."""
+    # Enlever underscores, espaces, caractères spéciaux
+    return re.sub(r'[^a-z0-9]', '', name.lower())
+
+
+class ScreenNameMatcher:
+    """Index n-grammes des noms de screens Flutter normalisés.
+
+    Chaque nom est normalisé une seule fois. Les trigrammes de chaque nom
+    alimentent un index inversé, ce qui limite les comparaisons aux candidats
+    partageant tous les trigrammes requis au lieu de tester chaque paire.
+    Les correspondances sont classées par score (longueur du nom contenu /
+    longueur du nom contenant, 1.0 = identique), puis par chemin pour que le
+    résultat soit déterministe.
+    """
+    
+    N = 3
+    
+    def __init__(self, flutter_screens: Dict[str, str]):
+        self.entries: List[Tuple[str, str]] = sorted(
+            (normalize_name(name), path) for name, path in flutter_screens.items()
+        )
+        self.postings: Dict[str, Set[int]] = {}
+        self.gram_counts: List[int] = []
+        self.short_ids: List[int] = []
+        for entry_id, (normalized, _) in enumerate(self.entries):
+            grams = self._grams(normalized)
+            self.gram_counts.append(len(grams))
+            if not grams:
+                self.short_ids.append(entry_id)
+            for gram in grams:
+                self.postings.setdefault(gram, set()).add(entry_id)
+    
+    @classmethod
+    def _grams(cls, text: str) -> Set[str]:
+        return {text[i:i + cls.N] for i in range(len(text) - cls.N + 1)}
+    
+    def _containing(self, needle: str) -> Set[int]:
+        """Entrées dont le nom contient ``needle``."""
+        grams = self._grams(needle)
+        if not grams:
+            candidates = range(len(self.entries))
+        else:
+            postings = sorted((self.postings.get(g, set()) for g in grams), key=len)
+            candidates = set.intersection(*postings)
+        return {i for i in candidates if needle in self.entries[i][0]}
+    
+    def _contained_in(self, haystack: str) -> Set[int]:
+        """Entrées dont le nom est contenu dans ``haystack``."""
+        counts: Dict[int, int] = {}
+        for gram in self._grams(haystack):
+            for entry_id in self.postings.get(gram, ()):
+                counts[entry_id] = counts.get(entry_id, 0) + 1
+        candidates = [i for i, c in counts.items() if c == self.gram_counts[i]]
+        candidates.extend(self.short_ids)
+        return {i for i in candidates if self.entries[i][0] and self.entries[i][0] in haystack}
+    
+    def _rank(self, ids: Set[int], reference: str) -> List[Tuple[float, str]]:
+        ranked = []
+        for entry_id in ids:
+            normalized, path = self.entries[entry_id]
+            shorter, longer = sorted((len(normalized), len(reference)))
+            ranked.append((shorter / max(longer, 1), path))
+        ranked.sort(key=lambda item: (-item[0], item[1]))
+        return ranked
+    
+    def best_containing(self, key: str) -> Optional[Tuple[float, str]]:
+        """Meilleur screen Flutter dont le nom contient la clé normalisée."""
+        ranked = self._rank(self._containing(key), key)
+        return ranked[0] if ranked else None
+    
+    def best_overlap(self, name: str) -> Optional[Tuple[float, str]]:
+        """Meilleur screen Flutter contenant ``name`` ou contenu dans ``name``."""
+        ranked = self._rank(self._containing(name) | self._contained_in(name), name)
+        return ranked[0] if ranked else None
+
 
 class StitchScreenChecker:
     """Vérificateur de couverture des screens Stitch."""
     
-    def __init__(self, project_root: Path):
+    def __init__(self, project_root: Path, index: Optional[ProjectIndex] = None):
         self.project_root = project_root
         self.stitch_dir = project_root / "stitch_reservation_process_screen"
         self.lib_dir = project_root / "lib" / "features"
         self.screens: List[ScreenStatus] = []
+        self._index = index
+    
+    @property
+    def index(self) -> ProjectIndex:
+        """Index des fichiers du projet, construit au premier accès."""
+        if self._index is None:
+            self._index = ProjectIndex.build(self.project_root)
+        return self._index
         
     def find_stitch_screens(self) -> List[str]:
         """Trouve tous les screens Stitch."""
-        screens = []
-        if not self.stitch_dir.exists():
-            return screens
-            
-        for item in self.stitch_dir.iterdir():
-            if item.is_dir() and not item.name.startswith('.'):
-                screens.append(item.name)
-        return sorted(screens)
+        # L'index exclut déjà les dossiers cachés
+        return sorted(self.index.subdirs(self.stitch_dir.name))
     
     def find_flutter_screens(self) -> Dict[str, str]:
         """Trouve tous les screens Flutter."""
         flutter_screens = {}
         
-        if not self.lib_dir.exists():
-            return flutter_screens
-        
         # Patterns pour trouver les screens
         patterns = [
             r"(\w+_screen)\.dart$",
             r"(\w+Screen)\.dart$",
         ]
         
-        for feature_dir in self.lib_dir.iterdir():
-            if not feature_dir.is_dir():
+        # lib/features/<feature>/presentation/screens/**/*.dart
+        for relative_path in self.index.files_with_suffix(".dart", under="lib"):
+            parts = relative_path.split("/")
+            if len(parts) < 6 or parts[1] != "features" or parts[3:5] != ["presentation", "screens"]:
                 continue
-                
-            screens_dir = feature_dir / "presentation" / "screens"
-            if not screens_dir.exists():
-                continue
-                
-            for file in screens_dir.rglob("*.dart"):
-                for pattern in patterns:
-                    match = re.search(pattern, file.name)
-                    if match:
-                        screen_name = match.group(1)
-                        relative_path = str(file.relative_to(self.project_root))
-                        flutter_screens[screen_name.lower()] = relative_path
+            file_name = parts[-1]
+            for pattern in patterns:
+                match = re.search(pattern, file_name)
+                if match:
+                    screen_name = match.group(1)
+                    flutter_screens[screen_name.lower()] = str(Path(relative_path))
         
         return flutter_screens
     
     def normalize_name(self, name: str) -> str:
         """Normalise un nom de screen pour la correspondance."""
-        # Enlever underscores, espaces, caractères spéciaux
-        normalized = re.sub(r'[^a-z0-9]', '', name.lower())
-        return normalized
+        return normalize_name(name)
     
     def check_coverage(self) -> List[ScreenStatus]:
         """Vérifie la couverture des screens Stitch."""
         stitch_screens = self.find_stitch_screens()
-        flutter_screens = self.find_flutter_screens()
+        matcher = ScreenNameMatcher(self.find_flutter_screens())
         
         results = []
         
@@ -134,28 +211,26 @@ class StitchScreenChecker:
             )
             
             # Chercher correspondance
-            normalized_stitch = self.normalize_name(stitch_name)
+            normalized_stitch = normalize_name(stitch_name)
             found = False
             
             # Essayer mapping connu
             if stitch_name in known_mappings:
                 flutter_key, mapped_status, priority = known_mappings[stitch_name]
-                for flutter_name, flutter_path in flutter_screens.items():
-                    if flutter_key in self.normalize_name(flutter_name):
-                        status.flutter_file = flutter_path
-                        status.status = mapped_status
-                        found = True
-                        break
+                match = matcher.best_containing(flutter_key)
+                if match:
+                    status.score, status.flutter_file = match
+                    status.status = mapped_status
+                    found = True
             
             # Essayer correspondance automatique
             if not found:
-                for flutter_name, flutter_path in flutter_screens.items():
-                    normalized_flutter = self.normalize_name(flutter_name)
-                    if normalized_stitch in normalized_flutter or normalized_flutter in normalized_stitch:
-                        status.flutter_file = flutter_path
-                        status.status = "partial"  # Probablement partiel
-                        found = True
-                        break
+                match = matcher.best_overlap(normalized_stitch)
+                if match:
+                    status.score, status.flutter_file = match
+                    status.status = "partial"  # Probablement partiel
+                    status.notes = f"Correspondance automatique (score {status.score:.2f})"
+                    found = True
             
             if not found:
                 status.status = "missing"
@@ -207,6 +282,12 @@ class StitchScreenChecker:
             for screen in missing_screens:
                 report.append(f"- `{screen.name}`\n")
         
+        stats = self.index.cache_stats
+        report.append(
+            f"\n*Index des fichiers : {stats['hits']} dossiers repris du cache, "
+            f"{stats['misses']} relus*\n"
+        )
+        
         return "".join(report)
     
     def run(self) -> str:
@@ -216,15 +297,29 @@ class StitchScreenChecker:
 
 def main():
     """Point d'entrée principal."""
-    project_root = Path(__file__).parent.parent
-    import sys
+    import argparse
     import io
     
+    parser = argparse.ArgumentParser(description="Vérification de la couverture des screens Stitch")
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Ignore le cache de l'index des fichiers (.cache/project_index.json)"
+    )
+    args = parser.parse_args()
+    
+    project_root = Path(__file__).parent.parent
+    
     # Forcer UTF-8 pour l'encodage de sortie (Windows)
     if sys.platform == 'win32':
         sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
     
-    checker = StitchScreenChecker(project_root)
+    if args.no_cache:
+        index = ProjectIndex.build(project_root)
+    else:
+        index = ProjectIndex.load(project_root)
+        index.save()
+    checker = StitchScreenChecker(project_root, index)
     report = checker.run()
     
     # Afficher le rapport
@@ -0,0 +1,474 @@
+#!/usr/bin/env python3
+"""
+Anti-patterns de performance Flutter dans ``lib/**/*.dart``.
+
+Chaque fichier est découpé une seule fois en jetons (commentaires, chaînes
+avec interpolation, identifiants, ponctuation) puis parcouru en un seul
+passage ; les règles s'appuient sur les jetons et l'appariement des
+parenthèses, pas sur une recherche de texte :
+
+- ``image_cache`` : ``Image.network`` sans ``cacheWidth``/``cacheHeight``
+  (ou ``CachedNetworkImage`` sans ``memCacheWidth``/``memCacheHeight``) :
+  l'image est décodée en pleine résolution ;
+- ``listview_children`` : ``ListView(children: [...])`` / ``GridView`` avec
+  une longue liste littérale ou une boucle ``for`` / ``...`` au lieu d'un
+  ``.builder`` ;
+- ``missing_const`` : constructeur dont tous les arguments sont constants,
+  appelé sans ``const`` (le widget est reconstruit à chaque ``build``) ;
+- ``setstate_large_build`` : ``setState`` dans un écran dont la méthode
+  ``build`` est longue (tout l'écran est reconstruit) ;
+- ``json_decode_ui`` : ``jsonDecode`` / ``json.decode`` hors ``compute`` ou
+  ``Isolate.run`` (décodage sur l'isolate UI) ; gravité ``high`` quand
+  l'argument ressemble à une réponse réseau, un fichier ou un cache.
+
+Les résultats sont regroupés par feature (``lib/features/<feature>/``).
+
+Usage:
+    python scripts/dart_perf_scan.py
+    python scripts/dart_perf_scan.py --rule image_cache --json
+"""
+
+import re
+import sys
+import json
+import argparse
+from dataclasses import dataclass, asdict
+from pathlib import Path
+from typing import Dict, Iterable, List, NamedTuple, Optional, Set, Tuple
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from project_index import ProjectIndex
+from lcov_coverage import feature_of
+
+RULES = {
+    "image_cache": "Image réseau décodée en pleine résolution",
+    "listview_children": "Liste littérale au lieu d'un builder",
+    "missing_const": "Constructeur constant sans const",
+    "setstate_large_build": "setState dans un build volumineux",
+    "json_decode_ui": "jsonDecode sur l'isolate UI",
+}
+LARGE_LIST_CHILDREN = 10
+LARGE_BUILD_LINES = 80
+
+# Constructeurs const de Flutter (classe ou classe.constructeur nommé)
+CONST_CONSTRUCTORS = {
+    "Text", "Icon", "SizedBox", "SizedBox.shrink", "SizedBox.expand", "SizedBox.square",
+    "Padding", "Center", "Align", "Divider", "VerticalDivider", "Spacer", "Expanded",
+    "Flexible", "Column", "Row", "Card", "ListTile", "CircularProgressIndicator",
+    "LinearProgressIndicator", "Placeholder", "AspectRatio", "Opacity", "SafeArea",
+    "CircleAvatar", "Tooltip", "Chip", "Positioned", "FlutterLogo",
+    "EdgeInsets.all", "EdgeInsets.symmetric", "EdgeInsets.only", "EdgeInsets.fromLTRB",
+    "EdgeInsetsDirectional.only", "EdgeInsetsDirectional.fromSTEB",
+    "TextStyle", "Radius.circular", "BorderRadius.all", "BorderRadius.only",
+    "BorderRadius.vertical", "BorderRadius.horizontal", "BorderSide", "Duration",
+    "Color", "Offset", "Size", "BoxConstraints",
+}
+# Espaces de constantes : ``Icons.home``, ``Colors.white``, ``FontWeight.bold``...
+CONST_NAMESPACES = {
+    "Icons", "CupertinoIcons", "Colors", "FontWeight", "FontStyle", "MainAxisAlignment",
+    "CrossAxisAlignment", "MainAxisSize", "TextAlign", "TextOverflow", "TextDecoration",
+    "BoxFit", "Alignment", "Axis", "Clip", "StackFit", "WrapAlignment", "BorderStyle",
+    "Curves", "Brightness", "EdgeInsets", "BorderRadius", "Radius", "Offset", "Size",
+    "Duration",
+}
+CONST_LITERALS = {"true", "false", "null"}
+# Arguments de jsonDecode qui ressemblent à une charge volumineuse
+PAYLOAD_HINTS = {
+    "body", "bodyBytes", "response", "responseBody", "payload", "readAsString",
+    "readAsStringSync", "loadString", "jsonString", "cached", "cachedJson", "cacheData",
+}
+ISOLATE_WRAPPERS = {"compute", "run"}
+
+
+class Token(NamedTuple):
+    """Jeton Dart : ``id``, ``num``, ``str`` (``$`` si interpolée), ``op``."""
+    kind: str
+    text: str
+    line: int
+
+
+@dataclass
+class PerfFinding:
+    """Anti-pattern détecté."""
+    rule: str
+    file: str
+    line: int
+    severity: str  # high, medium, low
+    message: str
+
+    @property
+    def location(self) -> str:
+        return f"{self.file}:{self.line}"
+
+
+_IDENT_RE = re.compile(r"[A-Za-z_$][\w$]*")
+_NUMBER_RE = re.compile(r"0[xX][0-9a-fA-F]+|\d+(?:\.\d+)?(?:[eE][+-]?\d+)?|\.\d+(?:[eE][+-]?\d+)?")
+_OPERATORS = ("...", "??=", "?.", "..", "=>", "??", "==", "!=", "<=", ">=", "&&", "||")
+
+
+def _scan_string(text: str, i: int, raw: bool) -> Tuple[int, bool]:
+    """Fin (exclue) de la chaîne qui commence en ``i`` et présence d'interpolation."""
+    quote = text[i:i + 3] if text[i:i + 3] in ("'''", '"""') else text[i]
+    i += len(quote)
+    n = len(text)
+    interpolated = False
+    while i < n:
+        if text.startswith(quote, i):
+            return i + len(quote), interpolated
+        c = text[i]
+        if c == "\\" and not raw:
+            i += 2
+        elif c == "$" and not raw:
+            interpolated = True
+            if text.startswith("${", i):
+                i = _skip_interpolation(text, i + 2)
+            else:
+                i += 1
+        elif c == "\n" and len(quote) == 1:
+            return i, interpolated  # chaîne non terminée
+        else:
+            i += 1
+    return n, interpolated
+
+
+def _skip_interpolation(text: str, i: int) -> int:
+    """Position après l'accolade fermante d'une interpolation ``${...}``."""
+    depth, n = 1, len(text)
+    while i < n:
+        c = text[i]
+        if c in "'\"":
+            i, _ = _scan_string(text, i, raw=False)
+            continue
+        if c == "{":
+            depth += 1
+        elif c == "}":
+            depth -= 1
+            if depth == 0:
+                return i + 1
+        i += 1
+    return n
+
+
+def tokenize(text: str) -> List[Token]:
+    """Découpe du code Dart en jetons (commentaires et espaces ignorés)."""
+    tokens: List[Token] = []
+    i, n, line = 0, len(text), 1
+    while i < n:
+        c = text[i]
+        if c == "\n":
+            line += 1
+            i += 1
+        elif c.isspace():
+            i += 1
+        elif text.startswith("//", i):
+            end = text.find("\n", i)
+            i = n if end < 0 else end
+        elif text.startswith("/*", i):
+            depth, j = 1, i + 2
+            while j < n and depth:
+                if text.startswith("/*", j):
+                    depth, j = depth + 1, j + 2
+                elif text.startswith("*/", j):
+                    depth, j = depth - 1, j + 2
+                else:
+                    j += 1
+            line += text.count("\n", i, j)
+            i = j
+        elif c in "'\"" or (c in "rR" and i + 1 < n and text[i + 1] in "'\""):
+            raw = c in "rR"
+            start = i + 1 if raw else i
+            end, interpolated = _scan_string(text, start, raw)
+            tokens.append(Token("str", "$" if interpolated else "", line))
+            line += text.count("\n", i, end)
+            i = end
+        elif c.isalpha() or c in "_$":
+            match = _IDENT_RE.match(text, i)
+            tokens.append(Token("id", match.group(0), line))
+            i = match.end()
+        elif c.isdigit() or (c == "." and i + 1 < n and text[i + 1].isdigit()):
+            match = _NUMBER_RE.match(text, i)
+            tokens.append(Token("num", match.group(0), line))
+            i = match.end()
+        else:
+            op = next((o for o in _OPERATORS if text.startswith(o, i)), c)
+            tokens.append(Token("op", op, line))
+            i += len(op)
+    return tokens
+
+
+def match_brackets(tokens: List[Token]) -> Dict[int, int]:
+    """Index du crochet fermant de chaque ``(``, ``[``, ``{`` (et inversement)."""
+    pairs: Dict[int, int] = {}
+    stack: List[int] = []
+    closing = {")": "(", "]": "[", "}": "{"}
+    for index, token in enumerate(tokens):
+        if token.kind != "op":
+            continue
+        if token.text in "([{":
+            stack.append(index)
+        elif token.text in closing:
+            # Ignore les fermants orphelins (code incomplet)
+            while stack and tokens[stack[-1]].text != closing[token.text]:
+                stack.pop()
+            if stack:
+                opening = stack.pop()
+                pairs[opening] = index
+                pairs[index] = opening
+    return pairs
+
+
+class DartFileScan:
+    """Analyse des jetons d'un fichier Dart."""
+
+    def __init__(self, tokens: List[Token], rel_path: str):
+        self.tokens = tokens
+        self.pairs = match_brackets(tokens)
+        self.rel_path = rel_path
+        self.findings: List[PerfFinding] = []
+        self._eligible: Dict[Tuple[int, int], bool] = {}
+
+    def text(self, index: int) -> str:
+        return self.tokens[index].text if 0 <= index < len(self.tokens) else ""
+
+    def flag(self, rule: str, index: int, severity: str, message: str):
+        self.findings.append(PerfFinding(rule, self.rel_path, self.tokens[index].line, severity, message))
+
+    def arguments(self, open_index: int) -> List[Tuple[Optional[str], int, int]]:
+        """Arguments de niveau supérieur entre ``(``/``[`` et son fermant : (nom, début, fin exclue)."""
+        close = self.pairs.get(open_index)
+        if close is None:
+            return []
+        args, start, i = [], open_index + 1, open_index + 1
+        while i <= close:
+            token = self.tokens[i]
+            if i == close or (token.kind == "op" and token.text == ","):
+                if start < i:
+                    name = None
+                    if (self.tokens[start].kind == "id" and start + 1 < i
+                            and self.text(start + 1) == ":"):
+                        name, start = self.tokens[start].text, start + 2
+                    args.append((name, start, i))
+                start = i + 1
+            elif token.kind == "op" and token.text in "([{" and i in self.pairs:
+                i = self.pairs[i]
+                continue
+            i += 1
+        return args
+
+    def constructor_at(self, index: int) -> Optional[Tuple[str, int]]:
+        """(``Classe`` ou ``Classe.nom``, index de ``(``) si un appel commence en ``index``."""
+        token = self.tokens[index]
+        if token.kind != "id" or not token.text[:1].isupper():
+            return None
+        if self.text(index + 1) == "(":
+            return token.text, index + 1
+        if (self.text(index + 1) == "." and index + 3 < len(self.tokens)
+                and self.tokens[index + 2].kind == "id" and self.text(index + 3) == "("):
+            return f"{token.text}.{self.tokens[index + 2].text}", index + 3
+        return None
+
+    def is_const_expr(self, start: int, end: int) -> bool:
+        """Vrai si les jetons ``[start, end)`` forment une expression constante."""
+        key = (start, end)
+        if key not in self._eligible:
+            self._eligible[key] = self._is_const_expr(start, end)
+        return self._eligible[key]
+
+    def _is_const_expr(self, start: int, end: int) -> bool:
+        if start >= end:
+            return False
+        first = self.tokens[start]
+        if first.kind == "id" and first.text == "const":
+            return True
+        if end - start == 1:
+            return (first.kind == "num" or (first.kind == "str" and not first.text)
+                    or first.text in CONST_LITERALS)
+        if first.text == "-" and end - start == 2:
+            return self.tokens[start + 1].kind == "num"
+        if (end - start == 3 and first.text in CONST_NAMESPACES and self.text(start + 1) == "."
+                and self.tokens[start + 2].kind == "id"):
+            return True
+        if first.text == "[" and self.pairs.get(start) == end - 1:
+            return all(name is None and self.is_const_expr(s, e) for name, s, e in self.arguments(start))
+        call = self.constructor_at(start)
+        if call and call[0] in CONST_CONSTRUCTORS and self.pairs.get(call[1]) == end - 1:
+            return all(self.is_const_expr(s, e) for _, s, e in self.arguments(call[1]))
+        return False
+
+    def scan(self) -> List[PerfFinding]:
+        """Parcourt les jetons une fois et applique toutes les règles."""
+        tokens = self.tokens
+        owners: List[Tuple[int, str]] = []  # parenthèses ouvertes : (index du fermant, appelant)
+        const_until = -1  # fin de la zone const (ou d'un appel déjà signalé) en cours
+        build_end, build_setstate, build_start = -1, 0, -1
+
+        for i, token in enumerate(tokens):
+            while owners and owners[-1][0] < i:
+                owners.pop()
+            if token.kind == "op" and token.text == "(" and i in self.pairs:
+                owners.append((self.pairs[i], self.text(i - 1)))
+            if token.kind != "id":
+                continue
+            name = token.text
+
+            if name == "const":
+                following = i + 1
+                call = self.constructor_at(following) if following < len(tokens) else None
+                if call and call[1] in self.pairs:
+                    const_until = max(const_until, self.pairs[call[1]])
+                elif self.text(following) in ("[", "{") and following in self.pairs:
+                    const_until = max(const_until, self.pairs[following])
+                else:
+                    # Déclaration ``const`` : l'initialiseur est constant jusqu'au ``;``
+                    j = following
+                    while j < len(tokens) and tokens[j].text != ";":
+                        j = self.pairs.get(j, j) + 1 if tokens[j].kind == "op" and tokens[j].text in "([{" else j + 1
+                    const_until = max(const_until, j)
+                continue
+
+            # build() volumineux contenant setState
+            if (name == "build" and self.text(i - 1) == "Widget" and self.text(i + 1) == "("
+                    and i + 1 in self.pairs):
+                body = self.pairs[i + 1] + 1
+                if self.text(body) == "{" and body in self.pairs and i > build_end:
+                    build_start, build_end, build_setstate = i, self.pairs[body], 0
+            if name == "setState" and i < build_end:
+                build_setstate += 1
+                if build_setstate == 1:
+                    lines = tokens[build_end].line - tokens[build_start].line
+                    if lines >= LARGE_BUILD_LINES:
+                        self.flag("setstate_large_build", build_start, "medium",
+                                  f"setState reconstruit un build de {lines} lignes : "
+                                  f"extraire la partie qui change dans un widget")
+
+            # jsonDecode / json.decode hors compute / Isolate.run
+            decode_paren = None
+            if name == "jsonDecode" and self.text(i + 1) == "(":
+                decode_paren = i + 1
+            elif name == "json" and self.text(i + 1) == "." and self.text(i + 2) == "decode" and self.text(i + 3) == "(":
+                decode_paren = i + 3
+            if decode_paren is not None and decode_paren in self.pairs:
+                wrapped = any(owner in ISOLATE_WRAPPERS for _, owner in owners)
+                if not wrapped:
+                    argument = {tokens[k].text for k in range(decode_paren + 1, self.pairs[decode_paren])}
+                    payload = bool(argument & PAYLOAD_HINTS)
+                    self.flag("json_decode_ui", i, "high" if payload else "low",
+                              "décodage JSON sur l'isolate UI : utiliser compute() ou Isolate.run()")
+
+            # Image.network / CachedNetworkImage sans taille de décodage
+            if name == "Image" and self.text(i + 1) == "." and self.text(i + 2) == "network" and self.text(i + 3) == "(":
+                names = {arg for arg, _, _ in self.arguments(i + 3)}
+                if not names & {"cacheWidth", "cacheHeight"}:
+                    self.flag("image_cache", i, "medium",
+                              "Image.network sans cacheWidth/cacheHeight : image décodée en pleine résolution")
+            elif name == "CachedNetworkImage" and self.text(i + 1) == "(":
+                names = {arg for arg, _, _ in self.arguments(i + 1)}
+                if not names & {"memCacheWidth", "memCacheHeight"}:
+                    self.flag("image_cache", i, "medium",
+                              "CachedNetworkImage sans memCacheWidth/memCacheHeight")
+
+            # ListView / GridView avec children littéraux
+            if name in ("ListView", "GridView"):
+                call = self.constructor_at(i)
+                if call and call[0] in ("ListView", "GridView", "GridView.count", "GridView.extent"):
+                    for arg, start, end in self.arguments(call[1]):
+                        if arg != "children":
+                            continue
+                        if self.text(start) == "const":
+                            start += 1
+                        if self.text(start) != "[" or start not in self.pairs:
+                            continue
+                        elements = self.arguments(start)
+                        dynamic = any(self.text(s) in ("for", "...", "?...") for _, s, _ in elements)
+                        if dynamic or len(elements) >= LARGE_LIST_CHILDREN:
+                            detail = "boucle dans la liste" if dynamic else f"{len(elements)} enfants"
+                            self.flag("listview_children", i, "medium",
+                                      f"{call[0]}(children: [...]) ({detail}) : utiliser {name}.builder")
+
+            # Constructeur constant sans const (appel le plus externe seulement)
+            if i > const_until and self.text(i - 1) not in (".", "new", "const"):
+                call = self.constructor_at(i)
+                if call and call[0] in CONST_CONSTRUCTORS and call[1] in self.pairs:
+                    end = self.pairs[call[1]] + 1
+                    if self.is_const_expr(i, end):
+                        self.flag("missing_const", i, "low", f"{call[0]}(...) peut être const")
+                        const_until = end - 1
+        return self.findings
+
+
+def scan_file(text: str, rel_path: str) -> List[PerfFinding]:
+    """Anti-patterns d'un fichier Dart."""
+    return DartFileScan(tokenize(text), rel_path).scan()
+
+
+def scan_project(index: ProjectIndex, rules: Optional[Iterable[str]] = None) -> List[PerfFinding]:
+    """Anti-patterns de ``lib/**/*.dart`` (toutes les règles par défaut)."""
+    selected: Set[str] = set(rules or RULES)
+    findings = []
+    for rel_path in sorted(index.files_with_suffix(".dart", under="lib")):
+        try:
+            text = index.path(rel_path).read_text(encoding="utf-8", errors="replace")
+        except OSError:
+            continue
+        findings.extend(f for f in scan_file(text, rel_path) if f.rule in selected)
+    return findings
+
+
+def summarize_findings(findings: List[PerfFinding], files: int) -> Dict:
+    """Totaux par règle et par feature (forme JSON du rapport)."""
+    rules = {rule: 0 for rule in RULES}
+    features: Dict[str, Dict] = {}
+    for finding in findings:
+        rules[finding.rule] += 1
+        feature = features.setdefault(feature_of(finding.file), {"total": 0, "rules": {}})
+        feature["total"] += 1
+        feature["rules"][finding.rule] = feature["rules"].get(finding.rule, 0) + 1
+    return {
+        "files": files,
+        "total": len(findings),
+        "rules": rules,
+        "features": {name: features[name] for name in sorted(features)},
+        "findings": [dict(asdict(f), location=f.location) for f in findings],
+    }
+
+
+def analyze_project(index: ProjectIndex) -> Dict:
+    """Rapport complet pour l'Overseer."""
+    files = len(index.files_with_suffix(".dart", under="lib"))
+    return summarize_findings(scan_project(index), files)
+
+
+def main():
+    """Point d'entrée principal."""
+    parser = argparse.ArgumentParser(description="Anti-patterns de performance Flutter dans lib/")
+    parser.add_argument("--rule", nargs="+", choices=list(RULES), default=None,
+                        help="Règles à appliquer (toutes par défaut)")
+    parser.add_argument("--json", action="store_true", help="Sortie JSON")
+    args = parser.parse_args()
+
+    project_root = Path(__file__).parent.parent
+    index = ProjectIndex.build(project_root)
+    findings = scan_project(index, args.rule)
+    summary = summarize_findings(findings, len(index.files_with_suffix(".dart", under="lib")))
+
+    if args.json:
+        print(json.dumps(summary, indent=2, ensure_ascii=False))
+        return 0
+
+    print(f"🐌 {summary['total']} anti-patterns dans {summary['files']} fichiers Dart")
+    for rule, count in summary["rules"].items():
+        if args.rule is None or rule in args.rule:
+            print(f"   {rule:<22} {count:>5}  {RULES[rule]}")
+    print(f"\n{'Feature':<24} {'Total':>6}")
+    for name, feature in summary["features"].items():
+        print(f"{name:<24} {feature['total']:>6}")
+    print()
+    for finding in findings:
+        if finding.severity != "low" or args.rule:
+            print(f"[{finding.severity}] {finding.location} {finding.rule} : {finding.message}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,292 @@
+#!/usr/bin/env python3
+"""
+Moteur commun de réécriture ligne par ligne pour les scripts remove_emojis*.
+
+Le fichier est lu en flux (une ligne à la fois, en octets) :
+- les lignes 100% ASCII ne peuvent pas contenir d'emoji et sont recopiées
+  sans décodage ni regex ;
+- tant qu'aucune ligne n'a changé, rien n'est écrit ;
+- à la première modification, un fichier temporaire est ouvert dans le même
+  dossier, le début inchangé y est recopié, puis la suite est écrite au fil
+  de la lecture ; le fichier d'origine est remplacé atomiquement à la fin.
+
+La mémoire utilisée ne dépend donc que de la longueur d'une ligne, pas de la
+taille du fichier.
+
+``process_files`` traite une liste de fichiers, en série ou dans un pool de
+processus ; les résultats sont toujours rendus dans l'ordre trié des chemins.
+Trois modes sont disponibles :
+- ``write`` : réécrit les fichiers (défaut) ;
+- ``check`` : liste chaque emoji en ``fichier:ligne:colonne`` sans rien écrire ;
+- ``diff`` : affiche un diff unifié (sans contexte) sans rien écrire.
+"""
+
+import os
+import re
+import sys
+import shutil
+import argparse
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, BinaryIO, Callable, Iterable, Iterator, List, Tuple
+
+# Liste des emojis courants à retirer
+EMOJI_PATTERN = re.compile(
+    r'['
+    r'\U0001F300-\U0001F9FF'  # Emojis généraux
+    r'\U00002600-\U000026FF'  # Symboles divers
+    r'\U00002700-\U000027BF'  # Dingbats
+    r'\U0001F600-\U0001F64F'  # Emoticons
+    r'\U0001F680-\U0001F6FF'  # Transport
+    r'\U0001F1E0-\U0001F1FF'  # Drapeaux
+    r'\U0001F900-\U0001F9FF'  # Emojis supplémentaires
+    r']+'
+)
+
+COPY_BUFFER_SIZE = 64 * 1024
+
+LineTransform = Callable[[str], str]
+
+
+def split_line_ending(raw: bytes) -> Tuple[bytes, bytes]:
+    """Sépare le contenu d'une ligne de sa fin de ligne (\\n ou \\r\\n)."""
+    body = raw.rstrip(b'\r\n')
+    return body, raw[len(body):]
+
+
+def transform_line(raw: bytes, transform: LineTransform) -> bytes:
+    """Applique ``transform`` à une ligne, en conservant sa fin de ligne."""
+    if raw.isascii():
+        return raw
+    body, ending = split_line_ending(raw)
+    return transform(body.decode('utf-8')).encode('utf-8') + ending
+
+
+def rewrite_stream(source: BinaryIO, transform: LineTransform) -> Iterator[Tuple[bytes, bytes]]:
+    """Produit les couples (ligne d'origine, ligne transformée) d'un flux."""
+    for raw in source:
+        yield raw, transform_line(raw, transform)
+
+
+def _copy_prefix(file_path: Path, target: BinaryIO, length: int):
+    """Recopie les ``length`` premiers octets de ``file_path`` dans ``target``."""
+    with open(file_path, 'rb') as head:
+        remaining = length
+        while remaining:
+            chunk = head.read(min(COPY_BUFFER_SIZE, remaining))
+            if not chunk:
+                break
+            target.write(chunk)
+            remaining -= len(chunk)
+
+
+def rewrite_file(file_path: Path, transform: LineTransform) -> bool:
+    """Réécrit un fichier ligne par ligne ; retourne True s'il a été modifié."""
+    file_path = Path(file_path)
+    target = None
+    tmp_name = ""
+    unchanged_bytes = 0
+    try:
+        with open(file_path, 'rb') as source:
+            for original, rewritten in rewrite_stream(source, transform):
+                if target is None:
+                    if rewritten == original:
+                        unchanged_bytes += len(original)
+                        continue
+                    fd, tmp_name = tempfile.mkstemp(
+                        dir=file_path.parent, prefix=f".{file_path.name}.", suffix=".tmp"
+                    )
+                    target = os.fdopen(fd, 'wb')
+                    _copy_prefix(file_path, target, unchanged_bytes)
+                target.write(rewritten)
+        if target is None:
+            return False
+        target.close()
+        shutil.copymode(file_path, tmp_name)
+        os.replace(tmp_name, file_path)
+        return True
+    except BaseException:
+        if target is not None:
+            target.close()
+            if os.path.exists(tmp_name):
+                os.unlink(tmp_name)
+        raise
+
+
+def check_file(file_path: Path, transform: LineTransform) -> List[Tuple[int, int, str]]:
+    """Emojis que ``transform`` retirerait : (ligne, colonne en octets, emoji).
+
+    Ligne et colonne commencent à 1 ; le fichier n'est pas modifié.
+    """
+    findings = []
+    with open(file_path, 'rb') as source:
+        for line_no, (original, rewritten) in enumerate(rewrite_stream(source, transform), 1):
+            if rewritten == original:
+                continue
+            body = split_line_ending(original)[0].decode('utf-8')
+            for match in EMOJI_PATTERN.finditer(body):
+                column = len(body[:match.start()].encode('utf-8')) + 1
+                findings.append((line_no, column, match.group(0)))
+    return findings
+
+
+def diff_file(file_path: Path, transform: LineTransform) -> List[str]:
+    """Diff unifié sans contexte (équivalent de ``diff -U0``) des lignes modifiées."""
+    lines: List[str] = []
+    hunk_start = 0
+    removed: List[str] = []
+    added: List[str] = []
+
+    def flush():
+        if removed:
+            count = len(removed)
+            lines.append(f"@@ -{hunk_start},{count} +{hunk_start},{count} @@")
+            lines.extend(removed)
+            lines.extend(added)
+            removed.clear()
+            added.clear()
+
+    with open(file_path, 'rb') as source:
+        for line_no, (original, rewritten) in enumerate(rewrite_stream(source, transform), 1):
+            if rewritten == original:
+                flush()
+                continue
+            if not removed:
+                hunk_start = line_no
+            removed.append("-" + split_line_ending(original)[0].decode('utf-8'))
+            added.append("+" + split_line_ending(rewritten)[0].decode('utf-8'))
+    flush()
+    if lines:
+        label = Path(file_path).as_posix()
+        lines[:0] = [f"--- a/{label}", f"+++ b/{label}"]
+    return lines
+
+
+MODES = {
+    "write": rewrite_file,
+    "check": check_file,
+    "diff": diff_file,
+}
+
+
+def _process_task(task: Tuple[str, Path, LineTransform]) -> Tuple[Path, Any, str]:
+    """Traite un fichier ; les erreurs sont retournées plutôt que levées."""
+    mode, file_path, transform = task
+    try:
+        return file_path, MODES[mode](file_path, transform), ""
+    except Exception as e:
+        return file_path, None, str(e)
+
+
+def process_files(
+    files: Iterable[Path],
+    transform: LineTransform,
+    mode: str = "write",
+    jobs: int = 1,
+) -> List[Tuple[Path, Any, str]]:
+    """Traite plusieurs fichiers et retourne (chemin, résultat, erreur) par fichier.
+
+    Le résultat dépend du mode : booléen « modifié » pour ``write``, liste
+    d'emojis pour ``check``, lignes de diff pour ``diff``. Avec ``jobs > 1``
+    les fichiers sont répartis sur un pool de processus ; ``transform`` doit
+    alors être une fonction de niveau module.
+    """
+    tasks = [(mode, file_path, transform) for file_path in sorted(files)]
+    if jobs > 1 and len(tasks) > 1:
+        chunksize = max(1, len(tasks) // (jobs * 4))
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            return list(executor.map(_process_task, tasks, chunksize=chunksize))
+    return [_process_task(task) for task in tasks]
+
+
+def print_summary(results: List[Tuple[Path, Any, str]], mode: str = "write") -> int:
+    """Affiche le résultat de chaque fichier (ordre trié).
+
+    Retourne le nombre de fichiers modifiés (``write``) ou qui le seraient
+    (``check`` / ``diff``).
+    """
+    count = 0
+    for file_path, result, error in results:
+        if error:
+            print(f"[ERREUR] Erreur avec {file_path}: {error}")
+        elif not result:
+            continue
+        elif mode == "check":
+            for line_no, column, emoji in result:
+                print(f"{Path(file_path).as_posix()}:{line_no}:{column}: emoji {emoji!r}")
+            count += 1
+        elif mode == "diff":
+            print("\n".join(result))
+            count += 1
+        else:
+            print(f"[OK] Traite: {file_path}")
+            count += 1
+    return count
+
+
+def count_errors(results: List[Tuple[Path, Any, str]]) -> int:
+    """Nombre de fichiers en erreur (lecture impossible, UTF-8 invalide...)."""
+    return sum(1 for _, _, error in results if error)
+
+
+def check_exit_code(results: List[Tuple[Path, Any, str]], processed: int) -> int:
+    """Code de sortie du mode ``check`` : non nul s'il y a des emojis ou un fichier en erreur.
+
+    Un fichier illisible n'a pas été vérifié : le contrôle ne doit pas passer.
+    """
+    errors = count_errors(results)
+    if errors:
+        print(f"{errors} fichiers n'ont pas pu être vérifiés.", file=sys.stderr)
+    return 1 if (processed or errors) else 0
+
+
+def add_cli_arguments(parser: argparse.ArgumentParser):
+    """Options communes aux scripts remove_emojis*."""
+    parser.add_argument(
+        "--jobs", "-j",
+        type=int,
+        default=1,
+        help="Nombre de processus de traitement (défaut : 1)"
+    )
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument(
+        "--check",
+        action="store_true",
+        help="N'écrit rien ; liste fichier:ligne:colonne de chaque emoji et "
+             "retourne un code non nul s'il y en a"
+    )
+    mode.add_argument(
+        "--diff",
+        action="store_true",
+        help="N'écrit rien ; affiche le diff des modifications"
+    )
+    parser.add_argument(
+        "--files",
+        nargs="*",
+        default=None,
+        metavar="PATH",
+        help="Ne traite que ces fichiers ; sans argument (ou avec '-') la liste est "
+             "lue sur stdin, ex: git diff --name-only origin/main | ... --check --files"
+    )
+
+
+def cli_mode(args: argparse.Namespace) -> str:
+    """Mode sélectionné par les options de la ligne de commande."""
+    if args.check:
+        return "check"
+    if args.diff:
+        return "diff"
+    return "write"
+
+
+def selected_files(args: argparse.Namespace, suffix: str) -> List[Path]:
+    """Fichiers passés via ``--files`` / stdin, filtrés par suffixe et existence."""
+    names = list(args.files)
+    if not names or "-" in names:
+        names = [n for n in names if n != "-"]
+        names.extend(line.strip() for line in sys.stdin)
+    return sorted({
+        Path(name) for name in names
+        if name and name.endswith(suffix) and Path(name).is_file()
+    })
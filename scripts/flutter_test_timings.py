@@ -0,0 +1,265 @@
+#!/usr/bin/env python3
+"""
+Durées des tests Flutter à partir du flux ``flutter test --machine``.
+
+Le flux NDJSON (un événement JSON par ligne) est lu au fil de l'eau, depuis
+un fichier ou l'entrée standard : chaque ``testStart`` est apparié à son
+``testDone``. Seuls les tests en cours, les totaux par fichier et les N tests
+les plus lents (tas) sont gardés en mémoire, avec la durée de chaque test
+pour la comparaison avec l'exécution précédente. Les tests « cachés »
+(chargement / compilation d'un fichier) sont comptés à part par fichier.
+
+La dernière exécution est conservée dans ``.cache/test_timings.json`` ; la
+suivante est comparée à elle (régressions par fichier et par test).
+
+Usage:
+    flutter test --machine | python scripts/flutter_test_timings.py -
+    python scripts/flutter_test_timings.py test-events.json --top 20
+"""
+
+import os
+import sys
+import json
+import heapq
+import hashlib
+import argparse
+from dataclasses import dataclass, field, asdict
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+DEFAULT_TOP = 10
+HISTORY_FILE = Path(".cache") / "test_timings.json"
+# Régression : au moins +20 % et +100 ms par rapport à l'exécution précédente
+REGRESSION_RATIO = 1.2
+REGRESSION_MIN_MS = 100.0
+
+
+@dataclass
+class TestTiming:
+    """Durée d'un test."""
+    name: str
+    file: str
+    duration_ms: float
+    result: str = "success"  # success, failure, error, skipped
+
+
+@dataclass
+class TestRunSummary:
+    """Synthèse d'une exécution de ``flutter test --machine``."""
+    total_tests: int = 0
+    failed: int = 0
+    skipped: int = 0
+    wall_ms: float = 0.0
+    slowest: List[TestTiming] = field(default_factory=list)
+    files: Dict[str, Dict[str, float]] = field(default_factory=dict)
+    durations: Dict[str, float] = field(default_factory=dict)
+
+    def signature(self) -> str:
+        """Empreinte des durées (deux lectures du même flux ont la même)."""
+        return hashlib.sha256(json.dumps(self.durations, sort_keys=True).encode()).hexdigest()
+
+
+def _relative_path(path: Optional[str]) -> str:
+    """Chemin du fichier de test, relatif à ``test/`` quand c'est possible."""
+    if not path:
+        return "?"
+    path = path.replace("\\", "/")
+    if path.startswith("file://"):
+        path = path[len("file://"):]
+    index = path.rfind("/test/")
+    return path[index + 1:] if index >= 0 else path
+
+
+def parse_machine_events(lines: Iterable[bytes], top: int = DEFAULT_TOP) -> TestRunSummary:
+    """Lit un flux d'événements ``--machine`` et retourne sa synthèse.
+
+    Les lignes qui ne sont pas des objets JSON (sortie mélangée de
+    ``flutter test``) sont ignorées.
+    """
+    summary = TestRunSummary()
+    suites: Dict[int, str] = {}
+    running: Dict[int, Tuple[str, str, float]] = {}  # id -> (nom, fichier, début)
+    heap: List[Tuple[float, str, str, str]] = []
+
+    for raw in lines:
+        raw = raw.strip()
+        if not raw.startswith(b"{"):
+            continue
+        try:
+            event = json.loads(raw)
+        except ValueError:
+            continue
+        kind = event.get("type")
+
+        if kind == "suite":
+            suite = event.get("suite", {})
+            suites[suite.get("id")] = _relative_path(suite.get("path"))
+        elif kind == "testStart":
+            test = event.get("test", {})
+            file_path = suites.get(test.get("suiteID"), "?")
+            running[test.get("id")] = (test.get("name", ""), file_path, event.get("time", 0))
+        elif kind == "testDone":
+            started = running.pop(event.get("testID"), None)
+            if started is None:
+                continue
+            name, file_path, start = started
+            duration = float(event.get("time", start) - start)
+            totals = summary.files.setdefault(
+                file_path, {"tests": 0, "duration_ms": 0.0, "load_ms": 0.0}
+            )
+            if event.get("hidden"):
+                # Chargement du fichier de test (compilation, setUpAll)
+                totals["load_ms"] += duration
+                continue
+            result = "skipped" if event.get("skipped") else event.get("result", "success")
+            summary.total_tests += 1
+            summary.failed += result in ("failure", "error")
+            summary.skipped += result == "skipped"
+            totals["tests"] += 1
+            totals["duration_ms"] += duration
+            summary.durations[f"{file_path}::{name}"] = duration
+            item = (duration, name, file_path, result)
+            if len(heap) < top:
+                heapq.heappush(heap, item)
+            elif item > heap[0]:
+                heapq.heapreplace(heap, item)
+        elif kind == "done":
+            summary.wall_ms = float(event.get("time", 0))
+
+    summary.slowest = [
+        TestTiming(name, file_path, duration, result)
+        for duration, name, file_path, result in sorted(heap, reverse=True)
+    ]
+    return summary
+
+
+def read_events(source: str, top: int = DEFAULT_TOP) -> TestRunSummary:
+    """Lit les événements depuis un fichier, ou l'entrée standard si ``source`` vaut ``-``."""
+    if source == "-":
+        return parse_machine_events(sys.stdin.buffer, top)
+    with open(source, 'rb') as f:
+        return parse_machine_events(f, top)
+
+
+def _regression(before: Optional[float], after: float) -> bool:
+    return (before is not None and after >= before * REGRESSION_RATIO
+            and after - before >= REGRESSION_MIN_MS)
+
+
+def compare_runs(current: TestRunSummary, previous: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    """Régressions par fichier et par test par rapport à l'exécution précédente."""
+    if not previous:
+        return {}
+    previous_files = previous.get("files", {})
+    previous_durations = previous.get("durations", {})
+    files = [
+        {"file": path, "before_ms": previous_files[path]["duration_ms"], "after_ms": totals["duration_ms"]}
+        for path, totals in sorted(current.files.items())
+        if path in previous_files
+        and _regression(previous_files[path]["duration_ms"], totals["duration_ms"])
+    ]
+    tests = [
+        {"test": key, "before_ms": previous_durations[key], "after_ms": duration}
+        for key, duration in sorted(current.durations.items())
+        if _regression(previous_durations.get(key), duration)
+    ]
+    tests.sort(key=lambda item: item["after_ms"] - item["before_ms"], reverse=True)
+    return {
+        "previous_wall_ms": previous.get("wall_ms"),
+        "wall_ms_delta": current.wall_ms - previous.get("wall_ms", 0.0),
+        "files": files,
+        "tests": tests,
+    }
+
+
+def load_history(history_file: Path) -> Dict[str, Any]:
+    try:
+        with open(history_file, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def record_run(current: TestRunSummary, history_file: Path = HISTORY_FILE) -> Optional[Dict[str, Any]]:
+    """Enregistre l'exécution et retourne l'exécution précédente à laquelle la comparer.
+
+    Relire le même flux ne remplace pas l'historique : la comparaison se fait
+    alors toujours avec l'exécution d'avant.
+    """
+    history = load_history(history_file)
+    signature = current.signature()
+    last = history.get("last")
+    if last and last.get("signature") == signature:
+        return history.get("previous")
+    run = {
+        "signature": signature,
+        "wall_ms": current.wall_ms,
+        "files": current.files,
+        "durations": current.durations,
+    }
+    history_file.parent.mkdir(parents=True, exist_ok=True)
+    tmp_file = history_file.with_suffix(".json.tmp")
+    with open(tmp_file, 'w', encoding='utf-8') as f:
+        json.dump({"last": run, "previous": last}, f, ensure_ascii=False)
+    os.replace(tmp_file, history_file)
+    return last
+
+
+def report_data(current: TestRunSummary, regressions: Dict[str, Any], top_files: int = DEFAULT_TOP) -> Dict[str, Any]:
+    """Forme JSON du rapport (sans la durée de chaque test)."""
+    files = sorted(current.files.items(), key=lambda item: item[1]["duration_ms"], reverse=True)
+    return {
+        "total_tests": current.total_tests,
+        "failed": current.failed,
+        "skipped": current.skipped,
+        "wall_ms": current.wall_ms,
+        "slowest": [asdict(timing) for timing in current.slowest],
+        "slowest_files": [dict(totals, file=path) for path, totals in files[:top_files]],
+        "files": len(current.files),
+        "regressions": regressions,
+    }
+
+
+def analyze(source: str, top: int = DEFAULT_TOP, history_file: Optional[Path] = HISTORY_FILE) -> Dict[str, Any]:
+    """Lit le flux, le compare à l'exécution précédente et enregistre l'historique."""
+    current = read_events(source, top)
+    previous = record_run(current, history_file) if history_file else None
+    return report_data(current, compare_runs(current, previous), top)
+
+
+def main():
+    """Point d'entrée principal."""
+    parser = argparse.ArgumentParser(description="Tests Flutter les plus lents (flutter test --machine)")
+    parser.add_argument("events", help="Fichier d'événements NDJSON, ou - pour l'entrée standard")
+    parser.add_argument("--top", type=int, default=DEFAULT_TOP, help=f"Nombre de tests affichés (défaut : {DEFAULT_TOP})")
+    parser.add_argument("--history", type=str, default=str(HISTORY_FILE),
+                        help=f"Historique des exécutions (défaut : {HISTORY_FILE})")
+    parser.add_argument("--json", action="store_true", help="Sortie JSON")
+    args = parser.parse_args()
+
+    data = analyze(args.events, max(args.top, 1), Path(args.history))
+    if args.json:
+        print(json.dumps(data, indent=2, ensure_ascii=False))
+        return 0
+
+    print(f"🧪 {data['total_tests']} tests ({data['failed']} en échec, {data['skipped']} ignorés) "
+          f"en {data['wall_ms'] / 1000:.1f} s")
+    print("\n🐢 Tests les plus lents :")
+    for timing in data["slowest"]:
+        print(f"   {timing['duration_ms']:>9.0f} ms  {timing['file']} :: {timing['name']}")
+    print("\n📁 Fichiers les plus lents :")
+    for totals in data["slowest_files"]:
+        print(f"   {totals['duration_ms']:>9.0f} ms  {totals['file']} "
+              f"({totals['tests']:.0f} tests, chargement {totals['load_ms']:.0f} ms)")
+    regressions = data["regressions"]
+    if regressions:
+        print(f"\n📈 Depuis l'exécution précédente : {regressions['wall_ms_delta'] / 1000:+.1f} s")
+        for item in regressions["files"]:
+            print(f"   ⚠️  {item['file']} : {item['before_ms']:.0f} -> {item['after_ms']:.0f} ms")
+        for item in regressions["tests"][:DEFAULT_TOP]:
+            print(f"   ⚠️  {item['test']} : {item['before_ms']:.0f} -> {item['after_ms']:.0f} ms")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,197 @@
+#!/usr/bin/env python3
+"""
+Surveillance d'un dossier de screens (un sous-dossier par screen).
+
+Deux implémentations, même interface :
+- ``InotifyWatcher`` (Linux) : événements inotify via ctypes, sans dépendance ;
+- ``PollingWatcher`` (partout) : instantanés ``stat`` comparés à intervalle fixe.
+
+``create_watcher()`` choisit inotify quand il est disponible. Les deux
+regroupent les rafales d'écritures (debounce) et produisent des lots de noms
+de screens touchés (sous-dossiers ajoutés, modifiés ou supprimés).
+
+Usage:
+    watcher = create_watcher(Path("stitch_reservation_process_screen"))
+    for touched in watcher.batches():
+        print(sorted(touched))
+"""
+
+import os
+import sys
+import time
+import select
+import struct
+import ctypes
+import ctypes.util
+from pathlib import Path
+from typing import Dict, Iterator, Optional, Set, Tuple
+
+DEFAULT_DEBOUNCE = 0.3
+DEFAULT_POLL_INTERVAL = 0.5
+# Délai maximal avant de livrer un lot, même si les écritures continuent
+MAX_BATCH_DELAY = 1.0
+
+# Constantes de <sys/inotify.h>
+IN_ATTRIB = 0x00000004
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_MOVE_SELF = 0x00000800
+IN_IGNORED = 0x00008000
+IN_ISDIR = 0x40000000
+IN_NONBLOCK = 0o4000
+IN_CLOEXEC = 0o2000000
+
+WATCH_MASK = (IN_CLOSE_WRITE | IN_ATTRIB | IN_MOVED_FROM | IN_MOVED_TO
+              | IN_CREATE | IN_DELETE | IN_DELETE_SELF | IN_MOVE_SELF)
+EVENT_HEADER = struct.Struct("iIII")
+
+
+class InotifyWatcher:
+    """Surveillance par inotify du dossier racine et de chaque sous-dossier."""
+
+    def __init__(self, root: Path, debounce: float = DEFAULT_DEBOUNCE):
+        libc_name = ctypes.util.find_library("c")
+        if not sys.platform.startswith("linux") or not libc_name:
+            raise OSError("inotify indisponible sur cette plateforme")
+        self.libc = ctypes.CDLL(libc_name, use_errno=True)
+        self.root = root
+        self.debounce = debounce
+        self.fd = self.libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 a échoué")
+        # descripteur de watch -> nom du screen ("" pour la racine)
+        self.watches: Dict[int, str] = {}
+        self._add_watch(root, "")
+        for entry in os.scandir(root):
+            if entry.is_dir() and not entry.name.startswith('.'):
+                self._add_watch(Path(entry.path), entry.name)
+
+    def _add_watch(self, path: Path, screen: str):
+        wd = self.libc.inotify_add_watch(self.fd, os.fsencode(path), WATCH_MASK)
+        if wd >= 0:
+            self.watches[wd] = screen
+
+    def _read_events(self) -> Set[str]:
+        touched = set()
+        try:
+            data = os.read(self.fd, 64 * 1024)
+        except BlockingIOError:
+            return touched
+        offset = 0
+        while offset + EVENT_HEADER.size <= len(data):
+            wd, mask, _cookie, length = EVENT_HEADER.unpack_from(data, offset)
+            offset += EVENT_HEADER.size
+            name = data[offset:offset + length].split(b"\0", 1)[0].decode("utf-8", "surrogateescape")
+            offset += length
+            screen = self.watches.get(wd)
+            if screen is None:
+                continue
+            if mask & IN_IGNORED:
+                self.watches.pop(wd, None)
+                continue
+            if screen == "":
+                # Événement dans la racine : ajout/suppression/renommage d'un screen
+                if not name or name.startswith('.'):
+                    continue
+                if mask & IN_ISDIR and mask & (IN_CREATE | IN_MOVED_TO):
+                    self._add_watch(self.root / name, name)
+                touched.add(name)
+            else:
+                touched.add(screen)
+        return touched
+
+    def batches(self) -> Iterator[Set[str]]:
+        """Produit les lots de screens touchés, après ``debounce`` secondes de calme."""
+        pending: Set[str] = set()
+        deadline = 0.0
+        while True:
+            timeout = None
+            if pending:
+                timeout = max(0.0, min(self.debounce, deadline - time.monotonic()))
+            readable, _, _ = select.select([self.fd], [], [], timeout)
+            if readable:
+                touched = self._read_events()
+                if touched and not pending:
+                    deadline = time.monotonic() + MAX_BATCH_DELAY
+                pending |= touched
+                if not pending or time.monotonic() < deadline:
+                    continue
+            if pending:
+                yield pending
+                pending = set()
+
+    def close(self):
+        os.close(self.fd)
+
+
+def _screen_signature(screen_dir: Path) -> Optional[Tuple]:
+    """Signature stat des fichiers d'un screen (None si le dossier a disparu)."""
+    try:
+        with os.scandir(screen_dir) as entries:
+            signature = []
+            for entry in entries:
+                if entry.is_file():
+                    st = entry.stat()
+                    signature.append((entry.name, st.st_size, st.st_mtime_ns, entry.inode()))
+            return tuple(sorted(signature))
+    except (FileNotFoundError, NotADirectoryError):
+        return None
+
+
+def snapshot(root: Path) -> Dict[str, Tuple]:
+    """Instantané {screen: signature} du dossier racine."""
+    result = {}
+    if not root.exists():
+        return result
+    for entry in os.scandir(root):
+        if entry.is_dir() and not entry.name.startswith('.'):
+            signature = _screen_signature(Path(entry.path))
+            if signature is not None:
+                result[entry.name] = signature
+    return result
+
+
+class PollingWatcher:
+    """Surveillance par comparaison d'instantanés ``stat``."""
+
+    def __init__(self, root: Path, interval: float = DEFAULT_POLL_INTERVAL):
+        self.root = root
+        self.interval = interval
+        self.state = snapshot(root)
+
+    def batches(self) -> Iterator[Set[str]]:
+        """Produit un lot dès qu'un instantané est stable après un changement."""
+        pending: Set[str] = set()
+        while True:
+            time.sleep(self.interval)
+            current = snapshot(self.root)
+            changed = {
+                name for name in set(current) | set(self.state)
+                if current.get(name) != self.state.get(name)
+            }
+            self.state = current
+            if changed:
+                # Écritures encore en cours : attendre un instantané stable
+                pending |= changed
+            elif pending:
+                yield pending
+                pending = set()
+
+    def close(self):
+        pass
+
+
+def create_watcher(root: Path, debounce: float = DEFAULT_DEBOUNCE,
+                   poll_interval: float = DEFAULT_POLL_INTERVAL,
+                   force_polling: bool = False):
+    """Retourne un ``InotifyWatcher`` si possible, sinon un ``PollingWatcher``."""
+    if not force_polling:
+        try:
+            return InotifyWatcher(root, debounce)
+        except (OSError, AttributeError):
+            pass
+    return PollingWatcher(root, poll_interval)
@@ -0,0 +1,227 @@
+#!/usr/bin/env python3
+"""
+Lecture en flux des fichiers lcov (``flutter test --coverage``).
+
+Le fichier est lu ligne à ligne, sans jamais être chargé en entier : la
+mémoire dépend du nombre de fichiers sources couverts, pas de la taille du
+fichier lcov. Les lignes (``DA``) et branches (``BRDA``) sont agrégées par
+fichier source ; un fichier présent dans plusieurs enregistrements (lcov
+fusionnés) est compté une seule fois par ligne (union des lignes couvertes).
+Une ligne n'est couverte que si son compteur est > 0 ; les enregistrements
+tronqués ou invalides (``DA:12,``) sont ignorés.
+
+Les chemins ``SF:`` sont rendus relatifs à la racine du projet : un lcov
+``packages/mobile/coverage/lcov.info`` donne ``packages/mobile/lib/...``, ce
+qui évite de confondre les fichiers homonymes de plusieurs packages. Les
+fichiers sous ``lib/features/<feature>/`` sont regroupés par feature.
+
+Usage:
+    python scripts/lcov_coverage.py coverage/lcov.info
+    python scripts/lcov_coverage.py packages/*/coverage/lcov.info --files
+"""
+
+import os
+import sys
+import json
+import argparse
+from dataclasses import dataclass, asdict
+from pathlib import Path
+from typing import Dict, Iterable, Optional, Set, Tuple
+
+FEATURES_MARKER = "lib/features/"
+OUTSIDE_FEATURES = "(hors features)"
+
+# Bits du tableau de lignes d'un fichier
+_LINE_FOUND = 1
+_LINE_HIT = 2
+
+
+@dataclass
+class CoverageCounts:
+    """Compteurs de lignes et de branches."""
+    lines_found: int = 0
+    lines_hit: int = 0
+    branches_found: int = 0
+    branches_hit: int = 0
+
+    def add(self, other: "CoverageCounts"):
+        self.lines_found += other.lines_found
+        self.lines_hit += other.lines_hit
+        self.branches_found += other.branches_found
+        self.branches_hit += other.branches_hit
+
+    @property
+    def line_rate(self) -> Optional[float]:
+        """Pourcentage de lignes couvertes (None si aucune ligne instrumentée)."""
+        return self.lines_hit * 100 / self.lines_found if self.lines_found else None
+
+    @property
+    def branch_rate(self) -> Optional[float]:
+        """Pourcentage de branches couvertes (None sans données de branches)."""
+        return self.branches_hit * 100 / self.branches_found if self.branches_found else None
+
+    def to_dict(self) -> Dict:
+        data = asdict(self)
+        data["line_rate"] = round(self.line_rate, 2) if self.line_rate is not None else None
+        data["branch_rate"] = round(self.branch_rate, 2) if self.branch_rate is not None else None
+        return data
+
+
+class _FileCoverage:
+    """Lignes et branches d'un fichier source (union des enregistrements)."""
+
+    __slots__ = ("lines", "branches_found", "branches_hit")
+
+    def __init__(self):
+        self.lines = bytearray()
+        self.branches_found: Set[Tuple[bytes, bytes, bytes]] = set()
+        self.branches_hit: Set[Tuple[bytes, bytes, bytes]] = set()
+
+    def counts(self) -> CoverageCounts:
+        lines = self.lines
+        return CoverageCounts(
+            lines_found=len(lines) - lines.count(0),
+            lines_hit=lines.count(_LINE_FOUND | _LINE_HIT),
+            branches_found=len(self.branches_found),
+            branches_hit=len(self.branches_hit),
+        )
+
+
+def package_prefix(lcov_path: Path, root: Path) -> str:
+    """Préfixe des chemins d'un lcov : dossier du package (parent de ``coverage/``)."""
+    package_dir = lcov_path.parent.parent if lcov_path.parent.name == "coverage" else lcov_path.parent
+    prefix = os.path.relpath(package_dir.resolve(), root.resolve()).replace(os.sep, "/")
+    return "" if prefix == "." else prefix + "/"
+
+
+def normalize_source(path: str, prefix: str = "") -> str:
+    """Chemin source relatif à la racine, quel que soit le chemin de la machine de CI."""
+    path = path.replace("\\", "/")
+    if path.startswith("/") or path[1:3] == ":/":
+        # Chemin absolu (autre machine) : on garde la partie à partir de lib/
+        index = path.rfind("/lib/")
+        if index >= 0:
+            path = path[index + 1:]
+    return prefix + path
+
+
+def feature_of(path: str) -> str:
+    """Nom de la feature (``lib/features/<feature>/...``) d'un chemin source."""
+    index = path.rfind(FEATURES_MARKER)
+    if index < 0:
+        return OUTSIDE_FEATURES
+    rest = path[index + len(FEATURES_MARKER):]
+    feature, sep, _ = rest.partition("/")
+    return feature if sep else OUTSIDE_FEATURES
+
+
+def parse_lcov(lines: Iterable[bytes], files: Dict[str, _FileCoverage], prefix: str = ""):
+    """Agrège un flux de lignes lcov (octets) dans ``files`` (chemin -> couverture)."""
+    current: Optional[_FileCoverage] = None
+    table = bytearray()
+    for line in lines:
+        if line.startswith(b"DA:"):
+            # DA:<ligne>,<exécutions>[,<checksum>] ; un enregistrement tronqué ou invalide est ignoré
+            number, _, rest = line[3:].partition(b",")
+            try:
+                number = int(number)
+                hits = int(rest.split(b",", 1)[0])
+            except ValueError:
+                continue
+            if number < 0:
+                continue
+            if number >= len(table):
+                table.extend(bytes(number + 1 - len(table)))
+            table[number] |= _LINE_FOUND | _LINE_HIT if hits > 0 else _LINE_FOUND
+        elif line.startswith(b"SF:"):
+            source = normalize_source(line[3:].rstrip(b"\r\n").decode("utf-8", "replace"), prefix)
+            current = files.get(source)
+            if current is None:
+                current = files[source] = _FileCoverage()
+            table = current.lines
+        elif line.startswith(b"BRDA:"):
+            if current is None:
+                continue
+            fields = line[5:].rstrip(b"\r\n").split(b",", 3)
+            if len(fields) != 4:
+                continue
+            line_no, block, branch, taken = fields
+            try:
+                taken_count = 0 if taken == b"-" else int(taken)
+            except ValueError:
+                continue
+            key = (line_no, block, branch)
+            current.branches_found.add(key)
+            if taken_count > 0:
+                current.branches_hit.add(key)
+        elif line.startswith(b"end_of_record"):
+            current = None
+            table = bytearray()
+        # LF/LH/BRF/BRH, FN*, TN : recalculés ou non utilisés
+
+
+def read_lcov_files(paths: Iterable[Path], root: Optional[Path] = None) -> Dict[str, CoverageCounts]:
+    """Couverture par fichier source, agrégée sur tous les fichiers lcov ``paths``."""
+    root = root or Path.cwd()
+    files: Dict[str, _FileCoverage] = {}
+    for path in paths:
+        with open(path, 'rb') as f:
+            parse_lcov(f, files, package_prefix(path, root))
+    return {source: files[source].counts() for source in sorted(files)}
+
+
+def summarize(per_file: Dict[str, CoverageCounts]) -> Dict:
+    """Total et détail par feature (forme JSON du rapport)."""
+    total = CoverageCounts()
+    features: Dict[str, CoverageCounts] = {}
+    for source, counts in per_file.items():
+        total.add(counts)
+        features.setdefault(feature_of(source), CoverageCounts()).add(counts)
+    return {
+        "files": len(per_file),
+        "total": total.to_dict(),
+        "features": {name: features[name].to_dict() for name in sorted(features)},
+    }
+
+
+def main():
+    """Point d'entrée principal."""
+    parser = argparse.ArgumentParser(description="Couverture de tests à partir de fichiers lcov")
+    parser.add_argument("lcov", nargs="*", default=["coverage/lcov.info"], help="Fichiers lcov.info")
+    parser.add_argument("--files", action="store_true", help="Affiche aussi le détail par fichier")
+    parser.add_argument("--json", action="store_true", help="Sortie JSON")
+    args = parser.parse_args()
+
+    paths = [Path(p) for p in args.lcov]
+    missing = [str(p) for p in paths if not p.exists()]
+    if missing:
+        print(f"❌ Fichier(s) lcov introuvable(s) : {', '.join(missing)}")
+        return 1
+
+    per_file = read_lcov_files(paths)
+    summary = summarize(per_file)
+    if args.files:
+        summary["per_file"] = {source: counts.to_dict() for source, counts in per_file.items()}
+
+    if args.json:
+        print(json.dumps(summary, indent=2, ensure_ascii=False))
+        return 0
+
+    def rate(value: Optional[float]) -> str:
+        return f"{value:.1f}%" if value is not None else "-"
+
+    total = summary["total"]
+    print(f"📊 {summary['files']} fichiers : lignes {rate(total['line_rate'])} "
+          f"({total['lines_hit']}/{total['lines_found']}), branches {rate(total['branch_rate'])}")
+    print(f"\n{'Feature':<24} {'Lignes':>8} {'Branches':>9}")
+    for name, counts in summary["features"].items():
+        print(f"{name:<24} {rate(counts['line_rate']):>8} {rate(counts['branch_rate']):>9}")
+    if args.files:
+        print()
+        for source, counts in summary["per_file"].items():
+            print(f"{rate(counts['line_rate']):>7}  {source}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -9,20 +9,60 @@ Ce script génère un rapport complet de l'état du projet :
 - Documentation
 - Tests
 
+Chaque vérification déclare ses entrées ; son résultat est mémoïsé sur
+l'empreinte de ces entrées (fichiers et mtimes) et du code qui la calcule dans
+.cache/overseer_checks.json, et seules les vérifications dont les entrées ont changé sont recalculées.
+
 Usage:
     python scripts/overseer_status_check.py [--output docs/STATUS_REPORT.md]
+    python scripts/overseer_status_check.py --format both --since-ref origin/main
 """
 
 import os
 import re
+import math
+import sys
 import json
 import subprocess
 from pathlib import Path
-from typing import Dict, List, Tuple, Optional
-from dataclasses import dataclass, asdict
+from typing import Any, Dict, List, Tuple, Optional
+from dataclasses import dataclass, asdict, field
 from datetime import datetime
 import argparse
 
+sys.path.insert(0, str(Path(__file__).parent))
+
+from project_index import ProjectIndex
+from perf_trace import FS_CALLS, PhaseTimer
+from check_scheduler import Check, CheckScheduler, DEFAULT_CHECK_JOBS, DEFAULT_CHECK_TIMEOUT
+from check_memo import MEMO_FILE, CheckMemo, fingerprint_inputs
+from lcov_coverage import read_lcov_files, summarize
+from supabase_index_audit import MIGRATIONS_DIR, FUNCTIONS_DIR, analyze_project as analyze_index_coverage
+from flutter_test_timings import DEFAULT_TOP, HISTORY_FILE, analyze as analyze_test_timings
+from dart_perf_scan import RULES as ANTI_PATTERN_RULES, analyze_project as analyze_anti_patterns
+from asset_budget import PUBSPEC_FILE, analyze_project as analyze_asset_budget, budget_inputs, format_size, format_violation
+from unused_assets import ASSETS_DIR, analyze_project as analyze_unused_assets
+
+STITCH_DIR_NAME = "stitch_reservation_process_screen"
+BUILTIN_CHECKS = (
+    "check_screens_coverage", "check_integrations", "check_tests", "check_coverage",
+    "check_documentation", "check_test_timings", "check_index_coverage", "check_anti_patterns",
+    "check_asset_budget", "check_unused_assets",
+)
+DEFAULT_LCOV_FILES = ["coverage/lcov.info"]
+
+REQUIRED_DOCS = [
+    "README.md",
+    "ARCHITECTURE.md",
+    "SETUP.md",
+    "API_DOCUMENTATION.md",
+    "GEMINI_INTEGRATION.md",
+    "docs/MAPBOX_INTEGRATION.md",
+    "docs/STITCH_SCREENS.md",
+    "docs/GIT_WORKFLOW.md",
+    "OVERSEER.md",
+]
+
 @dataclass
 class IntegrationStatus:
     """Statut d'une intégration."""
@@ -46,27 +86,124 @@ class ProjectStatus:
     screens_coverage: List[ScreenCoverage]
     integrations: List[IntegrationStatus]
     test_coverage: float = 0.0
+    test_coverage_source: str = "estimation"  # estimation, lcov
     documentation_complete: float = 0.0
     total_screens: int = 0
     implemented_screens: int = 0
     partial_screens: int = 0
     missing_screens: int = 0
+    index_cache: Dict[str, int] = field(default_factory=dict)
+    performance: Dict[str, Dict[str, float]] = field(default_factory=dict)
+    checks: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+    plugin_results: Dict[str, Any] = field(default_factory=dict)
+    delta: Dict[str, Any] = field(default_factory=dict)
+    coverage: Dict[str, Any] = field(default_factory=dict)
+    test_timings: Dict[str, Any] = field(default_factory=dict)
+    index_coverage: Dict[str, Any] = field(default_factory=dict)
+    anti_patterns: Dict[str, Any] = field(default_factory=dict)
+    asset_budget: Dict[str, Any] = field(default_factory=dict)
+    unused_assets: Dict[str, Any] = field(default_factory=dict)
 
 class OverseerStatusChecker:
     """Vérificateur de statut pour l'Overseer."""
     
-    def __init__(self, project_root: Path):
+    def __init__(self, project_root: Path, index: Optional[ProjectIndex] = None,
+                 use_cache: bool = False, jobs: int = DEFAULT_CHECK_JOBS,
+                 check_timeout: float = DEFAULT_CHECK_TIMEOUT,
+                 lcov_files: Optional[List[str]] = None,
+                 test_events: Optional[str] = None):
         self.project_root = project_root
-        self.stitch_dir = project_root / "stitch_reservation_process_screen"
+        self.stitch_dir = project_root / STITCH_DIR_NAME
         self.lib_dir = project_root / "lib"
         self.docs_dir = project_root / "docs"
         self.supabase_dir = project_root / "supabase"
+        self.use_cache = use_cache
+        self.timer = PhaseTimer()
+        self.jobs = jobs
+        self.check_timeout = check_timeout
+        self.lcov_files = lcov_files or DEFAULT_LCOV_FILES
+        self.test_events = test_events
+        self._index = index
+        self.memo = CheckMemo.load(project_root / MEMO_FILE) if use_cache else None
+        self.checks: List[Check] = []
+        self._register_default_checks()
+    
+    def _register_default_checks(self):
+        """Enregistre les vérifications intégrées et leurs entrées."""
+        self.register_check(Check(
+            "check_screens_coverage", self.check_screens_coverage,
+            inputs=(STITCH_DIR_NAME, "lib"), sources=(ProjectIndex,), default=[],
+            decode=lambda items: [ScreenCoverage(**item) for item in items],
+        ))
+        self.register_check(Check(
+            "check_integrations", self.check_integrations,
+            inputs=("lib", "supabase/functions", ".env", "firebase.json"), sources=(ProjectIndex,),
+            default=[],
+            decode=lambda items: [IntegrationStatus(**item) for item in items],
+        ))
+        self.register_check(Check(
+            "check_tests", self.check_tests, inputs=("lib", "test"), sources=(ProjectIndex,),
+            default=0.0,
+        ))
+        self.register_check(Check(
+            "check_coverage", self.check_coverage, inputs=tuple(self.lcov_files),
+            sources=(ProjectIndex, summarize), default={},
+        ))
+        self.register_check(Check(
+            "check_documentation", self.check_documentation,
+            inputs=tuple(REQUIRED_DOCS), sources=(ProjectIndex,), default=0.0,
+        ))
+        self.register_check(Check(
+            "check_index_coverage", self.check_index_coverage,
+            inputs=(MIGRATIONS_DIR, FUNCTIONS_DIR, "lib"), sources=(analyze_index_coverage,),
+            default={},
+        ))
+        self.register_check(Check(
+            "check_anti_patterns", self.check_anti_patterns, inputs=("lib",),
+            sources=(analyze_anti_patterns,), default={},
+        ))
+        self.register_check(Check(
+            "check_asset_budget", self.check_asset_budget,
+            inputs=budget_inputs(self.project_root), sources=(analyze_asset_budget,), default={},
+        ))
+        self.register_check(Check(
+            "check_unused_assets", self.check_unused_assets, inputs=("lib", ASSETS_DIR),
+            sources=(analyze_unused_assets,), default={},
+        ))
+        if self.test_events:
+            # Sur l'entrée standard : pas de mémoïsation, et on attend la fin de flutter test
+            from_stdin = self.test_events == "-"
+            self.register_check(Check(
+                "check_test_timings", self.check_test_timings,
+                inputs=() if from_stdin else (self.test_events,),
+                sources=(analyze_test_timings,),
+                timeout=math.inf if from_stdin else None, default={},
+            ))
+    
+    def register_check(self, check: Check):
+        """Ajoute une vérification (plugin) au rapport.
+
+        Le résultat d'une vérification qui n'est pas intégrée est rapporté
+        dans ``ProjectStatus.plugin_results``.
+        """
+        self.checks.append(check)
+    
+    @property
+    def index(self) -> ProjectIndex:
+        """Index des fichiers du projet, construit au premier accès."""
+        if self._index is None:
+            if self.use_cache:
+                self._index = ProjectIndex.load(self.project_root)
+            else:
+                self._index = ProjectIndex.build(self.project_root)
+        return self._index
         
     def check_screens_coverage(self) -> List[ScreenCoverage]:
         """Vérifie la couverture des screens Stitch."""
         coverage = []
+        stitch_rel = self.stitch_dir.name
         
-        if not self.stitch_dir.exists():
+        if not self.index.is_dir(stitch_rel):
             return coverage
         
         # Mapping connu screens Stitch -> Flutter
@@ -107,12 +244,8 @@ class OverseerStatusChecker:
             "help_&_support_center": ("", "missing", "low"),
         }
         
-        # Trouver tous les screens Stitch
-        stitch_screens = []
-        if self.stitch_dir.exists():
-            for item in self.stitch_dir.iterdir():
-                if item.is_dir() and not item.name.startswith('.'):
-                    stitch_screens.append(item.name)
+        # Trouver tous les screens Stitch (l'index exclut déjà les dossiers cachés)
+        stitch_screens = list(self.index.subdirs(stitch_rel))
         
         # Créer la liste de couverture
         for stitch_name in sorted(stitch_screens):
@@ -137,52 +270,55 @@ class OverseerStatusChecker:
     
     def _find_flutter_file(self, filename: str) -> str:
         """Trouve le chemin d'un fichier Flutter."""
-        for root, dirs, files in os.walk(self.lib_dir):
-            if filename in files:
-                return str(Path(root) / filename)
-        return ""
+        matches = self.index.files_named(filename, under="lib")
+        return str(self.index.path(matches[0])) if matches else ""
     
     def check_integrations(self) -> List[IntegrationStatus]:
         """Vérifie l'état des intégrations."""
         integrations = []
         
+        index = self.index
+        lib_dart_files = index.files_with_suffix(".dart", under="lib")
+        
         # Supabase
-        supabase_config = self.project_root / ".env"
-        supabase_functions = self.supabase_dir / "functions"
-        has_functions = supabase_functions.exists() and any(supabase_functions.iterdir())
+        has_env = index.exists(".env")
+        has_functions = bool(
+            index.subdirs("supabase/functions") or index.files("supabase/functions")
+        )
         
         integrations.append(IntegrationStatus(
             name="Supabase",
-            status="active" if (supabase_config.exists() or has_functions) else "partial",
-            config_file=".env" if supabase_config.exists() else "",
+            status="active" if (has_env or has_functions) else "partial",
+            config_file=".env" if has_env else "",
             notes="Edge Functions" if has_functions else "Configuration à vérifier"
         ))
         
         # Gemini
-        gemini_service = self.lib_dir / "core" / "services" / "gemini_service.dart"
-        gemini_config = self.lib_dir / "core" / "config" / "gemini_config.dart"
+        gemini_service = "lib/core/services/gemini_service.dart"
+        gemini_config = "lib/core/config/gemini_config.dart"
+        has_gemini_service = index.exists(gemini_service)
+        has_gemini_config = index.exists(gemini_config)
         integrations.append(IntegrationStatus(
             name="Gemini 2.5",
-            status="active" if gemini_service.exists() and gemini_config.exists() else "partial",
-            config_file=str(gemini_config.relative_to(self.project_root)) if gemini_config.exists() else "",
-            notes="Service et config présents" if gemini_service.exists() else "À configurer"
+            status="active" if has_gemini_service and has_gemini_config else "partial",
+            config_file=gemini_config if has_gemini_config else "",
+            notes="Service et config présents" if has_gemini_service else "À configurer"
         ))
         
         # Mapbox
-        mapbox_config = self.lib_dir / "core" / "config" / "mapbox_config.dart"
-        mapbox_service = self.lib_dir / "features" / "map" / "data" / "services" / "mapbox_service.dart"
+        mapbox_config = "lib/core/config/mapbox_config.dart"
+        mapbox_service = "lib/features/map/data/services/mapbox_service.dart"
+        has_mapbox_config = index.exists(mapbox_config)
+        has_mapbox_service = index.exists(mapbox_service)
         integrations.append(IntegrationStatus(
             name="Mapbox",
-            status="active" if mapbox_config.exists() and mapbox_service.exists() else "partial",
-            config_file=str(mapbox_config.relative_to(self.project_root)) if mapbox_config.exists() else "",
-            notes="Service et config présents" if mapbox_service.exists() else "À configurer"
+            status="active" if has_mapbox_config and has_mapbox_service else "partial",
+            config_file=mapbox_config if has_mapbox_config else "",
+            notes="Service et config présents" if has_mapbox_service else "À configurer"
         ))
         
         # Stripe
-        stripe_integration = any(
-            "stripe" in str(p).lower() 
-            for p in self.lib_dir.rglob("*.dart")
-        )
+        stripe_integration = any("stripe" in p.lower() for p in lib_dart_files)
         integrations.append(IntegrationStatus(
             name="Stripe",
             status="missing" if not stripe_integration else "partial",
@@ -190,15 +326,11 @@ class OverseerStatusChecker:
         ))
         
         # Firebase
-        firebase_config = self.project_root / "firebase.json"
-        firebase_integration = any(
-            "firebase" in str(p).lower() 
-            for p in self.lib_dir.rglob("*.dart")
-        )
+        firebase_integration = any("firebase" in p.lower() for p in lib_dart_files)
         integrations.append(IntegrationStatus(
             name="Firebase",
             status="partial" if firebase_integration else "missing",
-            config_file="firebase.json" if firebase_config.exists() else "",
+            config_file="firebase.json" if index.exists("firebase.json") else "",
             notes="Notifications push à configurer"
         ))
         
@@ -206,35 +338,21 @@ class OverseerStatusChecker:
     
     def check_documentation(self) -> float:
         """Vérifie la complétude de la documentation."""
-        required_docs = [
-            "README.md",
-            "ARCHITECTURE.md",
-            "SETUP.md",
-            "API_DOCUMENTATION.md",
-            "GEMINI_INTEGRATION.md",
-            "docs/MAPBOX_INTEGRATION.md",
-            "docs/STITCH_SCREENS.md",
-            "docs/GIT_WORKFLOW.md",
-            "OVERSEER.md",
-        ]
-        
-        found = 0
-        for doc in required_docs:
-            doc_path = self.project_root / doc
-            if doc_path.exists():
-                found += 1
+        found = sum(1 for doc in REQUIRED_DOCS if self.index.exists(doc))
         
-        return (found / len(required_docs)) * 100
+        return (found / len(REQUIRED_DOCS)) * 100
     
     def check_tests(self) -> float:
         """Vérifie la couverture des tests."""
         # Estimation basée sur la présence de fichiers de test
-        test_dir = self.project_root / "test"
-        if not test_dir.exists():
+        if not self.index.is_dir("test"):
             return 0.0
         
-        test_files = list(test_dir.rglob("*_test.dart"))
-        source_files = list(self.lib_dir.rglob("*.dart"))
+        test_files = [
+            p for p in self.index.files_with_suffix(".dart", under="test")
+            if p.endswith("_test.dart")
+        ]
+        source_files = self.index.files_with_suffix(".dart", under="lib")
         
         # Estimation : si on a des tests, on suppose au moins 30% de couverture
         # (c'est une estimation, pas une mesure réelle)
@@ -244,10 +362,100 @@ class OverseerStatusChecker:
         
         return 0.0
     
+    def check_coverage(self) -> Dict[str, Any]:
+        """Couverture mesurée (lignes/branches, par feature) à partir des fichiers lcov.
+
+        Retourne un dict vide si aucun fichier lcov n'est présent.
+        """
+        sources = [p for p in self.lcov_files if self.index.exists(p)]
+        if not sources:
+            return {}
+        coverage = summarize(read_lcov_files([self.index.path(p) for p in sources], self.project_root))
+        coverage["sources"] = sources
+        return coverage
+    
+    def check_index_coverage(self) -> Dict[str, Any]:
+        """Requêtes Supabase (listings, reservations, messages) sur des colonnes sans index.
+
+        Retourne un dict vide sans migrations Supabase.
+        """
+        if not self.index.is_dir(MIGRATIONS_DIR):
+            return {}
+        return analyze_index_coverage(self.index)
+    
+    def check_anti_patterns(self) -> Dict[str, Any]:
+        """Anti-patterns de performance Flutter dans ``lib/``, regroupés par feature.
+
+        Retourne un dict vide sans dossier ``lib``.
+        """
+        if not self.index.is_dir("lib"):
+            return {}
+        return analyze_anti_patterns(self.index)
+    
+    def check_asset_budget(self) -> Dict[str, Any]:
+        """Poids des assets (taille, résolution lue dans l'en-tête) face aux budgets par dossier.
+
+        Les totaux sont repris dans l'évolution entre deux rapports JSON. Un
+        fichier de budgets absent ou invalide fait échouer la vérification
+        (``BudgetConfigError``, rapportée dans ``checks``) au lieu de
+        retirer toutes les limites.
+        """
+        return analyze_asset_budget(self.index)
+    
+    def check_unused_assets(self) -> Dict[str, Any]:
+        """Assets et clés de traduction jamais référencés dans ``lib/``, clés absentes par locale.
+
+        Retourne un dict vide sans dossier ``assets``.
+        """
+        if not self.index.is_dir(ASSETS_DIR):
+            return {}
+        return analyze_unused_assets(self.index)
+    
+    def check_test_timings(self) -> Dict[str, Any]:
+        """Tests les plus lents et régressions, à partir du flux ``flutter test --machine``.
+
+        L'exécution est enregistrée dans ``.cache/test_timings.json`` pour être
+        comparée à la suivante.
+        """
+        if not self.test_events:
+            return {}
+        source = self.test_events if self.test_events == "-" else str(self.index.path(self.test_events))
+        return analyze_test_timings(source, DEFAULT_TOP, self.project_root / HISTORY_FILE)
+    
     def generate_status_report(self) -> ProjectStatus:
-        """Génère un rapport de statut complet."""
-        screens = self.check_screens_coverage()
-        integrations = self.check_integrations()
+        """Génère un rapport de statut complet.
+
+        L'index est construit d'abord (toutes les vérifications le lisent),
+        puis les vérifications s'exécutent en parallèle ; une vérification en
+        échec ou trop lente est rapportée dans ``checks`` avec sa valeur de repli.
+        """
+        timer = self.timer
+        with timer.phase("project_index"):
+            index = self.index
+        
+        scheduler = CheckScheduler(
+            jobs=self.jobs, timeout=self.check_timeout, timer=timer, memo=self.memo,
+            fingerprint=lambda check: fingerprint_inputs(index, check.inputs, check.func, check.sources)
+        )
+        for check in self.checks:
+            scheduler.register(check)
+        outcomes = scheduler.run()
+        
+        screens = outcomes["check_screens_coverage"].value
+        integrations = outcomes["check_integrations"].value
+        test_coverage = outcomes["check_tests"].value
+        coverage = outcomes["check_coverage"].value
+        test_coverage_source = "estimation"
+        if coverage.get("total", {}).get("line_rate") is not None:
+            test_coverage = coverage["total"]["line_rate"]
+            test_coverage_source = "lcov"
+        documentation_complete = outcomes["check_documentation"].value
+        index_coverage = outcomes["check_index_coverage"].value
+        anti_patterns = outcomes["check_anti_patterns"].value
+        asset_budget = outcomes["check_asset_budget"].value
+        unused_assets = outcomes["check_unused_assets"].value
+        timings_outcome = outcomes.get("check_test_timings")
+        test_timings = timings_outcome.value if timings_outcome else {}
         
         total = len(screens)
         implemented = sum(1 for s in screens if s.status == "implemented")
@@ -258,12 +466,25 @@ class OverseerStatusChecker:
             timestamp=datetime.now().isoformat(),
             screens_coverage=screens,
             integrations=integrations,
-            test_coverage=self.check_tests(),
-            documentation_complete=self.check_documentation(),
+            test_coverage=test_coverage,
+            test_coverage_source=test_coverage_source,
+            documentation_complete=documentation_complete,
             total_screens=total,
             implemented_screens=implemented,
             partial_screens=partial,
-            missing_screens=missing
+            missing_screens=missing,
+            index_cache=dict(index.cache_stats),
+            performance=timer.summary(),
+            checks={name: outcome.summary() for name, outcome in outcomes.items()},
+            plugin_results={
+                name: outcome.value for name, outcome in outcomes.items() if name not in BUILTIN_CHECKS
+            },
+            coverage=coverage,
+            test_timings=test_timings,
+            index_coverage=index_coverage,
+            anti_patterns=anti_patterns,
+            asset_budget=asset_budget,
+            unused_assets=unused_assets
         )
     
     def generate_markdown_report(self, status: ProjectStatus) -> str:
@@ -279,9 +500,13 @@ class OverseerStatusChecker:
         report.append(f"- **Screens implémentés** : {status.implemented_screens}/{status.total_screens} ({coverage_pct:.1f}%)\n")
         report.append(f"- **Screens partiels** : {status.partial_screens}\n")
         report.append(f"- **Screens manquants** : {status.missing_screens}\n")
-        report.append(f"- **Couverture tests** : {status.test_coverage:.1f}%\n")
+        report.append(f"- **Couverture tests** : {status.test_coverage:.1f}% ({status.test_coverage_source})\n")
         report.append(f"- **Documentation** : {status.documentation_complete:.1f}%\n\n")
         
+        # Évolution depuis le rapport de référence
+        if status.delta:
+            report.append(self.generate_delta_section(status.delta))
+        
         # Intégrations
         report.append("## 🔌 Intégrations\n\n")
         report.append("| Intégration | Statut | Configuration | Notes |\n")
@@ -301,6 +526,40 @@ class OverseerStatusChecker:
         
         report.append("\n")
         
+        # Couverture mesurée par feature
+        if status.coverage.get("features"):
+            report.append("## 🧪 Couverture par Feature\n\n")
+            report.append(f"*Source : {', '.join(status.coverage.get('sources', []))} "
+                          f"({status.coverage.get('files', 0)} fichiers)*\n\n")
+            report.append("| Feature | Lignes | Branches | Lignes couvertes |\n")
+            report.append("|---------|--------|----------|------------------|\n")
+            for feature, counts in status.coverage["features"].items():
+                lines = f"{counts['line_rate']:.1f}%" if counts["line_rate"] is not None else "-"
+                branches = f"{counts['branch_rate']:.1f}%" if counts["branch_rate"] is not None else "-"
+                report.append(f"| {feature} | {lines} | {branches} | "
+                              f"{counts['lines_hit']}/{counts['lines_found']} |\n")
+            report.append("\n")
+        
+        # Index Supabase
+        if status.index_coverage.get("tables"):
+            report.append(self.generate_index_coverage_section(status.index_coverage))
+        
+        # Anti-patterns de performance
+        if status.anti_patterns.get("total"):
+            report.append(self.generate_anti_patterns_section(status.anti_patterns))
+        
+        # Poids des assets
+        if status.asset_budget.get("directories"):
+            report.append(self.generate_asset_budget_section(status.asset_budget))
+        
+        # Assets et clés inutilisés
+        if status.unused_assets.get("files"):
+            report.append(self.generate_unused_assets_section(status.unused_assets))
+        
+        # Tests les plus lents
+        if status.test_timings.get("slowest"):
+            report.append(self.generate_test_timings_section(status.test_timings))
+        
         # Screens par priorité
         report.append("## 🎯 Screens par Priorité\n\n")
         
@@ -355,15 +614,273 @@ class OverseerStatusChecker:
             for integration in missing_integrations:
                 report.append(f"  - {integration.name}\n")
         
+        # Vérifications en échec
+        failed_checks = {
+            name: check for name, check in status.checks.items() if check.get("status") != "ok"
+        }
+        if failed_checks:
+            report.append("\n## ❌ Vérifications en échec\n\n")
+            report.append("| Vérification | Statut | Détail |\n")
+            report.append("|--------------|--------|--------|\n")
+            for name, check in failed_checks.items():
+                report.append(f"| {name} | {check['status']} | {check.get('error', '-')} |\n")
+        
+        # Performance
+        if status.performance:
+            report.append("\n## ⏱️ Performance\n\n")
+            report.append("| Phase | Temps (ms) | CPU (ms) | stat | listdir | open |\n")
+            report.append("|-------|------------|----------|------|---------|------|\n")
+            for phase, metrics in status.performance.items():
+                calls = " | ".join(str(metrics.get(kind, 0)) for kind in FS_CALLS)
+                report.append(
+                    f"| {phase} | {metrics.get('wall_ms', 0):.1f} | {metrics.get('cpu_ms', 0):.1f} | {calls} |\n"
+                )
+        
+        if status.index_cache:
+            report.append(
+                f"\n*Index des fichiers : {status.index_cache.get('hits', 0)} dossiers repris du cache, "
+                f"{status.index_cache.get('misses', 0)} relus*\n"
+            )
+        if status.checks:
+            cached = sum(1 for check in status.checks.values() if check.get("cached"))
+            report.append(
+                f"*Vérifications : {cached} reprises du cache (entrées inchangées), "
+                f"{len(status.checks) - cached} recalculées*\n"
+            )
+        
         report.append("\n---\n\n")
         report.append(f"*Rapport généré automatiquement le {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}*\n")
         
         return "".join(report)
     
+    def generate_index_coverage_section(self, coverage: Dict[str, Any]) -> str:
+        """Section markdown des colonnes filtrées ou triées sans index."""
+        section = ["## 🗂️ Index Supabase\n\n"]
+        section.append(f"*{coverage['migrations']} migrations, {coverage['queries']} requêtes analysées*\n\n")
+        section.append("| Table | Index | Requêtes | Sans index |\n")
+        section.append("|-------|-------|----------|------------|\n")
+        for name, counts in coverage["tables"].items():
+            flagged = f"⚠️ {counts['flagged']}" if counts["flagged"] else "✅ 0"
+            section.append(f"| {name} | {counts['indexes']} | {counts['queries']} | {flagged} |\n")
+        section.append("\n")
+        
+        if coverage.get("findings"):
+            section.append("| Colonne | Filtre | Emplacement | Gravité | Notes |\n")
+            section.append("|---------|--------|-------------|---------|-------|\n")
+            for finding in coverage["findings"]:
+                emoji = "🔴" if finding["severity"] == "high" else "🟡"
+                section.append(f"| {finding['table']}.{finding['column']} | `{finding['operation']}` | "
+                               f"`{finding['location']}` | {emoji} {finding['severity']} | "
+                               f"{finding['note'] or '-'} |\n")
+            section.append("\n")
+        return "".join(section)
+    
+    def generate_anti_patterns_section(self, anti_patterns: Dict[str, Any]) -> str:
+        """Section markdown des anti-patterns de performance Flutter par feature."""
+        rules = [rule for rule, count in anti_patterns["rules"].items() if count]
+        section = ["## 🐌 Performance Flutter\n\n"]
+        section.append(f"*{anti_patterns['total']} anti-patterns dans {anti_patterns['files']} fichiers Dart*\n\n")
+        section.append("| Feature | " + " | ".join(f"`{rule}`" for rule in rules) + " | Total |\n")
+        section.append("|---------|" + "".join("------|" for _ in rules) + "-------|\n")
+        for name, feature in anti_patterns["features"].items():
+            counts = " | ".join(str(feature["rules"].get(rule, 0)) for rule in rules)
+            section.append(f"| {name} | {counts} | {feature['total']} |\n")
+        section.append("\n")
+        
+        notable = [f for f in anti_patterns.get("findings", []) if f["severity"] != "low"]
+        if notable:
+            section.append("| Emplacement | Règle | Gravité | Détail |\n")
+            section.append("|-------------|-------|---------|--------|\n")
+            for finding in notable:
+                emoji = "🔴" if finding["severity"] == "high" else "🟡"
+                section.append(f"| `{finding['location']}` | {finding['rule']} | "
+                               f"{emoji} {finding['severity']} | {finding['message']} |\n")
+            section.append("\n")
+        section.append("*Règles : " + " ; ".join(
+            f"`{rule}` {ANTI_PATTERN_RULES[rule]}" for rule in rules) + "*\n\n")
+        return "".join(section)
+    
+    def generate_asset_budget_section(self, assets: Dict[str, Any]) -> str:
+        """Section markdown du poids des assets et des dépassements de budget."""
+        totals = assets["totals"]
+        section = ["## 📦 Poids des Assets\n\n"]
+        section.append(f"*Embarqués (`{PUBSPEC_FILE}`) : {totals['shipped_files']} fichiers, "
+                       f"{format_size(totals['shipped_bytes'])} ; images décodées : "
+                       f"{format_size(totals['shipped_decoded_bytes'])} — budgets : `{assets['budget_file']}`*\n\n")
+        section.append("| Dossier | Fichiers | Taille | Embarqué | Images décodées | Dépassements |\n")
+        section.append("|---------|----------|--------|----------|-----------------|--------------|\n")
+        for name, entry in assets["directories"].items():
+            flagged = f"⚠️ {entry['violations']}" if entry["violations"] else "✅ 0"
+            section.append(f"| `{name}` | {entry['files']} | {format_size(entry['bytes'])} | "
+                           f"{format_size(entry['shipped_bytes'])} | {format_size(entry['decoded_bytes'])} | "
+                           f"{flagged} |\n")
+        section.append("\n")
+        
+        if assets.get("violations"):
+            section.append("| Fichier | Règle | Valeur | Gravité |\n")
+            section.append("|---------|-------|--------|---------|\n")
+            for violation in assets["violations"]:
+                emoji = "🔴" if violation["severity"] == "high" else "🟡"
+                section.append(f"| `{violation['path']}` | {violation['rule']} | "
+                               f"{format_violation(violation)} | {emoji} {violation['severity']} |\n")
+            section.append("\n")
+        return "".join(section)
+    
+    def generate_unused_assets_section(self, unused: Dict[str, Any]) -> str:
+        """Section markdown des assets et clés de traduction inutilisés."""
+        assets, keys = unused["assets"], unused["keys"]
+        section = ["## 🧹 Assets et Clés Inutilisés\n\n"]
+        section.append(f"*{unused['files']} fichiers Dart parcourus, {assets['total']} assets, "
+                       f"{keys['total']} clés dans {len(keys['locales'])} locales*\n\n")
+        section.append(f"**Assets inutilisés** : {len(assets['unused'])} "
+                       f"({format_size(assets['unused_bytes'])})\n\n")
+        for path in assets["unused"]:
+            section.append(f"- `{path}`\n")
+        if assets["unused"]:
+            section.append("\n")
+        if keys["unused"]:
+            section.append(f"**Clés inutilisées** : {len(keys['unused'])}\n\n")
+            section.append(", ".join(f"`{key}`" for key in keys["unused"]) + "\n\n")
+        if keys["missing"]:
+            section.append("| Locale | Clés absentes |\n")
+            section.append("|--------|---------------|\n")
+            for locale, missing in keys["missing"].items():
+                section.append(f"| {locale} | {', '.join(f'`{key}`' for key in missing)} |\n")
+            section.append("\n")
+        return "".join(section)
+    
+    def generate_test_timings_section(self, timings: Dict[str, Any]) -> str:
+        """Section markdown des tests les plus lents et des régressions."""
+        section = ["## 🐢 Tests les plus lents\n\n"]
+        section.append(f"*{timings['total_tests']} tests ({timings['failed']} en échec, "
+                       f"{timings['skipped']} ignorés) en {timings['wall_ms'] / 1000:.1f} s*\n\n")
+        section.append("| Test | Fichier | Durée | Résultat |\n")
+        section.append("|------|---------|-------|----------|\n")
+        for timing in timings["slowest"]:
+            section.append(f"| {timing['name']} | `{timing['file']}` | "
+                           f"{timing['duration_ms']:.0f} ms | {timing['result']} |\n")
+        section.append("\n")
+        
+        section.append("| Fichier | Tests | Durée | Chargement |\n")
+        section.append("|---------|-------|-------|------------|\n")
+        for totals in timings.get("slowest_files", []):
+            section.append(f"| `{totals['file']}` | {totals['tests']:.0f} | "
+                           f"{totals['duration_ms']:.0f} ms | {totals['load_ms']:.0f} ms |\n")
+        section.append("\n")
+        
+        regressions = timings.get("regressions") or {}
+        if regressions.get("files") or regressions.get("tests"):
+            section.append(f"**Régressions depuis l'exécution précédente** "
+                           f"({regressions['wall_ms_delta'] / 1000:+.1f} s au total) :\n\n")
+            for item in regressions.get("files", []):
+                section.append(f"- ⚠️ `{item['file']}` : {item['before_ms']:.0f} → {item['after_ms']:.0f} ms\n")
+            for item in regressions.get("tests", [])[:DEFAULT_TOP]:
+                section.append(f"- ⚠️ {item['test']} : {item['before_ms']:.0f} → {item['after_ms']:.0f} ms\n")
+            section.append("\n")
+        return "".join(section)
+    
+    def generate_delta_section(self, delta: Dict[str, Any]) -> str:
+        """Section markdown des différences avec le rapport de référence."""
+        section = [f"## 🔀 Évolution depuis `{delta['ref']}`\n\n"]
+        changes = [
+            (label, name, change)
+            for label, key in (("Métrique", "metrics"), ("Screen", "screens"),
+                               ("Intégration", "integrations"), ("Vérification", "checks"))
+            for name, change in delta.get(key, {}).items()
+        ]
+        if not changes:
+            section.append("Aucun changement.\n\n")
+            return "".join(section)
+        section.append("| Élément | Nom | Avant | Après |\n")
+        section.append("|---------|-----|-------|-------|\n")
+        def cell(value: Any) -> str:
+            if value is None:
+                return "-"
+            return f"{value:.1f}" if isinstance(value, float) else str(value)
+        
+        for label, name, change in changes:
+            before, after = cell(change["before"]), cell(change["after"])
+            section.append(f"| {label} | `{name}` | {before} | {after} |\n")
+        section.append("\n")
+        return "".join(section)
+    
     def generate_json_report(self, status: ProjectStatus) -> str:
         """Génère un rapport JSON."""
         return json.dumps(asdict(status), indent=2, ensure_ascii=False)
 
+DELTA_METRICS = (
+    "total_screens", "implemented_screens", "partial_screens", "missing_screens",
+    "test_coverage", "documentation_complete",
+)
+# Totaux de ``asset_budget`` suivis d'un rapport à l'autre (clé ``assets.<total>``)
+DELTA_ASSET_TOTALS = ("bytes", "shipped_bytes", "shipped_decoded_bytes", "shipped_files")
+
+
+def _delta_metrics(report: Dict[str, Any]) -> Dict[str, Any]:
+    """Métriques comparées par ``compute_delta``."""
+    metrics = {key: report.get(key) for key in DELTA_METRICS}
+    totals = (report.get("asset_budget") or {}).get("totals", {})
+    metrics.update({f"assets.{key}": totals.get(key) for key in DELTA_ASSET_TOTALS})
+    return metrics
+
+
+def _diff_values(before: Dict[str, Any], after: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+    """{nom: {before, after}} pour chaque nom dont la valeur diffère (None = absent)."""
+    return {
+        name: {"before": before.get(name), "after": after.get(name)}
+        for name in sorted(set(before) | set(after))
+        if before.get(name) != after.get(name)
+    }
+
+
+def compute_delta(previous: Dict[str, Any], current: Dict[str, Any], ref: str) -> Dict[str, Any]:
+    """Différences entre deux rapports JSON (métriques, screens, intégrations, vérifications)."""
+    def statuses(report: Dict[str, Any], key: str, name_key: str) -> Dict[str, str]:
+        return {item[name_key]: item.get("status") for item in report.get(key, [])}
+
+    return {
+        "ref": ref,
+        "previous_timestamp": previous.get("timestamp"),
+        "metrics": _diff_values(_delta_metrics(previous), _delta_metrics(current)),
+        "screens": _diff_values(
+            statuses(previous, "screens_coverage", "stitch_name"),
+            statuses(current, "screens_coverage", "stitch_name"),
+        ),
+        "integrations": _diff_values(
+            statuses(previous, "integrations", "name"),
+            statuses(current, "integrations", "name"),
+        ),
+        "checks": _diff_values(
+            {name: check.get("status") for name, check in previous.get("checks", {}).items()},
+            {name: check.get("status") for name, check in current.get("checks", {}).items()},
+        ),
+    }
+
+
+def load_reference_report(ref: str, project_root: Path, json_path: Path) -> Optional[Dict[str, Any]]:
+    """Charge le rapport JSON de référence.
+
+    ``ref`` vide : le rapport JSON actuel (avant réécriture) ; chemin d'un
+    fichier existant : ce fichier ; sinon une référence git (``git show
+    <ref>:<rapport JSON>``).
+    """
+    candidate = json_path if not ref else Path(ref)
+    if not ref or candidate.is_file():
+        try:
+            return json.loads(candidate.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+    try:
+        rel_path = json_path.resolve().relative_to(project_root.resolve()).as_posix()
+        result = subprocess.run(
+            ["git", "show", f"{ref}:{rel_path}"],
+            cwd=project_root, capture_output=True, text=True, encoding="utf-8", check=True,
+        )
+        return json.loads(result.stdout)
+    except (OSError, ValueError, subprocess.CalledProcessError):
+        return None
+
+
 def main():
     """Point d'entrée principal."""
     parser = argparse.ArgumentParser(description="Outil de suivi automatique pour l'Overseer")
@@ -385,13 +902,61 @@ def main():
         default="markdown",
         help="Format de sortie"
     )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Ignore les caches (.cache/project_index.json, .cache/overseer_checks.json)"
+    )
+    parser.add_argument(
+        "--lcov",
+        nargs="+",
+        default=DEFAULT_LCOV_FILES,
+        help="Fichiers lcov.info de flutter test --coverage (défaut : coverage/lcov.info)"
+    )
+    parser.add_argument(
+        "--test-events",
+        type=str,
+        default=None,
+        help="Flux d'événements de flutter test --machine (fichier, ou - pour l'entrée "
+             "standard) : tests les plus lents et régressions"
+    )
+    parser.add_argument(
+        "--since-ref",
+        nargs="?",
+        const="",
+        default=None,
+        help="Ajoute l'évolution depuis un rapport JSON de référence : fichier, "
+             "référence git (ex: origin/main) ou, sans valeur, le rapport JSON actuel"
+    )
+    parser.add_argument(
+        "--jobs", "-j",
+        type=int,
+        default=DEFAULT_CHECK_JOBS,
+        help=f"Vérifications exécutées en parallèle (défaut : {DEFAULT_CHECK_JOBS})"
+    )
+    parser.add_argument(
+        "--check-timeout",
+        type=float,
+        default=DEFAULT_CHECK_TIMEOUT,
+        help=f"Délai maximal d'une vérification, en secondes (défaut : {DEFAULT_CHECK_TIMEOUT:g})"
+    )
+    parser.add_argument(
+        "--profile",
+        type=str,
+        default=None,
+        help="Profile la génération du rapport : trace Chrome si le fichier se termine "
+             "par .json, statistiques cProfile (pstats) sinon"
+    )
     
     args = parser.parse_args()
     
     project_root = Path(__file__).parent.parent
-    checker = OverseerStatusChecker(project_root)
+    checker = OverseerStatusChecker(
+        project_root, use_cache=not args.no_cache,
+        jobs=max(args.jobs, 1), check_timeout=args.check_timeout, lcov_files=args.lcov,
+        test_events=args.test_events
+    )
     
-    import sys
     # Configurer l'encodage UTF-8 pour la sortie
     if sys.stdout.encoding != 'utf-8':
         sys.stdout.reconfigure(encoding='utf-8') if hasattr(sys.stdout, 'reconfigure') else None
@@ -401,27 +966,84 @@ def main():
     except UnicodeEncodeError:
         print("Verification du statut du projet...")
     
-    status = checker.generate_status_report()
+    if args.profile and not args.profile.endswith(".json"):
+        import cProfile
+        profiler = cProfile.Profile()
+        status = profiler.runcall(checker.generate_status_report)
+        profiler.dump_stats(args.profile)
+        print(f"Profil cProfile sauvegarde : {args.profile}")
+    else:
+        status = checker.generate_status_report()
+        if args.profile:
+            Path(args.profile).write_text(
+                json.dumps(checker.timer.chrome_trace(), indent=2), encoding="utf-8"
+            )
+            print(f"Trace Chrome sauvegardee : {args.profile}")
     
-    if args.format in ["markdown", "both"]:
-        report = checker.generate_markdown_report(status)
-        output_path = project_root / args.output
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-        output_path.write_text(report, encoding="utf-8")
-        print(f"Rapport markdown sauvegarde : {output_path}")
+    if not args.no_cache:
+        checker.index.save()
+        checker.memo.save()
     
+    output_path = project_root / args.output
+    json_path = project_root / (args.json or str(Path(args.output).with_suffix(".json")))
+    
+    if args.since_ref is not None:
+        previous = load_reference_report(args.since_ref, project_root, json_path)
+        if previous is None:
+            print(f"Rapport de reference introuvable : {args.since_ref or json_path}")
+        else:
+            status.delta = compute_delta(previous, asdict(status), args.since_ref or "rapport precedent")
+            changes = sum(len(status.delta[key]) for key in ("metrics", "screens", "integrations", "checks"))
+            print(f"Evolution depuis {status.delta['ref']} : {changes} changement(s)")
+    
+    # Toutes les vérifications reprises du cache : les rapports existants sont à jour
+    outputs = []
+    if args.format in ["markdown", "both"]:
+        outputs.append(output_path)
     if args.format in ["json", "both"]:
-        json_output = args.json or str(Path(args.output).with_suffix(".json"))
-        json_path = project_root / json_output
-        json_path.parent.mkdir(parents=True, exist_ok=True)
-        json_path.write_text(checker.generate_json_report(status), encoding="utf-8")
-        print(f"Rapport JSON sauvegarde : {json_path}")
+        outputs.append(json_path)
+    unchanged = (
+        not status.delta
+        and status.checks
+        and all(check.get("cached") for check in status.checks.values())
+        and all(path.exists() for path in outputs)
+    )
+    
+    if unchanged:
+        print("Entrees inchangees : rapports existants conserves")
+    else:
+        if args.format in ["markdown", "both"]:
+            report = checker.generate_markdown_report(status)
+            output_path.parent.mkdir(parents=True, exist_ok=True)
+            output_path.write_text(report, encoding="utf-8")
+            print(f"Rapport markdown sauvegarde : {output_path}")
+        
+        if args.format in ["json", "both"]:
+            json_path.parent.mkdir(parents=True, exist_ok=True)
+            json_path.write_text(checker.generate_json_report(status), encoding="utf-8")
+            print(f"Rapport JSON sauvegarde : {json_path}")
     
     # Afficher un résumé
     print("\nResume :")
     print(f"  Screens : {status.implemented_screens}/{status.total_screens} implementes ({status.implemented_screens*100//max(status.total_screens,1)}%)")
     print(f"  Tests : {status.test_coverage:.1f}%")
+    if status.test_timings.get("slowest"):
+        slowest = status.test_timings["slowest"][0]
+        print(f"  Test le plus lent : {slowest['name']} ({slowest['duration_ms']:.0f} ms)")
     print(f"  Documentation : {status.documentation_complete:.1f}%")
+    if status.index_coverage.get("findings"):
+        print(f"  Colonnes Supabase sans index : {len(status.index_coverage['findings'])}")
+    if status.anti_patterns.get("total"):
+        print(f"  Anti-patterns de performance : {status.anti_patterns['total']}")
+    if status.asset_budget.get("totals"):
+        shipped = [v for v in status.asset_budget["violations"] if v["shipped"]]
+        print(f"  Assets embarques : {format_size(status.asset_budget['totals']['shipped_bytes'])} "
+              f"({len(shipped)} hors budget)")
+    elif status.checks.get("check_asset_budget", {}).get("status") == "error":
+        print(f"  Budget des assets : verification ignoree ({status.checks['check_asset_budget']['error']})")
+    if status.unused_assets.get("files"):
+        print(f"  Assets / cles inutilises : {len(status.unused_assets['assets']['unused'])} / "
+              f"{len(status.unused_assets['keys']['unused'])}")
     print(f"  Integrations actives : {sum(1 for i in status.integrations if i.status == 'active')}/{len(status.integrations)}")
 
 if __name__ == "__main__":
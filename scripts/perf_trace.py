@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""
+Instrumentation légère des phases d'un outil de scripts/.
+
+- ``PhaseTimer.phase(name)`` mesure le temps réel et le temps CPU du thread
+  courant d'un bloc de code, ainsi que le nombre d'appels au système de
+  fichiers (stat, listdir/scandir, open) faits par ce thread pendant le bloc.
+- ``PhaseTimer.chrome_trace()`` exporte les phases au format Chrome Trace
+  (chrome://tracing, Perfetto).
+
+Le comptage des appels repose sur les audit hooks de Python (open, listdir,
+scandir) et sur un wrapper de ``os.stat`` / ``os.lstat`` installé le temps
+de la mesure ; les compteurs sont par thread.
+
+Usage:
+    timer = PhaseTimer()
+    with timer.phase("check_tests"):
+        ...
+    timer.summary()
+"""
+
+import os
+import sys
+import time
+import threading
+from contextlib import contextmanager
+from typing import Dict, Iterator, List
+
+FS_CALLS = ("stat", "listdir", "open")
+
+_AUDIT_EVENTS = {
+    "open": "open",
+    "os.listdir": "listdir",
+    "os.scandir": "listdir",
+}
+
+
+class FsCallCounter:
+    """Compteurs par thread des appels au système de fichiers."""
+
+    def __init__(self):
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._active = 0
+        self._hook_installed = False
+        self._original_stat = None
+        self._original_lstat = None
+
+    def _counts(self) -> Dict[str, int]:
+        counts = getattr(self._local, "counts", None)
+        if counts is None:
+            counts = self._local.counts = dict.fromkeys(FS_CALLS, 0)
+        return counts
+
+    def snapshot(self) -> Dict[str, int]:
+        """Compteurs actuels du thread courant."""
+        return dict(self._counts())
+
+    def _audit(self, event: str, args):
+        kind = _AUDIT_EVENTS.get(event)
+        if kind is not None and self._active:
+            self._counts()[kind] += 1
+
+    def _wrap(self, func):
+        def counted(*args, **kwargs):
+            self._counts()["stat"] += 1
+            return func(*args, **kwargs)
+        counted.__wrapped__ = func
+        return counted
+
+    def install(self):
+        """Active le comptage (réentrant)."""
+        with self._lock:
+            if not self._hook_installed:
+                # Un audit hook ne peut pas être retiré : il est désactivé via _active
+                sys.addaudithook(self._audit)
+                self._hook_installed = True
+            if self._active == 0:
+                self._original_stat, self._original_lstat = os.stat, os.lstat
+                os.stat = self._wrap(os.stat)
+                os.lstat = self._wrap(os.lstat)
+            self._active += 1
+
+    def uninstall(self):
+        """Désactive le comptage lorsque plus aucune mesure n'est en cours."""
+        with self._lock:
+            self._active -= 1
+            if self._active == 0:
+                os.stat, os.lstat = self._original_stat, self._original_lstat
+
+
+FS_COUNTER = FsCallCounter()
+
+
+class PhaseTimer:
+    """Chronomètre des phases d'exécution."""
+
+    def __init__(self):
+        self.phases: List[Dict] = []
+        self._origin = time.perf_counter()
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """Mesure un bloc : temps réel, temps CPU du thread et appels fichiers."""
+        FS_COUNTER.install()
+        before = FS_COUNTER.snapshot()
+        start_wall = time.perf_counter()
+        start_cpu = time.thread_time()
+        try:
+            yield
+        finally:
+            wall = time.perf_counter() - start_wall
+            cpu = time.thread_time() - start_cpu
+            after = FS_COUNTER.snapshot()
+            FS_COUNTER.uninstall()
+            record = {
+                "name": name,
+                "start_ms": round((start_wall - self._origin) * 1000, 3),
+                "wall_ms": round(wall * 1000, 3),
+                "cpu_ms": round(cpu * 1000, 3),
+                "thread": threading.get_ident(),
+            }
+            record.update({kind: after[kind] - before[kind] for kind in FS_CALLS})
+            with self._lock:
+                self.phases.append(record)
+
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        """Mesures par phase, dans l'ordre de démarrage."""
+        return {
+            phase["name"]: {
+                key: value for key, value in phase.items()
+                if key not in ("name", "start_ms", "thread")
+            }
+            for phase in sorted(self.phases, key=lambda p: p["start_ms"])
+        }
+
+    def chrome_trace(self) -> Dict:
+        """Phases au format Chrome Trace Event (événements complets « X »)."""
+        pid = os.getpid()
+        events = []
+        for phase in self.phases:
+            events.append({
+                "name": phase["name"],
+                "cat": "phase",
+                "ph": "X",
+                "ts": round(phase["start_ms"] * 1000),
+                "dur": round(phase["wall_ms"] * 1000),
+                "pid": pid,
+                "tid": phase["thread"],
+                "args": {key: phase[key] for key in ("cpu_ms",) + FS_CALLS},
+            })
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
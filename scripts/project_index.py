@@ -0,0 +1,221 @@
+#!/usr/bin/env python3
+"""
+Index partagé des fichiers du projet pour les outils de scripts/.
+
+Le projet est parcouru une seule fois (en ignorant .git, build, node_modules,
+etc.) et les fichiers sont rangés dans trois tables :
+- nom de fichier -> chemins
+- suffixe -> chemins
+- dossier -> (sous-dossiers, fichiers)
+
+Toutes les recherches ultérieures se font en mémoire, sans toucher au disque.
+
+L'index peut être persisté dans ``.cache/project_index.json``. Au lancement
+suivant, chaque dossier n'est relu que si son mtime a changé (un ajout, une
+suppression ou un renommage modifie le mtime du dossier parent) : sans
+changement, le parcours se réduit à un ``stat`` par dossier.
+
+Usage:
+    from project_index import ProjectIndex
+    index = ProjectIndex.load(project_root)   # ou ProjectIndex.build(...)
+    index.files_named("home_screen.dart")
+    index.save()
+"""
+
+import os
+import json
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Set, Tuple
+
+# Dossiers jamais parcourus (en plus des dossiers cachés)
+IGNORED_DIRS: Set[str] = {
+    "node_modules",
+    "build",
+    "dist",
+    "Pods",
+    "__pycache__",
+    "venv",
+}
+
+
+def is_ignored_dir(name: str) -> bool:
+    """Indique si un dossier doit être exclu du parcours."""
+    return name.startswith('.') or name in IGNORED_DIRS
+
+
+DEFAULT_CACHE_FILE = Path(".cache") / "project_index.json"
+CACHE_VERSION = 1
+
+
+def list_dir(path: Path) -> Tuple[List[str], List[str]]:
+    """Liste un dossier : (sous-dossiers non ignorés, fichiers), triés."""
+    subdirs = []
+    files = []
+    with os.scandir(path) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                if not is_ignored_dir(entry.name):
+                    subdirs.append(entry.name)
+            else:
+                files.append(entry.name)
+    return sorted(subdirs), sorted(files)
+
+
+def iter_files(root: Path, suffix: str) -> Iterator[Path]:
+    """Fichiers ``*suffix`` sous ``root``, triés, sans descendre dans les dossiers ignorés."""
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = sorted(d for d in dirnames if not is_ignored_dir(d))
+        for name in sorted(filenames):
+            if name.endswith(suffix):
+                yield Path(dirpath) / name
+
+
+def _join(directory: str, name: str) -> str:
+    return f"{directory}/{name}" if directory else name
+
+
+class ProjectIndex:
+    """Index en mémoire de l'arborescence du projet."""
+
+    def __init__(self, root: Path):
+        self.root = root
+        self.by_name: Dict[str, List[str]] = {}
+        self.by_suffix: Dict[str, List[str]] = {}
+        self.by_top_suffix: Dict[Tuple[str, str], List[str]] = {}
+        self.dirs: Dict[str, Tuple[List[str], List[str]]] = {}
+        self.dir_mtimes: Dict[str, int] = {}
+        # Dossiers repris du cache (hits) ou relus sur disque (misses)
+        self.cache_stats: Dict[str, int] = {"hits": 0, "misses": 0}
+
+    @classmethod
+    def build(cls, root: Path) -> "ProjectIndex":
+        """Construit l'index en un seul parcours de ``root``."""
+        index = cls(root)
+        index._scan({})
+        return index
+
+    @classmethod
+    def load(cls, root: Path, cache_file: Optional[Path] = None) -> "ProjectIndex":
+        """Construit l'index en réutilisant le cache disque quand il est valide.
+
+        Seuls les dossiers dont le mtime a changé depuis la sauvegarde sont
+        relus ; un cache absent ou illisible équivaut à un ``build``.
+        """
+        cache_file = cache_file or root / DEFAULT_CACHE_FILE
+        cached: Dict[str, list] = {}
+        try:
+            with open(cache_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get("version") == CACHE_VERSION:
+                cached = data.get("dirs", {})
+        except (OSError, ValueError):
+            cached = {}
+        index = cls(root)
+        index._scan(cached)
+        return index
+
+    def save(self, cache_file: Optional[Path] = None):
+        """Écrit l'index dans le cache disque (écriture atomique)."""
+        cache_file = cache_file or self.root / DEFAULT_CACHE_FILE
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        data = {
+            "version": CACHE_VERSION,
+            "dirs": {
+                rel: [self.dir_mtimes[rel], subdirs, files]
+                for rel, (subdirs, files) in self.dirs.items()
+            },
+        }
+        tmp_file = cache_file.with_suffix(cache_file.suffix + ".tmp")
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False, separators=(",", ":"))
+        os.replace(tmp_file, cache_file)
+
+    def _scan(self, cached: Dict[str, list]):
+        """Parcourt l'arborescence en profondeur, dossier par dossier.
+
+        Un dossier présent dans ``cached`` avec le même mtime n'est pas relu ;
+        un dossier illisible (droits, disparu entre-temps) est ignoré.
+        """
+        stack = [""]
+        while stack:
+            rel_dir = stack.pop()
+            full_path = self.root / rel_dir if rel_dir else self.root
+            try:
+                mtime_ns = os.stat(full_path).st_mtime_ns
+                entry = cached.get(rel_dir)
+                if entry is not None and entry[0] == mtime_ns:
+                    subdirs, files = entry[1], entry[2]
+                    self.cache_stats["hits"] += 1
+                else:
+                    subdirs, files = list_dir(full_path)
+                    self.cache_stats["misses"] += 1
+            except OSError:
+                continue
+            self.dir_mtimes[rel_dir] = mtime_ns
+            self.add_directory(rel_dir, subdirs, files)
+            stack.extend(_join(rel_dir, d) for d in reversed(subdirs))
+
+    def add_directory(self, rel_dir: str, subdirs: List[str], files: List[str]):
+        """Enregistre le contenu d'un dossier dans les trois tables."""
+        self.dirs[rel_dir] = (subdirs, files)
+        top = rel_dir.split("/", 1)[0]
+        for name in files:
+            rel_path = _join(rel_dir, name)
+            self.by_name.setdefault(name, []).append(rel_path)
+            suffix = os.path.splitext(name)[1]
+            if suffix:
+                self.by_suffix.setdefault(suffix, []).append(rel_path)
+                self.by_top_suffix.setdefault((top, suffix), []).append(rel_path)
+
+    def path(self, rel_path: str) -> Path:
+        """Retourne le chemin complet d'un chemin relatif de l'index."""
+        return self.root / rel_path
+
+    def exists(self, rel_path: str) -> bool:
+        """Indique si un fichier ou dossier existe (chemin relatif POSIX)."""
+        rel_path = rel_path.strip("/")
+        if rel_path in self.dirs:
+            return True
+        parent, _, name = rel_path.rpartition("/")
+        entry = self.dirs.get(parent)
+        return entry is not None and name in entry[1]
+
+    def is_dir(self, rel_path: str) -> bool:
+        """Indique si un dossier indexé existe."""
+        return rel_path.strip("/") in self.dirs
+
+    def subdirs(self, rel_dir: str) -> List[str]:
+        """Sous-dossiers directs d'un dossier (noms)."""
+        return self.dirs.get(rel_dir.strip("/"), ([], []))[0]
+
+    def files(self, rel_dir: str) -> List[str]:
+        """Fichiers directs d'un dossier (noms)."""
+        return self.dirs.get(rel_dir.strip("/"), ([], []))[1]
+
+    def files_named(self, name: str, under: Optional[str] = None) -> List[str]:
+        """Chemins relatifs de tous les fichiers portant ce nom."""
+        return self._filter_under(self.by_name.get(name, []), under)
+
+    def files_with_suffix(self, suffix: str, under: Optional[str] = None) -> List[str]:
+        """Chemins relatifs de tous les fichiers ayant ce suffixe (ex: ``.dart``)."""
+        if under and "/" not in under.strip("/"):
+            return self.by_top_suffix.get((under.strip("/"), suffix), [])
+        return self._filter_under(self.by_suffix.get(suffix, []), under)
+
+    def files_under(self, rel_dir: str) -> List[str]:
+        """Chemins relatifs de tous les fichiers d'un dossier, récursivement (triés)."""
+        rel_dir = rel_dir.strip("/")
+        prefix = rel_dir + "/" if rel_dir else ""
+        return sorted(
+            _join(directory, name)
+            for directory, (_, files) in self.dirs.items()
+            if directory == rel_dir or directory.startswith(prefix)
+            for name in files
+        )
+
+    @staticmethod
+    def _filter_under(paths: List[str], under: Optional[str]) -> List[str]:
+        if not under:
+            return paths
+        prefix = under.strip("/") + "/"
+        return [p for p in paths if p.startswith(prefix)]
@@ -0,0 +1,407 @@
+#!/usr/bin/env python3
+"""
+Récupération des screens depuis l'API Stitch distante.
+
+Étape « fetch » de ``sync_stitch_screens.py`` : les fichiers distants sont
+téléchargés dans ``stitch_reservation_process_screen/<screen>/`` avant le
+scan local, qui produit ensuite le manifest et ``compare_manifests()``.
+
+- Connexions réutilisées (``requests.Session``, pool de ``jobs`` connexions)
+  et ``jobs`` téléchargements simultanés au plus.
+- Requêtes conditionnelles : l'ETag et le Last-Modified de chaque fichier sont
+  conservés dans le manifest (``code_etag``, ``code_http_modified``, ...) et
+  renvoyés en ``If-None-Match`` / ``If-Modified-Since`` ; un 304 ne
+  télécharge rien.
+- Réessais avec backoff exponentiel (et ``Retry-After``) sur erreurs réseau,
+  408/429/5xx.
+- Téléchargements en flux vers ``.cache/stitch-fetch/<screen>/<fichier>.part``,
+  repris avec ``Range`` + ``If-Range`` après une coupure (même d'une
+  exécution à l'autre), puis ``os.replace`` vers le fichier final.
+
+Contrat attendu de l'API (``STITCH_API_URL``) :
+    GET <base>/screens
+    -> {"screens": [{"name": "...", "files": {"code.html": <fichier>, "screen.png": <fichier>}}],
+        "next": <url de la page suivante, optionnelle>}
+    <fichier> = "url" ou {"url": "...", "sha256": "..."} (url relative à <base> acceptée)
+
+Usage:
+    STITCH_API_URL=https://... STITCH_API_KEY=... python scripts/sync_stitch_screens.py
+    python scripts/sync_stitch_screens.py --remote http://127.0.0.1:8765
+"""
+
+import os
+import sys
+import json
+import time
+import random
+import shutil
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from email.utils import parsedate_to_datetime
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import urljoin
+
+try:
+    import requests
+    from requests.adapters import HTTPAdapter
+except ImportError:  # seulement requis pour la synchronisation distante
+    requests = None
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from sync_stitch_screens import STITCH_SCREENS_DIR, calculate_file_hash
+
+REMOTE_FILES = (("code", "code.html"), ("screen", "screen.png"))
+PARTIAL_DIR = Path(".cache") / "stitch-fetch"
+DEFAULT_FETCH_JOBS = 8
+DEFAULT_RETRIES = 4
+DEFAULT_BACKOFF = 0.5
+MAX_BACKOFF = 30.0
+DEFAULT_TIMEOUT = 30.0
+CHUNK_SIZE = 64 * 1024
+RETRY_STATUSES = {408, 425, 429, 500, 502, 503, 504}
+
+
+class FetchError(Exception):
+    """Erreur définitive (réessais épuisés ou réponse inattendue)."""
+
+
+class _Retryable(Exception):
+    """Erreur temporaire : la requête peut être rejouée."""
+
+    def __init__(self, message: str, retry_after: Optional[float] = None):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+@dataclass
+class RemoteFile:
+    """Fichier d'un screen distant."""
+    screen: str
+    filename: str
+    prefix: str
+    url: str
+    sha256: Optional[str] = None
+
+
+@dataclass
+class FetchResult:
+    """Résultat du téléchargement d'un fichier."""
+    screen: str
+    filename: str
+    status: str  # fetched, resumed, not_modified, unchanged, failed
+    bytes: int = 0
+    attempts: int = 0
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    error: Optional[str] = None
+
+
+@dataclass
+class FetchSummary:
+    """Bilan de l'étape fetch, et validateurs HTTP à enregistrer dans le manifest."""
+    results: List[FetchResult] = field(default_factory=list)
+    validators: Dict[str, Dict[str, str]] = field(default_factory=dict)
+    remote_screens: List[str] = field(default_factory=list)
+    pruned: List[str] = field(default_factory=list)
+
+    def count(self, status: str) -> int:
+        return sum(1 for result in self.results if result.status == status)
+
+    @property
+    def failed(self) -> List[FetchResult]:
+        return [result for result in self.results if result.status == "failed"]
+
+
+def _retry_after(response) -> Optional[float]:
+    """Délai demandé par l'en-tête Retry-After (secondes ou date HTTP)."""
+    value = response.headers.get("Retry-After")
+    if not value:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        return max(parsedate_to_datetime(value).timestamp() - time.time(), 0.0)
+    except (TypeError, ValueError):
+        return None
+
+
+def _is_safe_name(name: str) -> bool:
+    """Nom de screen utilisable comme nom de dossier (pas de chemin ni de dossier caché)."""
+    return bool(name) and not name.startswith('.') and "/" not in name and "\\" not in name
+
+
+class StitchClient:
+    """Client HTTP de l'API Stitch : pool de connexions, réessais, reprise."""
+
+    def __init__(self, base_url: str, api_key: Optional[str] = None,
+                 jobs: int = DEFAULT_FETCH_JOBS, retries: int = DEFAULT_RETRIES,
+                 backoff: float = DEFAULT_BACKOFF, timeout: float = DEFAULT_TIMEOUT,
+                 partial_dir: Path = PARTIAL_DIR):
+        if requests is None:
+            raise RuntimeError("Le module 'requests' est requis : pip install requests")
+        self.base_url = base_url.rstrip("/") + "/"
+        self.jobs = max(jobs, 1)
+        self.retries = max(retries, 0)
+        self.backoff = backoff
+        self.timeout = timeout
+        self.partial_dir = partial_dir
+        self.session = requests.Session()
+        # Réessais gérés ici : un réessai de téléchargement doit reprendre au bon octet
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.jobs, max_retries=0)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        if api_key:
+            self.session.headers["Authorization"] = f"Bearer {api_key}"
+
+    def close(self):
+        self.session.close()
+
+    def _wait(self, attempt: int, retry_after: Optional[float] = None):
+        """Backoff exponentiel avec jitter, ou Retry-After s'il est plus long."""
+        delay = min(self.backoff * (2 ** attempt), MAX_BACKOFF)
+        delay = random.uniform(delay / 2, delay)
+        if retry_after is not None:
+            delay = max(delay, min(retry_after, MAX_BACKOFF))
+        time.sleep(delay)
+
+    def _get_json(self, url: str) -> Dict:
+        """GET JSON avec réessais."""
+        last_error = None
+        for attempt in range(self.retries + 1):
+            try:
+                response = self.session.get(url, timeout=self.timeout,
+                                            headers={"Accept": "application/json"})
+                if response.status_code in RETRY_STATUSES:
+                    raise _Retryable(f"HTTP {response.status_code}", _retry_after(response))
+                if response.status_code != 200:
+                    raise FetchError(f"{url} : HTTP {response.status_code}")
+                return response.json()
+            except (requests.ConnectionError, requests.Timeout, _Retryable) as e:
+                last_error = e
+                if attempt < self.retries:
+                    self._wait(attempt, getattr(e, "retry_after", None))
+        raise FetchError(f"{url} : {last_error}")
+
+    def list_screens(self) -> List[Tuple[str, List[RemoteFile]]]:
+        """Liste les screens distants et leurs fichiers (pages suivies)."""
+        screens = []
+        url = urljoin(self.base_url, "screens")
+        while url:
+            data = self._get_json(url)
+            items = data.get("screens", []) if isinstance(data, dict) else data
+            for item in items:
+                name = item.get("name", "")
+                if not _is_safe_name(name):
+                    print(f"⚠️  Screen distant ignoré (nom invalide) : {name!r}")
+                    continue
+                files = []
+                for prefix, filename in REMOTE_FILES:
+                    spec = item.get("files", {}).get(filename)
+                    if spec is None:
+                        continue
+                    if isinstance(spec, str):
+                        spec = {"url": spec}
+                    files.append(RemoteFile(name, filename, prefix,
+                                            urljoin(url, spec["url"]), spec.get("sha256")))
+                screens.append((name, files))
+            next_url = data.get("next") if isinstance(data, dict) else None
+            url = urljoin(url, next_url) if next_url else None
+        return screens
+
+    def _partial_paths(self, remote: RemoteFile) -> Tuple[Path, Path]:
+        part = self.partial_dir / remote.screen / f"{remote.filename}.part"
+        return part, part.with_name(f"{remote.filename}.part.json")
+
+    def download(self, remote: RemoteFile, dest: Path,
+                 validators: Optional[Dict[str, str]] = None) -> FetchResult:
+        """Télécharge ``remote`` vers ``dest`` (conditionnel, réessayé, repris).
+
+        ``validators`` contient l'ETag / Last-Modified de la version locale ;
+        ils ne sont envoyés que si ``dest`` existe.
+        """
+        validators = validators or {}
+        part, meta_file = self._partial_paths(remote)
+        result = FetchResult(remote.screen, remote.filename, "failed")
+        resumed = False
+
+        for attempt in range(self.retries + 1):
+            result.attempts = attempt + 1
+            headers = {}
+            if dest.exists():
+                if validators.get("etag"):
+                    headers["If-None-Match"] = validators["etag"]
+                if validators.get("last_modified"):
+                    headers["If-Modified-Since"] = validators["last_modified"]
+
+            offset = part.stat().st_size if part.exists() else 0
+            meta = {}
+            if offset:
+                try:
+                    meta = json.loads(meta_file.read_text(encoding="utf-8"))
+                except (OSError, ValueError):
+                    meta = {}
+                if_range = meta.get("etag") or meta.get("last_modified")
+                if if_range and meta.get("url") == remote.url:
+                    headers["Range"] = f"bytes={offset}-"
+                    headers["If-Range"] = if_range
+                else:
+                    offset = 0
+
+            try:
+                with self.session.get(remote.url, headers=headers, stream=True,
+                                      timeout=self.timeout) as response:
+                    status = response.status_code
+                    if status == 304:
+                        result.status = "not_modified"
+                        result.etag = response.headers.get("ETag") or validators.get("etag")
+                        result.last_modified = (response.headers.get("Last-Modified")
+                                                or validators.get("last_modified"))
+                        return result
+                    if status in RETRY_STATUSES:
+                        raise _Retryable(f"HTTP {status}", _retry_after(response))
+                    if status == 416:
+                        # Partiel invalide (fichier distant raccourci) : on repart de zéro
+                        part.unlink(missing_ok=True)
+                        raise _Retryable("HTTP 416")
+                    if status not in (200, 206):
+                        result.error = f"HTTP {status}"
+                        return result
+
+                    content_range = response.headers.get("Content-Range", "")
+                    append = status == 206 and content_range.startswith(f"bytes {offset}-")
+                    if not append:
+                        offset = 0
+                    result.etag = response.headers.get("ETag")
+                    result.last_modified = response.headers.get("Last-Modified")
+                    part.parent.mkdir(parents=True, exist_ok=True)
+                    meta_file.write_text(json.dumps({
+                        "url": remote.url,
+                        "etag": result.etag,
+                        "last_modified": result.last_modified,
+                    }), encoding="utf-8")
+
+                    expected = response.headers.get("Content-Length")
+                    written = 0
+                    with open(part, "ab" if append else "wb") as f:
+                        for chunk in response.iter_content(CHUNK_SIZE):
+                            f.write(chunk)
+                            written += len(chunk)
+                    if expected is not None and written < int(expected):
+                        raise _Retryable(f"réponse tronquée ({written}/{expected} octets)")
+                    resumed = resumed or append
+                    result.bytes += written
+            except (requests.ConnectionError, requests.Timeout,
+                    requests.exceptions.ChunkedEncodingError, _Retryable) as e:
+                result.error = str(e)
+                if attempt < self.retries:
+                    self._wait(attempt, getattr(e, "retry_after", None))
+                continue
+
+            if remote.sha256 and calculate_file_hash(part) != remote.sha256:
+                part.unlink(missing_ok=True)
+                meta_file.unlink(missing_ok=True)
+                result.error = "SHA-256 différent de celui annoncé"
+                continue
+
+            dest.parent.mkdir(parents=True, exist_ok=True)
+            try:
+                os.replace(part, dest)
+            except OSError:
+                # .cache sur un autre système de fichiers
+                shutil.move(str(part), str(dest))
+            meta_file.unlink(missing_ok=True)
+            result.status = "resumed" if resumed else "fetched"
+            result.error = None
+            return result
+
+        return result
+
+
+def _validators(entry: Optional[Dict], prefix: str) -> Dict[str, str]:
+    entry = entry or {}
+    return {
+        "etag": entry.get(f"{prefix}_etag"),
+        "last_modified": entry.get(f"{prefix}_http_modified"),
+    }
+
+
+def _remove_empty_dirs(partial_dir: Path):
+    if not partial_dir.is_dir():
+        return
+    for screen_dir in partial_dir.iterdir():
+        try:
+            screen_dir.rmdir()
+        except OSError:
+            pass
+
+
+def fetch_remote_screens(manifest: Dict, base_url: str, api_key: Optional[str] = None,
+                         jobs: int = DEFAULT_FETCH_JOBS, retries: int = DEFAULT_RETRIES,
+                         force: bool = False, prune: bool = False,
+                         screens_dir: Path = STITCH_SCREENS_DIR) -> FetchSummary:
+    """Met ``screens_dir`` à jour depuis l'API distante.
+
+    ``manifest`` (le manifest précédent) fournit les validateurs HTTP et les
+    hashes locaux ; ``force`` ignore les validateurs. Avec ``prune``, les
+    screens locaux absents de la liste distante sont supprimés.
+    """
+    summary = FetchSummary()
+    client = StitchClient(base_url, api_key, jobs=jobs, retries=retries)
+    try:
+        remote_screens = client.list_screens()
+        summary.remote_screens = [name for name, _ in remote_screens]
+
+        tasks = []
+        for name, files in remote_screens:
+            entry = manifest.get(name) or {}
+            for remote in files:
+                dest = screens_dir / name / remote.filename
+                if (not force and remote.sha256 and dest.exists()
+                        and entry.get(f"{remote.prefix}_hash") == remote.sha256):
+                    # Contenu déjà présent : pas de requête
+                    summary.results.append(FetchResult(name, remote.filename, "unchanged"))
+                    continue
+                validators = {} if force else _validators(entry, remote.prefix)
+                tasks.append((remote, dest, validators))
+
+        with ThreadPoolExecutor(max_workers=client.jobs) as executor:
+            futures = [executor.submit(client.download, *task) for task in tasks]
+            for (remote, _, _), future in zip(tasks, futures):
+                result = future.result()
+                summary.results.append(result)
+                if result.status != "failed":
+                    summary.validators.setdefault(remote.screen, {}).update({
+                        f"{remote.prefix}_etag": result.etag,
+                        f"{remote.prefix}_http_modified": result.last_modified,
+                    })
+    finally:
+        client.close()
+    # Dossiers de partiels vidés, une fois tous les téléchargements terminés :
+    # un rmdir pendant le téléchargement d'un autre fichier du même screen le ferait échouer
+    _remove_empty_dirs(client.partial_dir)
+
+    if prune and screens_dir.exists():
+        remote_names = set(summary.remote_screens)
+        for screen_dir in sorted(screens_dir.iterdir()):
+            if screen_dir.is_dir() and not screen_dir.name.startswith('.') \
+                    and screen_dir.name not in remote_names:
+                shutil.rmtree(screen_dir)
+                summary.pruned.append(screen_dir.name)
+    return summary
+
+
+def apply_validators(manifest: Dict, validators: Dict[str, Dict[str, str]]):
+    """Enregistre les validateurs HTTP dans les entrées du manifest (None = retiré)."""
+    for name, values in validators.items():
+        entry = manifest.get(name)
+        if entry is None:
+            continue
+        for key, value in values.items():
+            if value:
+                entry[key] = value
+            else:
+                entry.pop(key, None)
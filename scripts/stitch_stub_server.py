@@ -0,0 +1,291 @@
+#!/usr/bin/env python3
+"""
+Serveur HTTP local imitant l'API Stitch, pour tester stitch_fetch.py.
+
+Sert un dossier organisé comme ``stitch_reservation_process_screen/``
+(un sous-dossier par screen avec code.html et screen.png) :
+- ``GET /screens`` : liste paginée (``--page-size``) avec url et sha256 ;
+- ``GET /files/<screen>/<fichier>`` : ETag, Last-Modified, 304 conditionnels,
+  ``Range`` / ``If-Range`` (206).
+
+Pannes simulées pour les réessais et la reprise :
+- ``--fail-every N`` : une requête de fichier sur N répond 503 (Retry-After: 0) ;
+- ``--drop-after OCTETS`` : la première réponse de chaque fichier est coupée
+  après OCTETS octets.
+
+``--no-sha256`` retire les hashes de la liste : seules les requêtes
+conditionnelles (ETag / Last-Modified) évitent alors les téléchargements.
+``--check`` lance deux synchronisations successives dans un dossier
+temporaire (déjà peuplé, sans validateurs) et échoue si la seconde reçoit
+autre chose que des 304.
+
+Usage:
+    python scripts/stitch_stub_server.py --root stitch_reservation_process_screen --port 8765
+    python scripts/sync_stitch_screens.py --remote http://127.0.0.1:8765
+    python scripts/stitch_stub_server.py --check
+"""
+
+import io
+import os
+import sys
+import json
+import shutil
+import argparse
+import tempfile
+import threading
+import contextlib
+from email.utils import formatdate, parsedate_to_datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Dict, Tuple
+from urllib.parse import parse_qs, quote, unquote, urlparse
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from sync_stitch_screens import calculate_file_hash
+
+FILES = ("code.html", "screen.png")
+
+
+class StubState:
+    """Configuration et compteurs partagés entre les requêtes."""
+
+    def __init__(self, root: Path, api_key: str = None, page_size: int = 50,
+                 fail_every: int = 0, drop_after: int = 0, with_sha256: bool = True):
+        self.root = root
+        self.with_sha256 = with_sha256
+        self.api_key = api_key
+        self.page_size = max(page_size, 1)
+        self.fail_every = fail_every
+        self.drop_after = drop_after
+        self.lock = threading.Lock()
+        self.file_requests = 0
+        self.dropped = set()
+        self.hashes: Dict[Tuple[str, int, int], str] = {}
+        self.stats = {"200": 0, "206": 0, "304": 0, "503": 0, "dropped": 0, "bytes": 0}
+
+    def count(self, key: str, amount: int = 1):
+        with self.lock:
+            self.stats[key] += amount
+
+    def sha256(self, path: Path) -> str:
+        st = path.stat()
+        key = (str(path), st.st_size, st.st_mtime_ns)
+        with self.lock:
+            cached = self.hashes.get(key)
+        if cached is None:
+            cached = calculate_file_hash(path)
+            with self.lock:
+                self.hashes[key] = cached
+        return cached
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    """Routes ``/screens`` et ``/files/<screen>/<fichier>``."""
+
+    protocol_version = "HTTP/1.1"
+    state: StubState = None
+
+    def log_message(self, format, *args):
+        pass
+
+    def _send(self, status: int, body: bytes = b"", headers: Dict[str, str] = None):
+        self.send_response(status)
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        if body and self.command != "HEAD":
+            self.wfile.write(body)
+
+    def do_GET(self):
+        state = self.state
+        if state.api_key and self.headers.get("Authorization") != f"Bearer {state.api_key}":
+            self._send(401)
+            return
+        url = urlparse(self.path)
+        if url.path == "/screens":
+            self._list(int(parse_qs(url.query).get("page", ["0"])[0]))
+        elif url.path.startswith("/files/"):
+            self._file(*[unquote(part) for part in url.path[len("/files/"):].split("/", 1)])
+        else:
+            self._send(404)
+
+    def _list(self, page: int):
+        state = self.state
+        names = sorted(
+            entry.name for entry in os.scandir(state.root)
+            if entry.is_dir() and not entry.name.startswith('.')
+        )
+        chunk = names[page * state.page_size:(page + 1) * state.page_size]
+        screens = []
+        for name in chunk:
+            files = {}
+            for filename in FILES:
+                path = state.root / name / filename
+                if path.exists():
+                    files[filename] = {"url": f"/files/{quote(name)}/{filename}"}
+                    if state.with_sha256:
+                        files[filename]["sha256"] = state.sha256(path)
+            screens.append({"name": name, "files": files})
+        data = {"screens": screens}
+        if (page + 1) * state.page_size < len(names):
+            data["next"] = f"/screens?page={page + 1}"
+        self._send(200, json.dumps(data).encode("utf-8"), {"Content-Type": "application/json"})
+
+    def _file(self, screen: str, filename: str = ""):
+        state = self.state
+        if filename not in FILES or screen.startswith('.') or "/" in screen:
+            self._send(404)
+            return
+        path = state.root / screen / filename
+        if not path.exists():
+            self._send(404)
+            return
+
+        with state.lock:
+            state.file_requests += 1
+            fail = state.fail_every and state.file_requests % state.fail_every == 0
+        if fail:
+            state.count("503")
+            self._send(503, headers={"Retry-After": "0"})
+            return
+
+        st = path.stat()
+        etag = f'"{state.sha256(path)[:32]}"'
+        last_modified = formatdate(st.st_mtime, usegmt=True)
+        headers = {"ETag": etag, "Last-Modified": last_modified}
+
+        if_none_match = self.headers.get("If-None-Match")
+        if_modified_since = self.headers.get("If-Modified-Since")
+        not_modified = False
+        if if_none_match is not None:
+            not_modified = etag in [tag.strip() for tag in if_none_match.split(",")]
+        elif if_modified_since:
+            try:
+                not_modified = int(st.st_mtime) <= parsedate_to_datetime(if_modified_since).timestamp()
+            except (TypeError, ValueError):
+                pass
+        if not_modified:
+            state.count("304")
+            self._send(304, headers=headers)
+            return
+
+        data = path.read_bytes()
+        status = 200
+        start = 0
+        range_header = self.headers.get("Range", "")
+        if_range = self.headers.get("If-Range")
+        if range_header.startswith("bytes=") and if_range in (None, etag, last_modified):
+            start = int(range_header[len("bytes="):].split("-", 1)[0] or 0)
+            if start >= len(data):
+                self._send(416, headers={"Content-Range": f"bytes */{len(data)}"})
+                return
+            status = 206
+            headers["Content-Range"] = f"bytes {start}-{len(data) - 1}/{len(data)}"
+        body = data[start:]
+
+        key = f"{screen}/{filename}"
+        with state.lock:
+            drop = state.drop_after and key not in state.dropped and len(body) > state.drop_after
+            if drop:
+                state.dropped.add(key)
+        state.count(str(status))
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        if drop:
+            # Coupure simulée : l'en-tête annonce tout, seul le début est envoyé
+            self.wfile.write(body[:state.drop_after])
+            state.count("dropped")
+            state.count("bytes", state.drop_after)
+            self.close_connection = True
+            return
+        self.wfile.write(body)
+        state.count("bytes", len(body))
+
+
+def serve(root: Path, port: int = 0, **options) -> Tuple[ThreadingHTTPServer, StubState]:
+    """Démarre le serveur dans un thread et retourne (serveur, état)."""
+    state = StubState(root, **options)
+    handler = type("BoundStubHandler", (StubHandler,), {"state": state})
+    server = ThreadingHTTPServer(("127.0.0.1", port), handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, state
+
+
+def check_conditional_requests(root: Path) -> bool:
+    """Vérifie que les validateurs HTTP sont conservés d'une synchronisation à l'autre.
+
+    Le dossier temporaire contient déjà les screens (scan local, sans
+    validateurs) ; la liste est servie sans sha256. La première
+    synchronisation distante télécharge tout (contenu identique), la seconde
+    ne doit recevoir que des 304.
+    """
+    import sync_stitch_screens
+
+    root = root.resolve()
+    server, state = serve(root, with_sha256=False)
+    url = f"http://127.0.0.1:{server.server_address[1]}"
+    cwd = os.getcwd()
+    runs = []
+    try:
+        with tempfile.TemporaryDirectory(prefix="stitch-check-") as workdir:
+            os.chdir(workdir)
+            shutil.copytree(root, sync_stitch_screens.STITCH_SCREENS_DIR)
+            for argv in ([], ["--remote", url], ["--remote", url]):
+                before = dict(state.stats)
+                with contextlib.redirect_stdout(io.StringIO()):
+                    code = sync_stitch_screens.main(argv)
+                runs.append({key: state.stats[key] - before[key] for key in ("200", "304")})
+                runs[-1]["code"] = code
+    finally:
+        os.chdir(cwd)
+        server.shutdown()
+    for number, counts in enumerate(runs[1:], 1):
+        print(f"Synchronisation {number} : 200={counts['200']} 304={counts['304']} code={counts['code']}")
+    return all(run["code"] == 0 for run in runs) and runs[2]["200"] == 0 and runs[2]["304"] > 0
+
+
+def main():
+    """Point d'entrée principal."""
+    parser = argparse.ArgumentParser(description="Serveur local imitant l'API Stitch")
+    parser.add_argument("--root", type=str, default="stitch_reservation_process_screen",
+                        help="Dossier des screens à servir")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--api-key", type=str, default=None, help="Clé Bearer exigée")
+    parser.add_argument("--page-size", type=int, default=50)
+    parser.add_argument("--fail-every", type=int, default=0,
+                        help="Une requête de fichier sur N répond 503")
+    parser.add_argument("--drop-after", type=int, default=0,
+                        help="Coupe la première réponse de chaque fichier après N octets")
+    parser.add_argument("--no-sha256", action="store_true",
+                        help="Liste sans sha256 (requêtes conditionnelles seulement)")
+    parser.add_argument("--check", action="store_true",
+                        help="Vérifie qu'une deuxième synchronisation ne reçoit que des 304")
+    args = parser.parse_args()
+
+    if args.check:
+        if check_conditional_requests(Path(args.root)):
+            print("✅ Validateurs conservés : la deuxième synchronisation ne télécharge rien")
+            return 0
+        print("❌ La deuxième synchronisation a retéléchargé des fichiers")
+        return 1
+
+    server, state = serve(Path(args.root), args.port, api_key=args.api_key,
+                          page_size=args.page_size, fail_every=args.fail_every,
+                          drop_after=args.drop_after, with_sha256=not args.no_sha256)
+    print(f"🌐 API Stitch simulée sur http://127.0.0.1:{server.server_address[1]} ({args.root})")
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        print(f"\n⏹️  Arrêt : {state.stats}")
+        server.shutdown()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
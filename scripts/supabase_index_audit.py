@@ -0,0 +1,674 @@
+#!/usr/bin/env python3
+"""
+Couverture des requêtes Supabase par les index des migrations.
+
+1. Les migrations ``supabase/migrations/*.sql`` sont rejouées dans l'ordre
+   pour construire un modèle du schéma : tables, colonnes, index (clés
+   primaires et contraintes UNIQUE comprises), méthode (btree, gin...),
+   classes d'opérateurs et prédicats des index partiels.
+2. Les chaînes ``.from('table')...`` de ``supabase/functions/*/index.ts`` et
+   ``lib/**/*.dart`` sont relevées avec leurs filtres (``eq``, ``ilike``,
+   ``gte``, ``or``...) et tris (``order``), y compris les requêtes
+   construites par étapes (``query = query.eq(...)``).
+3. Chaque colonne filtrée ou triée d'une table surveillée doit être servie
+   par un index : colonne de tête (ou précédée de colonnes filtrées par
+   égalité), index trigramme pour ``like``/``ilike``, index GIN pour la
+   recherche plein texte et les opérateurs JSONB. Un index partiel ne
+   compte que si la requête filtre aussi les colonnes de son prédicat ; il
+   sert alors aussi les égalités sur les colonnes que ce prédicat fixe.
+
+Gravité : ``high`` quand aucune colonne de la requête n'est indexée (parcours
+séquentiel de la table), ``medium`` quand une autre colonne l'est.
+
+Usage:
+    python scripts/supabase_index_audit.py
+    python scripts/supabase_index_audit.py --tables listings reservations --json
+    python -m doctest scripts/supabase_index_audit.py
+"""
+
+import re
+import sys
+import json
+import argparse
+from dataclasses import dataclass, field, asdict
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from project_index import ProjectIndex
+
+MIGRATIONS_DIR = "supabase/migrations"
+FUNCTIONS_DIR = "supabase/functions"
+WATCHED_TABLES = ("listings", "reservations", "messages")
+
+# Méthodes de filtre supabase-js / supabase-dart -> opération
+FILTER_METHODS = {
+    "eq": "eq", "gt": "range", "gte": "range", "lt": "range", "lte": "range",
+    "in": "eq", "in_": "eq", "inFilter": "eq", "is": "eq", "is_": "eq", "isFilter": "eq",
+    "like": "like", "ilike": "like", "likeAnyOf": "like", "ilikeAnyOf": "like",
+    "contains": "gin", "containedBy": "gin", "overlaps": "gin", "textSearch": "fts",
+}
+# Opérateurs PostgREST des chaînes ``.or('col.op.valeur,...')`` et ``.filter()``
+POSTGREST_OPERATORS = {
+    "eq": "eq", "gt": "range", "gte": "range", "lt": "range", "lte": "range",
+    "in": "eq", "is": "eq", "like": "like", "ilike": "like",
+    "cs": "gin", "cd": "gin", "ov": "gin", "fts": "fts", "plfts": "fts",
+    "phfts": "fts", "wfts": "fts",
+}
+TRIGRAM_OPCLASSES = ("gin_trgm_ops", "gist_trgm_ops")
+PATTERN_OPCLASSES = ("text_pattern_ops", "varchar_pattern_ops")
+
+_IDENT = re.compile(r'"?([A-Za-z_]\w*)"?')
+_WORD = re.compile(r"[A-Za-z_]\w*")
+_FROM_CALL = re.compile(r"\.from\(\s*(['\"])(\w+)\1\s*\)")
+_ASSIGNED = re.compile(r"(?:\b(?:let|var|const|final)\s+)?\b(\w+)\s*=\s*(?:await\s+)?[\w.]*\s*$")
+_OR_FILTER = re.compile(r"\b(\w+)\.(?:not\.)?(" + "|".join(POSTGREST_OPERATORS) + r")\.")
+_MAP_KEY = re.compile(r"['\"]?(\w+)['\"]?\s*:")
+_FIXED = re.compile(
+    r"""(?is)^\(*\s*"?([A-Za-z_]\w*)"?\s*(?:=\s*(?:'[^']*'|true\b|false\b|-?\d)|is\s+(?:true|false|null)\b)"""
+)
+
+
+@dataclass
+class TableIndex:
+    """Index d'une table, tel que défini par les migrations."""
+    name: str
+    table: str
+    columns: List[Optional[str]]  # None : élément calculé (expression)
+    opclasses: List[str] = field(default_factory=list)
+    method: str = "btree"
+    unique: bool = False
+    expression_columns: List[str] = field(default_factory=list)
+    predicate: str = ""
+    predicate_columns: List[str] = field(default_factory=list)
+    predicate_fixed: List[str] = field(default_factory=list)  # colonnes fixées par une égalité
+    source: str = ""
+
+
+@dataclass
+class TableSchema:
+    """Colonnes et index d'une table."""
+    name: str
+    columns: List[str] = field(default_factory=list)
+    indexes: Dict[str, TableIndex] = field(default_factory=dict)
+
+
+@dataclass
+class QueryFilter:
+    """Colonne filtrée ou triée par une requête."""
+    column: str
+    operation: str  # eq, range, like, gin, fts, order
+    method: str
+    line: int
+    disjunction: bool = False  # dans un .or(...)
+
+
+@dataclass
+class Query:
+    """Requête ``.from('table')`` et ses filtres."""
+    table: str
+    file: str
+    line: int
+    filters: List[QueryFilter] = field(default_factory=list)
+
+
+@dataclass
+class IndexFinding:
+    """Colonne d'une requête qu'aucun index ne sert."""
+    table: str
+    column: str
+    operation: str
+    file: str
+    line: int
+    severity: str  # high, medium
+    note: str = ""
+
+    @property
+    def location(self) -> str:
+        return f"{self.file}:{self.line}"
+
+
+# ---------------------------------------------------------------------------
+# Migrations -> schéma
+# ---------------------------------------------------------------------------
+
+def strip_sql(text: str) -> str:
+    """Efface commentaires, chaînes dollar (corps de fonctions) et littéraux.
+
+    Les caractères effacés sont remplacés par des espaces (les retours à la
+    ligne sont gardés) : les positions et numéros de ligne restent valables.
+    Les littéraux ``'...'`` sont conservés (prédicats d'index partiels).
+    """
+    out = list(text)
+    i, n = 0, len(text)
+
+    def blank(start: int, end: int):
+        for k in range(start, end):
+            if out[k] != "\n":
+                out[k] = " "
+
+    while i < n:
+        c = text[i]
+        if c == "-" and text.startswith("--", i):
+            end = text.find("\n", i)
+            end = n if end < 0 else end
+            blank(i, end)
+            i = end
+        elif c == "/" and text.startswith("/*", i):
+            end = text.find("*/", i + 2)
+            end = n if end < 0 else end + 2
+            blank(i, end)
+            i = end
+        elif c == "'":
+            end = i + 1
+            while end < n:
+                if text[end] == "'":
+                    if text.startswith("''", end):
+                        end += 2
+                        continue
+                    break
+                end += 1
+            i = end + 1
+        elif c == "$":
+            match = re.match(r"\$(\w*)\$", text[i:i + 64])
+            if not match:
+                i += 1
+                continue
+            tag = match.group(0)
+            end = text.find(tag, i + len(tag))
+            end = n if end < 0 else end + len(tag)
+            blank(i, end)
+            i = end
+        else:
+            i += 1
+    return "".join(out)
+
+
+def split_top_level(text: str, sep: str = ",") -> List[str]:
+    """Découpe ``text`` sur ``sep`` hors parenthèses et chaînes."""
+    parts, depth, quote, start = [], 0, "", 0
+    for i, c in enumerate(text):
+        if quote:
+            if c == quote:
+                quote = ""
+        elif c in "'\"":
+            quote = c
+        elif c == "(":
+            depth += 1
+        elif c == ")":
+            depth -= 1
+        elif c == sep and depth == 0:
+            parts.append(text[start:i])
+            start = i + 1
+    parts.append(text[start:])
+    return [part.strip() for part in parts if part.strip()]
+
+
+def balanced(text: str, start: int) -> Tuple[str, int]:
+    """Contenu de la parenthèse ouverte en ``start`` et position après la fermante."""
+    depth, quote = 0, ""
+    for i in range(start, len(text)):
+        c = text[i]
+        if quote:
+            if c == "\\":
+                continue
+            if c == quote and text[i - 1] != "\\":
+                quote = ""
+        elif c in "'\"`":
+            quote = c
+        elif c == "(":
+            depth += 1
+        elif c == ")":
+            depth -= 1
+            if depth == 0:
+                return text[start + 1:i], i + 1
+    return text[start + 1:], len(text)
+
+
+def table_name(raw: str) -> str:
+    """``public."Listings"`` -> ``listings`` (schéma public implicite)."""
+    name = raw.replace('"', "").lower()
+    return name[len("public."):] if name.startswith("public.") else name
+
+
+class SchemaModel:
+    """Schéma obtenu en rejouant les migrations dans l'ordre."""
+
+    def __init__(self):
+        self.tables: Dict[str, TableSchema] = {}
+        self.migrations: List[str] = []
+
+    def table(self, name: str) -> TableSchema:
+        return self.tables.setdefault(name, TableSchema(name))
+
+    def apply_file(self, text: str, rel_path: str):
+        """Applique les instructions DDL d'une migration."""
+        self.migrations.append(rel_path)
+        cleaned = strip_sql(text)
+        offset = 0
+        for statement in cleaned.split(";"):
+            line = cleaned.count("\n", 0, offset + len(statement) - len(statement.lstrip())) + 1
+            offset += len(statement) + 1
+            statement = statement.strip()
+            if statement:
+                self.apply_statement(statement, f"{rel_path}:{line}")
+
+    def apply_statement(self, statement: str, source: str):
+        words = statement.split(None, 3)
+        head = " ".join(words[:2]).lower()
+        if head.startswith("create") and re.match(r"create\s+(unlogged\s+|temp\w*\s+)?table\b", statement, re.I):
+            self._create_table(statement, source)
+        elif re.match(r"create\s+(unique\s+)?index\b", statement, re.I):
+            self._create_index(statement, source)
+        elif head == "drop index":
+            self._drop_index(statement)
+        elif head == "drop table":
+            for name in split_top_level(re.sub(r"(?is)^drop\s+table\s+(if\s+exists\s+)?|\s+(cascade|restrict)\s*$", "", statement)):
+                self.tables.pop(table_name(name), None)
+        elif head == "alter table":
+            self._alter_table(statement, source)
+
+    def _create_table(self, statement: str, source: str):
+        match = re.match(r"(?is)create\s+(?:\w+\s+)?table\s+(?:if\s+not\s+exists\s+)?([\w.\"]+)\s*\(", statement)
+        if not match:
+            return  # CREATE TABLE ... AS / PARTITION OF : pas de définition de colonnes
+        name = table_name(match.group(1))
+        body, _ = balanced(statement, match.end() - 1)
+        table = self.table(name)
+        for element in split_top_level(body):
+            self._table_element(table, element, source)
+
+    def _table_element(self, table: TableSchema, element: str, source: str):
+        element = re.sub(r"(?is)^constraint\s+\S+\s+", "", element)
+        lowered = element.lower()
+        kind = re.match(r"(primary\s+key|unique)\s*\(", lowered)
+        if kind:
+            columns, _ = balanced(element, kind.end() - 1)
+            self._add_constraint_index(table, "pkey" if kind.group(1) != "unique" else "key",
+                                       split_top_level(columns), source)
+            return
+        if re.match(r"(check|foreign\s+key|exclude|like)\b", lowered):
+            return
+        ident = _IDENT.match(element)
+        if not ident:
+            return
+        column = ident.group(1).lower()
+        if column not in table.columns:
+            table.columns.append(column)
+        # Contraintes de colonne (avant un éventuel REFERENCES ... qui ne crée pas d'index)
+        definition = lowered[ident.end():]
+        if re.search(r"\bprimary\s+key\b", definition):
+            self._add_constraint_index(table, "pkey", [column], source)
+        elif re.search(r"\bunique\b", definition):
+            self._add_constraint_index(table, "key", [column], source)
+
+    def _add_constraint_index(self, table: TableSchema, suffix: str, elements: List[str], source: str):
+        columns = [e.strip('"').lower() for e in elements if _WORD.fullmatch(e.strip('"'))]
+        name = f"{table.name}_{'_'.join(columns) or 'expr'}_{suffix}"
+        index = self._index_from_elements(name, table, elements, source)
+        index.unique = True
+        table.indexes[name] = index
+
+    def _index_from_elements(self, name: str, table: TableSchema, elements: List[str], source: str,
+                             method: str = "btree") -> TableIndex:
+        index = TableIndex(name=name, table=table.name, columns=[], method=method, source=source)
+        for element in elements:
+            plain = re.fullmatch(r'"?([A-Za-z_]\w*)"?((?:\s+[\w.]+)*)', element.strip())
+            words = [w.lower() for w in (plain.group(2).split() if plain else [])]
+            opclass = next((w for w in words if w not in ("asc", "desc", "nulls", "first", "last")), "")
+            if plain:
+                index.columns.append(plain.group(1).lower())
+            else:
+                index.columns.append(None)
+                referenced = [w.lower() for w in _WORD.findall(re.sub(r"'[^']*'", "", element))]
+                index.expression_columns.extend(
+                    w for w in referenced if w in table.columns and w not in index.expression_columns
+                )
+                opclass = next((w.lower() for w in element.split()[1:] if w.lower().endswith("_ops")), "")
+            index.opclasses.append(opclass)
+        return index
+
+    def _create_index(self, statement: str, source: str):
+        match = re.match(
+            r"(?is)create\s+(unique\s+)?index\s+(?:concurrently\s+)?(?:if\s+not\s+exists\s+)?"
+            r"(?:([\w\"]+)\s+)?on\s+(?:only\s+)?([\w.\"]+)\s*(?:using\s+(\w+)\s*)?\(",
+            statement,
+        )
+        if not match:
+            return
+        table = self.table(table_name(match.group(3)))
+        name = (match.group(2) or f"{table.name}_idx_{len(table.indexes)}").replace('"', "").lower()
+        elements, end = balanced(statement, match.end() - 1)
+        index = self._index_from_elements(
+            name, table, split_top_level(elements), source, (match.group(4) or "btree").lower()
+        )
+        index.unique = bool(match.group(1))
+        where = re.search(r"(?is)\bwhere\b(.*)$", statement[end:])
+        if where:
+            index.predicate = " ".join(where.group(1).split())
+            referenced = {w.lower() for w in _WORD.findall(re.sub(r"'[^']*'", "", index.predicate))}
+            index.predicate_columns = sorted(referenced & set(table.columns))
+            index.predicate_fixed = sorted(set(fixed_columns(index.predicate)) & set(table.columns))
+        table.indexes[name] = index
+
+    def _drop_index(self, statement: str):
+        names = re.sub(r"(?is)^drop\s+index\s+(concurrently\s+)?(if\s+exists\s+)?|\s+(cascade|restrict)\s*$", "", statement)
+        for raw in split_top_level(names):
+            name = table_name(raw)
+            for table in self.tables.values():
+                table.indexes.pop(name, None)
+
+    def _alter_table(self, statement: str, source: str):
+        match = re.match(r"(?is)alter\s+table\s+(?:if\s+exists\s+)?(?:only\s+)?([\w.\"]+)\s+(.*)$", statement)
+        if not match:
+            return
+        table = self.table(table_name(match.group(1)))
+        for action in split_top_level(match.group(2)):
+            lowered = action.lower()
+            added = re.match(r"add\s+(?:column\s+)?(?:if\s+not\s+exists\s+)?", lowered)
+            dropped = re.match(r"drop\s+(?:column\s+)?(?:if\s+exists\s+)?\"?(\w+)", lowered)
+            if added:
+                self._table_element(table, action[added.end():], source)
+            elif dropped and dropped.group(1) not in ("constraint",):
+                column = dropped.group(1)
+                if column in table.columns:
+                    table.columns.remove(column)
+                for name in [n for n, idx in table.indexes.items()
+                             if column in idx.columns or column in idx.expression_columns]:
+                    table.indexes.pop(name)
+
+
+def fixed_columns(predicate: str) -> List[str]:
+    """Colonnes qu'un prédicat d'index partiel fixe à une valeur constante.
+
+    Seules les conjonctions de premier niveau comptent (``col = 'x'``,
+    ``col = true``, ``col IS NULL``) ; un prédicat avec ``OR`` ne fixe rien.
+
+    >>> fixed_columns("status = 'active' AND is_available = true")
+    ['status', 'is_available']
+    >>> fixed_columns("user_id IS NOT NULL")
+    []
+    >>> fixed_columns("status = 'active' OR is_available = true")
+    []
+    """
+    stripped = re.sub(r"'[^']*'", "''", predicate)
+    if re.search(r"(?i)\bor\b", stripped):
+        return []
+    fixed = []
+    for conjunct in re.split(r"(?i)\band\b", predicate):
+        match = _FIXED.match(conjunct.strip())
+        if match:
+            fixed.append(match.group(1).lower())
+    return fixed
+
+
+def load_schema(index: ProjectIndex) -> SchemaModel:
+    """Rejoue les migrations ``supabase/migrations/*.sql`` par ordre de nom."""
+    schema = SchemaModel()
+    paths = sorted(f"{MIGRATIONS_DIR}/{name}" for name in index.files(MIGRATIONS_DIR) if name.endswith(".sql"))
+    for rel_path in paths:
+        schema.apply_file(index.path(rel_path).read_text(encoding="utf-8", errors="replace"), rel_path)
+    return schema
+
+
+# ---------------------------------------------------------------------------
+# Code client -> requêtes
+# ---------------------------------------------------------------------------
+
+def _skip_blank(text: str, i: int) -> int:
+    """Avance après les espaces et commentaires ``//`` et ``/* */``."""
+    n = len(text)
+    while i < n:
+        if text[i].isspace():
+            i += 1
+        elif text.startswith("//", i):
+            end = text.find("\n", i)
+            i = n if end < 0 else end
+        elif text.startswith("/*", i):
+            end = text.find("*/", i + 2)
+            i = n if end < 0 else end + 2
+        else:
+            break
+    return i
+
+
+def iter_chain(text: str, i: int) -> Iterable[Tuple[str, str, int]]:
+    """Appels chaînés ``.methode(args)`` à partir de ``i`` : (méthode, arguments, position)."""
+    while True:
+        j = _skip_blank(text, i)
+        if text.startswith("?.", j):
+            j += 1
+        if not text.startswith(".", j) or text.startswith("..", j):
+            return
+        match = re.match(r"\.\s*(\w+)\s*(?:<[^()]*?>)?\s*", text[j:j + 200])
+        if not match:
+            return
+        k = j + match.end()
+        if k >= len(text) or text[k] != "(":
+            return
+        args, i = balanced(text, k)
+        yield match.group(1), args, j
+
+
+def _first_string(args: str) -> Optional[str]:
+    match = re.match(r"\s*(['\"`])([\w.]+)\1", args)
+    return match.group(2) if match else None
+
+
+def _string_args(args: str) -> List[str]:
+    return [m.group(2) for m in re.finditer(r"(['\"`])((?:\\.|(?!\1).)*)\1", args, re.S)]
+
+
+def chain_filters(calls: Iterable[Tuple[str, str, int]], text: str) -> List[QueryFilter]:
+    """Colonnes filtrées ou triées d'une chaîne d'appels."""
+    filters = []
+    for method, args, position in calls:
+        line = text.count("\n", 0, position) + 1
+        if method in FILTER_METHODS:
+            column = _first_string(args)
+            if column:
+                filters.append(QueryFilter(column.split(".")[0], FILTER_METHODS[method], method, line))
+        elif method == "order":
+            column = _first_string(args)
+            if column:
+                filters.append(QueryFilter(column, "order", method, line))
+        elif method == "filter":
+            strings = _string_args(args)
+            if len(strings) >= 2 and strings[1] in POSTGREST_OPERATORS:
+                filters.append(QueryFilter(strings[0], POSTGREST_OPERATORS[strings[1]], method, line))
+        elif method == "match":
+            filters.extend(QueryFilter(key, "eq", method, line) for key in _MAP_KEY.findall(args))
+        elif method == "or":
+            for value in _string_args(args)[:1]:
+                filters.extend(
+                    QueryFilter(column, POSTGREST_OPERATORS[op], method, line, disjunction=True)
+                    for column, op in _OR_FILTER.findall(value)
+                )
+    return filters
+
+
+def extract_queries(text: str, rel_path: str) -> List[Query]:
+    """Requêtes ``.from('table')`` d'un fichier TypeScript ou Dart."""
+    queries = []
+    matches = list(_FROM_CALL.finditer(text))
+    for number, match in enumerate(matches):
+        before = text[max(0, match.start() - 200):match.start()]
+        if before.rstrip().endswith("storage"):
+            continue  # supabase.storage.from('bucket')
+        query = Query(match.group(2), rel_path, text.count("\n", 0, match.start()) + 1)
+        query.filters = chain_filters(iter_chain(text, match.end()), text)
+
+        # Requête construite par étapes : let query = client.from(...) ; query = query.eq(...)
+        assigned = _ASSIGNED.search(before)
+        if assigned and assigned.group(1) not in ("await", "return"):
+            variable = assigned.group(1)
+            end = matches[number + 1].start() if number + 1 < len(matches) else len(text)
+            for step in re.finditer(rf"\b{re.escape(variable)}\b(?=\s*(?:\?\.|\.)\s*\w+\s*\()", text[match.end():end]):
+                start = match.end() + step.end()
+                query.filters.extend(chain_filters(iter_chain(text, start), text))
+        queries.append(query)
+    return queries
+
+
+def collect_queries(index: ProjectIndex) -> List[Query]:
+    """Requêtes des fonctions Edge (``index.ts``) et du code Flutter (``lib/``)."""
+    sources = [p for p in index.files_named("index.ts", under=FUNCTIONS_DIR)]
+    sources += index.files_with_suffix(".dart", under="lib")
+    queries = []
+    for rel_path in sorted(sources):
+        try:
+            text = index.path(rel_path).read_text(encoding="utf-8", errors="replace")
+        except OSError:
+            continue
+        if ".from(" in text:
+            queries.extend(extract_queries(text, rel_path))
+    return queries
+
+
+# ---------------------------------------------------------------------------
+# Recoupement
+# ---------------------------------------------------------------------------
+
+def index_serves(index: TableIndex, column: str, operation: str, eq_columns: Set[str]) -> bool:
+    """Vrai si ``index`` peut servir ``operation`` sur ``column`` pour cette requête.
+
+    Une égalité sur une colonne fixée par le prédicat d'un index partiel
+    utilisable est servie : le prédicat a déjà filtré ces lignes.
+
+    >>> partial = TableIndex("idx_listings_price_type", "listings",
+    ...                      ["property_type", "base_price_per_night"],
+    ...                      predicate_columns=["is_available", "status"],
+    ...                      predicate_fixed=["status", "is_available"])
+    >>> index_serves(partial, "is_available", "eq", {"status", "is_available"})
+    True
+    >>> index_serves(partial, "is_available", "eq", {"is_available"})
+    False
+    """
+    if index.predicate_columns and not set(index.predicate_columns) <= eq_columns:
+        return False
+    if operation == "eq" and column in index.predicate_fixed:
+        return True
+    if operation == "like":
+        return any(
+            col == column and (opclass in TRIGRAM_OPCLASSES
+                               or (index.method == "btree" and opclass in PATTERN_OPCLASSES))
+            for col, opclass in zip(index.columns, index.opclasses)
+        )
+    if operation == "fts":
+        return index.method in ("gin", "gist") and column in index.expression_columns
+    if operation == "gin":
+        return index.method in ("gin", "gist") and column in index.columns
+    if index.method not in ("btree", "hash") or (index.method == "hash" and operation != "eq"):
+        return False
+    for position, col in enumerate(index.columns):
+        if col == column:
+            return all(prefix in eq_columns for prefix in index.columns[:position])
+        if col is None:
+            return False
+    return False
+
+
+def audit_queries(schema: SchemaModel, queries: Iterable[Query],
+                  tables: Iterable[str] = WATCHED_TABLES) -> List[IndexFinding]:
+    """Colonnes des requêtes sur ``tables`` qu'aucun index ne sert."""
+    watched = set(tables)
+    findings = []
+    for query in queries:
+        if query.table not in watched or query.table not in schema.tables:
+            continue
+        table = schema.tables[query.table]
+        eq_columns = {f.column for f in query.filters if f.operation == "eq" and not f.disjunction}
+        unserved = [
+            f for f in query.filters
+            if not any(index_serves(index, f.column, f.operation, eq_columns)
+                       for index in table.indexes.values())
+        ]
+        indexed = [f for f in query.filters if all(f is not u for u in unserved)]
+        branches = [f for f in query.filters if f.disjunction]
+        # Accès indexé : un filtre (hors .or) ou un tri indexé, ou toutes les branches du .or
+        served = (any(not f.disjunction for f in indexed)
+                  or (bool(branches) and all(any(f is i for i in indexed) for f in branches)))
+        for query_filter in unserved:
+            if query_filter.operation == "order" and served:
+                continue  # tri après un accès indexé : pas de parcours complet
+            note = ""
+            partial = [i.name for i in table.indexes.values()
+                       if query_filter.column in i.columns and i.predicate_columns
+                       and not set(i.predicate_columns) <= eq_columns]
+            if partial:
+                note = f"index partiel inutilisable ({', '.join(partial)})"
+            elif query_filter.column not in table.columns:
+                note = "colonne absente des migrations"
+            findings.append(IndexFinding(
+                table=query.table, column=query_filter.column, operation=query_filter.method,
+                file=query.file, line=query_filter.line,
+                severity="medium" if served else "high", note=note,
+            ))
+    return findings
+
+
+def analyze_project(index: ProjectIndex, tables: Iterable[str] = WATCHED_TABLES) -> Dict:
+    """Rapport complet (forme JSON) : index par table, requêtes et colonnes non indexées."""
+    tables = list(tables)
+    schema = load_schema(index)
+    queries = collect_queries(index)
+    findings = audit_queries(schema, queries, tables)
+    summary = {}
+    for name in tables:
+        table = schema.tables.get(name)
+        summary[name] = {
+            "indexes": len(table.indexes) if table else 0,
+            "queries": sum(1 for q in queries if q.table == name),
+            "flagged": len({f.location for f in findings if f.table == name}),
+        }
+    return {
+        "migrations": len(schema.migrations),
+        "queries": len(queries),
+        "tables": summary,
+        "findings": [dict(asdict(f), location=f.location) for f in findings],
+    }
+
+
+def main():
+    """Point d'entrée principal."""
+    parser = argparse.ArgumentParser(description="Couverture des requêtes Supabase par les index")
+    parser.add_argument("--tables", nargs="+", default=list(WATCHED_TABLES),
+                        help=f"Tables surveillées (défaut : {' '.join(WATCHED_TABLES)})")
+    parser.add_argument("--indexes", action="store_true", help="Affiche aussi les index de chaque table")
+    parser.add_argument("--json", action="store_true", help="Sortie JSON")
+    args = parser.parse_args()
+
+    project_root = Path(__file__).parent.parent
+    index = ProjectIndex.build(project_root)
+    report = analyze_project(index, args.tables)
+
+    if args.json:
+        print(json.dumps(report, indent=2, ensure_ascii=False))
+        return 1 if report["findings"] else 0
+
+    print(f"🗂️  {report['migrations']} migrations, {report['queries']} requêtes analysées")
+    for name, counts in report["tables"].items():
+        print(f"   {name:<16} {counts['indexes']:>3} index, {counts['queries']:>3} requêtes, "
+              f"{counts['flagged']} sans index")
+    if args.indexes:
+        schema = load_schema(index)
+        for name in args.tables:
+            for table_index in schema.tables.get(name, TableSchema(name)).indexes.values():
+                columns = ", ".join(c or "(expr)" for c in table_index.columns)
+                where = f" WHERE {table_index.predicate}" if table_index.predicate else ""
+                print(f"   - {table_index.name} ({table_index.method}: {columns}){where}")
+
+    if report["findings"]:
+        print("\n⚠️  Colonnes sans index :")
+        for finding in report["findings"]:
+            note = f" — {finding['note']}" if finding["note"] else ""
+            print(f"   [{finding['severity']}] {finding['table']}.{finding['column']} "
+                  f"({finding['operation']}) {finding['location']}{note}")
+        return 1
+    print("\n✅ Toutes les requêtes des tables surveillées sont couvertes par un index")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -3,83 +3,464 @@
 Script de synchronisation des screens Google Stitch avec le repository.
 
 Ce script :
-1. Récupère les screens depuis Google Stitch (ou un dossier local)
+1. Récupère les screens depuis Google Stitch (voir stitch_fetch.py, si
+   STITCH_API_URL ou --remote est fourni) ou lit le dossier local ; un
+   téléchargement en échec (après réessais) arrête la synchronisation
+   avec le code 1, sans écrire le manifest ni de rapport
 2. Compare avec les versions existantes
 3. Met à jour les fichiers si nécessaire
 4. Génère un rapport des changements
+
+Le manifest est stocké en deux parties dans docs/stitch-screens/ :
+- manifest.json : instantané (une ligne par screen) ;
+- manifest.journal.jsonl : journal en ajout seul des screens ajoutés,
+  modifiés ou supprimés depuis l'instantané.
+Chaque synchronisation n'ajoute au journal que les changements ; le journal
+est compacté dans l'instantané lorsqu'il devient trop long (ou avec --compact).
+Seuls les derniers rapports sync-report-*.md sont conservés (--keep-reports).
+
+Détection des changements (--detect) : la signature stat de chaque fichier
+et, si le dossier est suivi par git, l'identifiant de blob de l'index git.
+Un fichier propre (identique à l'index) dont le blob n'a pas changé depuis
+la dernière synchronisation n'est jamais relu ; seuls les fichiers non
+suivis, modifiés localement ou dont le blob a changé sont hashés. Les
+signatures stat (mtime, inode) sont propres à la machine : elles sont
+conservées dans .cache/stitch-stat-cache.json et jamais dans le manifest
+versionné.
 """
 
 import os
 import json
 import hashlib
 import shutil
+import argparse
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, List, Tuple
+from typing import Dict, Iterable, List, Optional, Tuple
 
 # Configuration
 STITCH_SCREENS_DIR = Path("stitch_reservation_process_screen")
 DOCS_STITCH_DIR = Path("docs/stitch-screens")
 MANIFEST_FILE = DOCS_STITCH_DIR / "manifest.json"
+JOURNAL_FILE = DOCS_STITCH_DIR / "manifest.journal.jsonl"
+# Compaction dès que le journal dépasse ce nombre d'entrées ou ce ratio du manifest
+JOURNAL_MIN_COMPACT = 50
+JOURNAL_COMPACT_RATIO = 0.25
+DEFAULT_KEEP_REPORTS = 10
+HASH_BUFFER_SIZE = 1024 * 1024
+DEFAULT_JOBS = min(32, os.cpu_count() or 1)
+STAT_CACHE_FILE = Path(".cache/stitch-stat-cache.json")
+STAT_CACHE_VERSION = 1
+# Champs du manifest propres au checkout, ignorés pour décider d'un ``touch``
+LOCAL_ENTRY_KEYS = ("last_modified",)
+# Validateurs HTTP de l'étape fetch, conservés d'un scan à l'autre
+REMOTE_VALIDATOR_KEYS = ("code_etag", "code_http_modified", "screen_etag", "screen_http_modified")
 
 
 def calculate_file_hash(file_path: Path) -> str:
     """Calcule le hash SHA256 d'un fichier."""
-    sha256 = hashlib.sha256()
     with open(file_path, 'rb') as f:
-        for chunk in iter(lambda: f.read(4096), b""):
+        if hasattr(hashlib, "file_digest"):
+            # Python 3.11+ : lecture en buffer sans copie, GIL relâché
+            return hashlib.file_digest(f, "sha256").hexdigest()
+        sha256 = hashlib.sha256()
+        for chunk in iter(lambda: f.read(HASH_BUFFER_SIZE), b""):
             sha256.update(chunk)
     return sha256.hexdigest()
 
 
+def _replay_journal(manifest: Dict) -> int:
+    """Rejoue le journal sur ``manifest`` et retourne le nombre d'entrées lues."""
+    if not JOURNAL_FILE.exists():
+        return 0
+    count = 0
+    with open(JOURNAL_FILE, 'r', encoding='utf-8') as f:
+        for line in f:
+            try:
+                record = json.loads(line)
+            except ValueError:
+                # Dernière ligne tronquée (écriture interrompue) : ignorée
+                continue
+            if record.get("op") == "remove":
+                manifest.pop(record["name"], None)
+            else:
+                manifest[record["name"]] = record["entry"]
+            count += 1
+    return count
+
+
 def load_manifest() -> Dict:
-    """Charge le manifest des screens."""
+    """Charge le manifest des screens (instantané + journal)."""
+    manifest = {}
     if MANIFEST_FILE.exists():
         with open(MANIFEST_FILE, 'r', encoding='utf-8') as f:
-            return json.load(f)
-    return {}
+            manifest = json.load(f)
+    _replay_journal(manifest)
+    return manifest
+
+
+def journal_length() -> int:
+    """Nombre d'entrées dans le journal."""
+    if not JOURNAL_FILE.exists():
+        return 0
+    with open(JOURNAL_FILE, 'rb') as f:
+        return sum(1 for _ in f)
 
 
 def save_manifest(manifest: Dict):
-    """Sauvegarde le manifest."""
+    """Écrit l'instantané complet du manifest et vide le journal (compaction)."""
+    DOCS_STITCH_DIR.mkdir(parents=True, exist_ok=True)
+    tmp_file = MANIFEST_FILE.with_suffix(".json.tmp")
+    with open(tmp_file, 'w', encoding='utf-8') as f:
+        # Une ligne par screen : diffs git lisibles sans l'indentation complète
+        f.write("{\n")
+        names = sorted(manifest)
+        for i, name in enumerate(names):
+            separator = "," if i < len(names) - 1 else ""
+            f.write(f"  {json.dumps(name, ensure_ascii=False)}: "
+                    f"{json.dumps(manifest[name], ensure_ascii=False, sort_keys=True)}{separator}\n")
+        f.write("}\n")
+    os.replace(tmp_file, MANIFEST_FILE)
+    if JOURNAL_FILE.exists():
+        JOURNAL_FILE.unlink()
+
+
+def load_stat_cache() -> Dict[str, Dict[str, list]]:
+    """Charge les signatures stat de la dernière synchronisation sur cette machine.
+
+    Forme : ``{screen: {"code": [taille, mtime_ns, inode, hash], "screen": [...]}}``.
+    Un cache absent, illisible ou d'une autre version équivaut à un cache vide.
+    """
+    try:
+        with open(STAT_CACHE_FILE, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(data, dict) or data.get("version") != STAT_CACHE_VERSION:
+        return {}
+    return data.get("screens", {})
+
+
+def save_stat_cache(stat_cache: Dict[str, Dict[str, list]]):
+    """Écrit le cache des signatures stat (écriture atomique)."""
+    STAT_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+    tmp_file = STAT_CACHE_FILE.with_suffix(".json.tmp")
+    with open(tmp_file, 'w', encoding='utf-8') as f:
+        json.dump({"version": STAT_CACHE_VERSION, "screens": stat_cache}, f,
+                  sort_keys=True, separators=(",", ":"))
+    os.replace(tmp_file, STAT_CACHE_FILE)
+
+
+def update_stat_cache(stat_cache: Dict[str, Dict[str, list]], manifest: Dict,
+                      signatures: Dict[str, Dict[str, Tuple[int, int, int]]],
+                      removed: Iterable[str] = ()):
+    """Reporte dans ``stat_cache`` les signatures relevées et les hashes du manifest."""
+    for name in removed:
+        stat_cache.pop(name, None)
+    for name, files in signatures.items():
+        if name in manifest:
+            stat_cache[name] = {
+                prefix: [*signature, manifest[name][f"{prefix}_hash"]]
+                for prefix, signature in files.items()
+            }
+
+
+def touched_entries(old: Dict, new: Dict, added: List[str], modified: List[str]) -> List[str]:
+    """Screens au contenu inchangé dont l'entrée versionnée a changé (blob git, validateurs HTTP).
+
+    Ces mises à jour ne sont pas des changements pour le rapport, mais elles
+    doivent être journalisées pour que le scan ou le fetch suivant en
+    profite. Les champs propres au checkout (``LOCAL_ENTRY_KEYS``) sont
+    ignorés : un clone neuf sans changement de contenu n'écrit rien.
+    """
+    def persisted(entry: Dict) -> Dict:
+        return {key: value for key, value in entry.items() if key not in LOCAL_ENTRY_KEYS}
+
+    changed = set(added) | set(modified)
+    return sorted(
+        name for name in new
+        if name in old and name not in changed and persisted(old[name]) != persisted(new[name])
+    )
+
+
+def append_journal(manifest: Dict, added: List[str], modified: List[str], removed: List[str],
+                   touched: Optional[List[str]] = None):
+    """Ajoute au journal une entrée par screen ajouté, modifié, mis à jour (``touch``) ou supprimé."""
+    touched = touched or []
+    if not (added or modified or removed or touched):
+        return
     DOCS_STITCH_DIR.mkdir(parents=True, exist_ok=True)
-    with open(MANIFEST_FILE, 'w', encoding='utf-8') as f:
-        json.dump(manifest, f, indent=2, ensure_ascii=False)
+    timestamp = datetime.now().isoformat(timespec="seconds")
+    with open(JOURNAL_FILE, 'a', encoding='utf-8') as f:
+        for op, names in (("add", added), ("modify", modified), ("touch", touched)):
+            for name in names:
+                f.write(json.dumps({"op": op, "name": name, "ts": timestamp, "entry": manifest[name]},
+                                   ensure_ascii=False, sort_keys=True) + "\n")
+        for name in removed:
+            f.write(json.dumps({"op": "remove", "name": name, "ts": timestamp},
+                               ensure_ascii=False, sort_keys=True) + "\n")
+
+
+def commit_changes(manifest: Dict, added: List[str], modified: List[str], removed: List[str],
+                   compact: bool = False, touched: Optional[List[str]] = None) -> bool:
+    """Enregistre les changements dans le journal, puis compacte si nécessaire.
+
+    ``touched`` : screens dont seules les métadonnées ont changé (voir
+    ``touched_entries``). Retourne True si l'instantané a été réécrit.
+    """
+    append_journal(manifest, added, modified, removed, touched)
+    threshold = max(JOURNAL_MIN_COMPACT, int(len(manifest) * JOURNAL_COMPACT_RATIO))
+    if compact or not MANIFEST_FILE.exists() or journal_length() >= threshold:
+        save_manifest(manifest)
+        return True
+    return False
+
+
+def prune_reports(keep: int) -> List[Path]:
+    """Supprime les rapports sync-report-*.md les plus anciens au-delà de ``keep``."""
+    if keep < 0 or not DOCS_STITCH_DIR.exists():
+        return []
+    reports = sorted(DOCS_STITCH_DIR.glob("sync-report-*.md"), key=lambda p: p.stat().st_mtime)
+    evicted = reports[:max(len(reports) - keep, 0)]
+    for report in evicted:
+        report.unlink()
+    return evicted
+
+
+def _stat_signature(st: os.stat_result) -> Tuple[int, int, int]:
+    """Signature (taille, mtime_ns, inode) utilisée pour éviter un re-hash."""
+    return st.st_size, st.st_mtime_ns, st.st_ino
+
+
+class GitState:
+    """Blobs de l'index git et fichiers modifiés localement sous un dossier."""
+    
+    def __init__(self, blobs: Dict[str, str], dirty: set):
+        self.blobs = blobs
+        self.dirty = dirty
+    
+    @classmethod
+    def read(cls, directory: Path) -> Optional["GitState"]:
+        """Lit l'état git de ``directory`` (None si git ou le dépôt est indisponible).
+
+        Deux appels : ``git ls-files -s`` (blobs de l'index) et
+        ``git diff-files`` (fichiers du dossier de travail différents de l'index).
+        """
+        def run(*args) -> Optional[List[str]]:
+            try:
+                result = subprocess.run(
+                    ["git", *args, "-z", "--", str(directory)],
+                    capture_output=True, check=True,
+                )
+            except (OSError, subprocess.CalledProcessError):
+                return None
+            return [item for item in result.stdout.decode("utf-8", "surrogateescape").split("\0") if item]
+        
+        staged = run("ls-files", "-s")
+        changed = run("diff-files", "--name-only", "--relative")
+        if staged is None or changed is None:
+            return None
+        blobs = {}
+        for item in staged:
+            info, _, path = item.partition("\t")
+            _mode, blob, stage = info.split()
+            if stage == "0":
+                blobs[path] = blob
+        return cls(blobs, set(changed))
+    
+    def clean_blob(self, file_path: Path) -> Optional[str]:
+        """Blob git d'un fichier s'il est suivi et identique à l'index."""
+        key = file_path.as_posix()
+        if key in self.dirty:
+            return None
+        return self.blobs.get(key)
+
+
+def _reuse_hash(previous: Optional[Dict], prefix: str, st: os.stat_result,
+                blob: Optional[str] = None, cached: Optional[list] = None) -> Optional[str]:
+    """Retourne le hash connu si le blob git ou la signature stat n'a pas bougé.
+
+    ``cached`` : ``[taille, mtime_ns, inode, hash]`` du cache stat local.
+    """
+    if blob is not None and previous and previous.get(f"{prefix}_blob") == blob:
+        return previous.get(f"{prefix}_hash")
+    if cached and tuple(cached[:3]) == _stat_signature(st):
+        return cached[3]
+    return None
+
+
+def _stat_screen(screen_dir: Path, previous_entry: Optional[Dict],
+                 pending: List[Tuple[Dict, str, Path]],
+                 git_state: Optional[GitState] = None,
+                 cached: Optional[Dict[str, list]] = None,
+                 signatures: Optional[Dict[str, Dict[str, Tuple[int, int, int]]]] = None) -> Optional[Dict]:
+    """Construit l'entrée de manifest d'un screen à partir de ``stat`` seulement.
+
+    Les fichiers dont le hash ne peut être repris ni de ``previous_entry``
+    (blob git) ni de ``cached`` (cache stat local) sont ajoutés à
+    ``pending`` ; l'entrée retournée contient alors ``None`` pour ces hashes
+    jusqu'à l'appel de ``_hash_pending``. Les signatures stat relevées sont
+    écrites dans ``signatures`` (voir ``update_stat_cache``).
+    """
+    code_file = screen_dir / "code.html"
+    screen_file = screen_dir / "screen.png"
+    
+    try:
+        code_stat = code_file.stat()
+        screen_stat = screen_file.stat()
+    except (FileNotFoundError, NotADirectoryError):
+        return None
+    
+    entry = {"name": screen_dir.name}
+    for prefix, file_path, st in (
+        ("code", code_file, code_stat),
+        ("screen", screen_file, screen_stat),
+    ):
+        blob = git_state.clean_blob(file_path) if git_state else None
+        file_hash = _reuse_hash(previous_entry, prefix, st, blob, (cached or {}).get(prefix))
+        if file_hash is None:
+            pending.append((entry, f"{prefix}_hash", file_path))
+        entry[f"{prefix}_hash"] = file_hash
+        if blob is not None:
+            entry[f"{prefix}_blob"] = blob
+    
+    entry.update({
+        "code_size": code_stat.st_size,
+        "screen_size": screen_stat.st_size,
+        "last_modified": datetime.fromtimestamp(
+            max(code_stat.st_mtime, screen_stat.st_mtime)
+        ).isoformat(),
+    })
+    if signatures is not None:
+        signatures[screen_dir.name] = {
+            "code": _stat_signature(code_stat),
+            "screen": _stat_signature(screen_stat),
+        }
+    for key in REMOTE_VALIDATOR_KEYS:
+        if previous_entry and previous_entry.get(key):
+            entry[key] = previous_entry[key]
+    return entry
+
+
+def _hash_pending(pending: List[Tuple[Dict, str, Path]], jobs: int):
+    """Calcule les hashes en attente, sur ``jobs`` threads si ``jobs > 1``."""
+    paths = [file_path for _, _, file_path in pending]
+    if jobs > 1 and len(paths) > 1:
+        with ThreadPoolExecutor(max_workers=jobs) as executor:
+            hashes = list(executor.map(calculate_file_hash, paths))
+    else:
+        hashes = [calculate_file_hash(path) for path in paths]
+    
+    for (entry, key, _), file_hash in zip(pending, hashes):
+        entry[key] = file_hash
+
+
+def _carry_blobs(screens: Dict[str, Dict], previous: Dict):
+    """Reprend les blobs git de ``previous`` quand git n'a pas été consulté.
 
+    Même hash, même contenu, donc même blob : sans cela un scan ``--detect
+    stat`` ou ``--watch`` retirerait les blobs du manifest versionné.
+    """
+    for name, entry in screens.items():
+        previous_entry = previous.get(name) or {}
+        for prefix in ("code", "screen"):
+            key = f"{prefix}_blob"
+            if (key not in entry and previous_entry.get(key)
+                    and previous_entry.get(f"{prefix}_hash") == entry[f"{prefix}_hash"]):
+                entry[key] = previous_entry[key]
 
-def scan_stitch_screens() -> Dict[str, Dict]:
-    """Scanne le dossier des screens Stitch et retourne un manifest."""
+
+def scan_stitch_screens(
+    previous: Optional[Dict] = None,
+    full_rehash: bool = False,
+    jobs: int = DEFAULT_JOBS,
+    detect: str = "auto",
+    stat_cache: Optional[Dict[str, Dict[str, list]]] = None,
+) -> Dict[str, Dict]:
+    """Scanne le dossier des screens Stitch et retourne un manifest.
+
+    Les hashes d'un fichier dont la taille, le mtime (ns) et l'inode sont
+    inchangés dans ``stat_cache`` sont repris tels quels au lieu d'être
+    recalculés ; ``stat_cache`` est ensuite mis à jour sur place.
+    ``full_rehash`` force le recalcul de tous les hashes.
+
+    ``detect`` vaut ``stat`` (signature stat seule), ``git`` (blobs de l'index
+    git en plus, erreur si git est indisponible) ou ``auto`` (git si possible).
+
+    Le parcours des dossiers ne fait que des ``stat`` ; les fichiers à hasher
+    sont ensuite répartis sur ``jobs`` threads. Le manifest est trié par nom,
+    il est donc identique quel que soit le nombre de workers.
+    """
     screens = {}
+    previous = {} if (previous is None or full_rehash) else previous
+    cache = {} if (stat_cache is None or full_rehash) else stat_cache
+    pending: List[Tuple[Dict, str, Path]] = []
+    signatures: Dict[str, Dict[str, Tuple[int, int, int]]] = {}
     
     if not STITCH_SCREENS_DIR.exists():
         print(f"⚠️  Dossier {STITCH_SCREENS_DIR} introuvable")
         return screens
     
-    for screen_dir in STITCH_SCREENS_DIR.iterdir():
+    git_state = GitState.read(STITCH_SCREENS_DIR) if detect != "stat" else None
+    if detect == "git" and git_state is None:
+        raise RuntimeError(f"État git indisponible pour {STITCH_SCREENS_DIR}")
+    
+    for screen_dir in sorted(STITCH_SCREENS_DIR.iterdir(), key=lambda p: p.name):
         if not screen_dir.is_dir():
             continue
         
-        screen_name = screen_dir.name
-        code_file = screen_dir / "code.html"
-        screen_file = screen_dir / "screen.png"
-        
-        if not code_file.exists() or not screen_file.exists():
-            continue
-        
-        screens[screen_name] = {
-            "name": screen_name,
-            "code_hash": calculate_file_hash(code_file),
-            "screen_hash": calculate_file_hash(screen_file),
-            "code_size": code_file.stat().st_size,
-            "screen_size": screen_file.stat().st_size,
-            "last_modified": datetime.fromtimestamp(
-                max(code_file.stat().st_mtime, screen_file.stat().st_mtime)
-            ).isoformat(),
-        }
+        entry = _stat_screen(screen_dir, previous.get(screen_dir.name), pending, git_state,
+                             cache.get(screen_dir.name), signatures)
+        if entry is not None:
+            screens[screen_dir.name] = entry
+    
+    _hash_pending(pending, jobs)
+    if git_state is None:
+        _carry_blobs(screens, previous)
+    if stat_cache is not None:
+        update_stat_cache(stat_cache, screens, signatures,
+                          removed=[name for name in list(stat_cache) if name not in screens])
+    
+    if previous or cache:
+        print(f"   Hashes réutilisés: {2 * len(screens) - len(pending)}, recalculés: {len(pending)}")
     
     return screens
 
 
+def update_screens(manifest: Dict, names: Iterable[str], jobs: int = DEFAULT_JOBS,
+                   stat_cache: Optional[Dict[str, Dict[str, list]]] = None
+                   ) -> Tuple[List[str], List[str], List[str]]:
+    """Rescanne seulement les screens ``names`` et met ``manifest`` à jour sur place.
+
+    ``stat_cache`` (voir ``load_stat_cache``) est mis à jour de la même façon.
+    Retourne (ajoutés, modifiés, supprimés) comme ``compare_manifests``.
+    """
+    old = {}
+    new = {}
+    cache = stat_cache if stat_cache is not None else {}
+    pending: List[Tuple[Dict, str, Path]] = []
+    signatures: Dict[str, Dict[str, Tuple[int, int, int]]] = {}
+    for name in sorted(set(names)):
+        if name in manifest:
+            old[name] = manifest[name]
+        entry = _stat_screen(STITCH_SCREENS_DIR / name, manifest.get(name), pending,
+                             cached=cache.get(name), signatures=signatures)
+        if entry is not None:
+            new[name] = entry
+    _hash_pending(pending, jobs)
+    _carry_blobs(new, old)
+    
+    added, modified, removed = compare_manifests(old, new)
+    for name in removed:
+        del manifest[name]
+    manifest.update(new)
+    update_stat_cache(cache, manifest, signatures, removed)
+    return added, modified, removed
+
+
 def compare_manifests(old: Dict, new: Dict) -> Tuple[List[str], List[str], List[str]]:
     """Compare deux manifests et retourne les différences."""
     added = []
@@ -90,13 +471,13 @@ def compare_manifests(old: Dict, new: Dict) -> Tuple[List[str], List[str], List[
     new_names = set(new.keys())
     
     # Screens ajoutés
-    added = list(new_names - old_names)
+    added = sorted(new_names - old_names)
     
     # Screens supprimés
-    removed = list(old_names - new_names)
+    removed = sorted(old_names - new_names)
     
     # Screens modifiés
-    for name in old_names & new_names:
+    for name in sorted(old_names & new_names):
         old_screen = old[name]
         new_screen = new[name]
         
@@ -107,7 +488,93 @@ def compare_manifests(old: Dict, new: Dict) -> Tuple[List[str], List[str], List[
     return added, modified, removed
 
 
-def generate_report(added: List[str], modified: List[str], removed: List[str]) -> str:
+@dataclass
+class ContentMatch:
+    """Screen dont le contenu correspond (en tout ou en partie) à un autre."""
+    kind: str  # rename, copy, duplicate
+    source: str
+    target: str
+    score: float  # part des octets de ``target`` partagés avec ``source`` (1.0 = identique)
+
+
+def content_similarity(source: Dict, target: Dict) -> float:
+    """Part des octets de ``target`` (code.html + screen.png) identiques à ``source``."""
+    total = target.get("code_size", 0) + target.get("screen_size", 0)
+    shared = 0
+    matched = 0
+    for prefix in ("code", "screen"):
+        if source.get(f"{prefix}_hash") == target.get(f"{prefix}_hash"):
+            shared += target.get(f"{prefix}_size", 0)
+            matched += 1
+    if total == 0:
+        return matched / 2
+    return round(shared / total, 3)
+
+
+def _hash_index(manifest: Dict) -> Dict[str, List[str]]:
+    """Index inverse hash -> noms, pour code_hash et screen_hash."""
+    index: Dict[str, List[str]] = {}
+    for name in sorted(manifest):
+        entry = manifest[name]
+        for key in ("code_hash", "screen_hash"):
+            value = entry.get(key)
+            if value:
+                index.setdefault(value, []).append(name)
+    return index
+
+
+def detect_content_matches(old: Dict, new: Dict, added: List[str],
+                           removed: List[str]) -> List[ContentMatch]:
+    """Rattache chaque screen ajouté au screen de l'ancien manifest le plus proche.
+
+    Un screen ajouté qui partage un fichier avec un screen supprimé est un
+    renommage ; s'il le partage avec un screen toujours présent, c'est une
+    copie. La recherche passe par un index inverse des hashes (O(N)).
+    """
+    index = _hash_index(old)
+    removed_set = set(removed)
+    renamed_from = set()
+    matches = []
+    for name in added:
+        entry = new[name]
+        candidates = set(index.get(entry.get("code_hash"), ())) | set(index.get(entry.get("screen_hash"), ()))
+        ranked = sorted(
+            (
+                (content_similarity(old[source], entry), source in removed_set, source)
+                for source in candidates
+                if source not in renamed_from and (source in removed_set or source in new)
+            ),
+            key=lambda item: (-item[0], not item[1], item[2]),
+        )
+        if not ranked:
+            continue
+        score, is_rename, source = ranked[0]
+        if is_rename:
+            renamed_from.add(source)
+        matches.append(ContentMatch("rename" if is_rename else "copy", source, name, score))
+    return matches
+
+
+def find_duplicates(manifest: Dict) -> List[ContentMatch]:
+    """Screens partageant un code.html ou un screen.png avec un autre screen.
+
+    Chaque groupe est rattaché à son premier nom (ordre alphabétique).
+    """
+    pairs = {}
+    for names in _hash_index(manifest).values():
+        source = names[0]
+        for target in names[1:]:
+            if (source, target) not in pairs:
+                pairs[(source, target)] = ContentMatch(
+                    "duplicate", source, target,
+                    content_similarity(manifest[source], manifest[target])
+                )
+    return sorted(pairs.values(), key=lambda m: (m.source, m.target))
+
+
+def generate_report(added: List[str], modified: List[str], removed: List[str],
+                    matches: Optional[List[ContentMatch]] = None,
+                    duplicates: Optional[List[ContentMatch]] = None) -> str:
     """Génère un rapport markdown des changements."""
     report = f"""# Rapport de Synchronisation Stitch Screens
 
@@ -139,44 +606,235 @@ def generate_report(added: List[str], modified: List[str], removed: List[str]) -
             report += f"- `{name}`\n"
         report += "\n"
     
+    for kind, title in (("rename", "Screens Renommés"), ("copy", "Screens Copiés")):
+        kind_matches = [m for m in matches or [] if m.kind == kind]
+        if kind_matches:
+            report += f"## {title}\n\n"
+            for match in kind_matches:
+                report += f"- `{match.source}` → `{match.target}` (similarité {match.score:.2f})\n"
+            report += "\n"
+    
+    if duplicates:
+        report += "## Contenu Dupliqué\n\n"
+        for match in duplicates:
+            report += f"- `{match.target}` ≈ `{match.source}` (similarité {match.score:.2f})\n"
+        report += "\n"
+    
     return report
 
 
-def main():
+def generate_batch_section(added: List[str], modified: List[str], removed: List[str]) -> str:
+    """Section de rapport pour un lot de changements détecté en mode --watch."""
+    section = f"## {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n"
+    for label, names in (("✅ Ajouté", added), ("🔄 Modifié", modified), ("❌ Supprimé", removed)):
+        for name in names:
+            section += f"- {label}: `{name}`\n"
+    return section + "\n"
+
+
+def watch_stitch_screens(manifest: Dict, jobs: int = DEFAULT_JOBS,
+                         debounce: float = 0.3, poll_interval: float = 0.5,
+                         force_polling: bool = False,
+                         keep_reports: int = DEFAULT_KEEP_REPORTS,
+                         stat_cache: Optional[Dict[str, Dict[str, list]]] = None) -> int:
+    """Mode démon : met à jour le manifest et le rapport à chaque lot de changements.
+
+    Seuls les screens touchés sont re-stat/re-hashés ; le manifest est
+    sauvegardé et une section est ajoutée au rapport de la session après
+    chaque lot. S'arrête proprement sur Ctrl+C.
+    """
+    from fs_watch import create_watcher
+    
+    if not STITCH_SCREENS_DIR.exists():
+        print(f"⚠️  Dossier {STITCH_SCREENS_DIR} introuvable")
+        return 1
+    
+    watcher = create_watcher(STITCH_SCREENS_DIR, debounce, poll_interval, force_polling)
+    report_file = DOCS_STITCH_DIR / f"sync-report-watch-{datetime.now().strftime('%Y%m%d-%H%M%S')}.md"
+    print(f"👀 Surveillance de {STITCH_SCREENS_DIR} ({type(watcher).__name__}), Ctrl+C pour arrêter")
+    prune_reports(max(keep_reports - 1, 0))
+    stat_cache = stat_cache if stat_cache is not None else load_stat_cache()
+    
+    try:
+        for touched in watcher.batches():
+            before = {name: manifest[name] for name in touched if name in manifest}
+            added, modified, removed = update_screens(manifest, touched, jobs, stat_cache)
+            save_stat_cache(stat_cache)
+            metadata_only = touched_entries(before, manifest, added, modified)
+            if not (added or modified or removed):
+                commit_changes(manifest, [], [], [], touched=metadata_only)
+                continue
+            commit_changes(manifest, added, modified, removed, touched=metadata_only)
+            DOCS_STITCH_DIR.mkdir(parents=True, exist_ok=True)
+            is_new = not report_file.exists()
+            with open(report_file, 'a', encoding='utf-8') as f:
+                if is_new:
+                    f.write("# Rapport de Synchronisation Stitch Screens (watch)\n\n")
+                f.write(generate_batch_section(added, modified, removed))
+            print(f"   +{len(added)} ~{len(modified)} -{len(removed)} "
+                  f"({', '.join(added + modified + removed)})")
+    except KeyboardInterrupt:
+        print("\n⏹️  Surveillance arrêtée")
+    finally:
+        watcher.close()
+    return 0
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """Analyse les arguments de la ligne de commande."""
+    parser = argparse.ArgumentParser(description="Synchronisation des screens Google Stitch")
+    parser.add_argument(
+        "--full-rehash",
+        action="store_true",
+        default=os.environ.get("FORCE_UPDATE", "").lower() == "true",
+        help="Recalcule tous les hashes au lieu de réutiliser ceux du manifest "
+             "(activé aussi par FORCE_UPDATE=true)"
+    )
+    parser.add_argument(
+        "--jobs", "-j",
+        type=int,
+        default=DEFAULT_JOBS,
+        help=f"Nombre de threads de hashing (défaut : {DEFAULT_JOBS})"
+    )
+    parser.add_argument(
+        "--detect",
+        choices=["auto", "stat", "git"],
+        default="auto",
+        help="Détection des fichiers inchangés : signature stat, blobs de l'index git, "
+             "ou git si disponible (défaut : auto)"
+    )
+    parser.add_argument(
+        "--watch",
+        action="store_true",
+        help="Après la synchronisation, surveille le dossier (inotify, sinon polling) "
+             "et met le manifest à jour à chaque export"
+    )
+    parser.add_argument(
+        "--poll",
+        action="store_true",
+        help="Avec --watch : force la surveillance par polling"
+    )
+    parser.add_argument(
+        "--debounce",
+        type=float,
+        default=0.3,
+        help="Avec --watch : secondes de calme avant de traiter un lot (défaut : 0.3)"
+    )
+    parser.add_argument(
+        "--compact",
+        action="store_true",
+        help="Réécrit l'instantané manifest.json et vide le journal"
+    )
+    parser.add_argument(
+        "--keep-reports",
+        type=int,
+        default=DEFAULT_KEEP_REPORTS,
+        help=f"Nombre de rapports sync-report-*.md conservés (défaut : {DEFAULT_KEEP_REPORTS})"
+    )
+    parser.add_argument(
+        "--remote",
+        type=str,
+        default=os.environ.get("STITCH_API_URL"),
+        help="URL de l'API Stitch à synchroniser avant le scan (défaut : $STITCH_API_URL)"
+    )
+    parser.add_argument(
+        "--fetch-jobs",
+        type=int,
+        default=8,
+        help="Avec --remote : téléchargements simultanés (défaut : 8)"
+    )
+    parser.add_argument(
+        "--prune",
+        action="store_true",
+        help="Avec --remote : supprime les screens locaux absents de la liste distante"
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None):
     """Fonction principale."""
+    args = parse_args(argv)
     print("🔄 Synchronisation des screens Google Stitch...")
     
     # Charger l'ancien manifest
     old_manifest = load_manifest()
     
-    # Scanner les screens actuels
-    new_manifest = scan_stitch_screens()
+    # Récupérer les screens distants (requêtes conditionnelles, reprise)
+    fetch_summary = None
+    if args.remote:
+        from stitch_fetch import FetchError, fetch_remote_screens
+        try:
+            fetch_summary = fetch_remote_screens(
+                old_manifest, args.remote, api_key=os.environ.get("STITCH_API_KEY"),
+                jobs=max(args.fetch_jobs, 1), force=args.full_rehash, prune=args.prune
+            )
+        except (FetchError, RuntimeError) as e:
+            print(f"❌ Récupération distante impossible : {e}")
+            return 1
+        print(f"🌐 {len(fetch_summary.remote_screens)} screens distants : "
+              f"{fetch_summary.count('fetched') + fetch_summary.count('resumed')} fichiers téléchargés, "
+              f"{fetch_summary.count('not_modified') + fetch_summary.count('unchanged')} inchangés, "
+              f"{len(fetch_summary.failed)} en échec")
+        for result in fetch_summary.failed:
+            print(f"   ⚠️  {result.screen}/{result.filename} : {result.error}")
+        if fetch_summary.failed:
+            # Miroir partiel : ni manifest ni rapport, la PR de synchronisation n'est pas créée
+            print("❌ Téléchargements en échec : manifest et rapports non mis à jour")
+            return 1
+    
+    # Scanner les screens actuels (hashes réutilisés si stat inchangé)
+    stat_cache = load_stat_cache()
+    new_manifest = scan_stitch_screens(
+        old_manifest, full_rehash=args.full_rehash, jobs=max(args.jobs, 1),
+        detect=args.detect, stat_cache=stat_cache
+    )
     
     if not new_manifest:
         print("❌ Aucun screen trouvé")
         return 1
+    save_stat_cache(stat_cache)
+    if fetch_summary is not None:
+        from stitch_fetch import apply_validators
+        apply_validators(new_manifest, fetch_summary.validators)
     
     # Comparer
     added, modified, removed = compare_manifests(old_manifest, new_manifest)
     
-    # Générer le rapport
-    report = generate_report(added, modified, removed)
-    
-    # Sauvegarder le rapport
-    report_file = DOCS_STITCH_DIR / f"sync-report-{datetime.now().strftime('%Y%m%d-%H%M%S')}.md"
-    DOCS_STITCH_DIR.mkdir(parents=True, exist_ok=True)
-    with open(report_file, 'w', encoding='utf-8') as f:
-        f.write(report)
+    # Générer et sauvegarder le rapport (seulement s'il y a des changements)
+    report_file = None
+    matches = detect_content_matches(old_manifest, new_manifest, added, removed)
+    if added or modified or removed:
+        report = generate_report(added, modified, removed, matches, find_duplicates(new_manifest))
+        report_file = DOCS_STITCH_DIR / f"sync-report-{datetime.now().strftime('%Y%m%d-%H%M%S')}.md"
+        DOCS_STITCH_DIR.mkdir(parents=True, exist_ok=True)
+        with open(report_file, 'w', encoding='utf-8') as f:
+            f.write(report)
+    evicted = prune_reports(args.keep_reports)
     
-    # Sauvegarder le nouveau manifest
-    save_manifest(new_manifest)
+    # Journaliser les changements (compaction si le journal est trop long)
+    compacted = commit_changes(
+        new_manifest, added, modified, removed, compact=args.compact,
+        touched=touched_entries(old_manifest, new_manifest, added, modified)
+    )
     
     # Afficher le résumé
     print(f"\n✅ Synchronisation terminée")
     print(f"   - Screens ajoutés: {len(added)}")
     print(f"   - Screens modifiés: {len(modified)}")
     print(f"   - Screens supprimés: {len(removed)}")
-    print(f"   - Rapport: {report_file}")
+    print(f"   - Renommages / copies: {sum(m.kind == 'rename' for m in matches)} / "
+          f"{sum(m.kind == 'copy' for m in matches)}")
+    print(f"   - Rapport: {report_file or 'aucun changement'}")
+    print(f"   - Manifest: {'instantané réécrit' if compacted else f'{journal_length()} entrées de journal'}")
+    if evicted:
+        print(f"   - Rapports supprimés: {len(evicted)}")
+    
+    if args.watch:
+        return watch_stitch_screens(
+            new_manifest, jobs=max(args.jobs, 1), debounce=args.debounce,
+            force_polling=args.poll, keep_reports=args.keep_reports,
+            stat_cache=stat_cache
+        )
     
     # Retourner un code d'erreur si des changements ont été détectés
     if added or modified or removed:
@@ -0,0 +1,258 @@
+#!/usr/bin/env python3
+"""
+Assets et clés de traduction inutilisés.
+
+Un seul automate multi-motifs (Aho-Corasick) est construit à partir de :
+
+- chaque chemin d'asset sous ``assets/`` (hors polices, référencées par leur
+  famille et non par leur chemin, et hors fichiers cachés) ;
+- chaque clé des fichiers ``assets/translations/*.json``, entre guillemets
+  simples et doubles (``'search'``, ``"search"``) pour ne retenir que les
+  littéraux complets ;
+- chaque dossier d'assets (``assets/translations/``), pour repérer les
+  chemins construits par interpolation.
+
+Chaque fichier ``lib/**/*.dart`` est lu une seule fois et parcouru en un
+seul passage : le coût est linéaire en la taille du code plus le nombre de
+correspondances, quel que soit le nombre de motifs. Un chemin interpolé
+(``'assets/translations/$languageCode.json'``) devient une expression
+régulière appliquée aux assets de son dossier.
+
+Le rapport liste les assets et les clés jamais référencés, ainsi que les
+clés absentes de certaines locales (par rapport à l'union des clés).
+
+Usage:
+    python scripts/unused_assets.py
+    python scripts/unused_assets.py --json
+"""
+
+import re
+import sys
+import json
+import argparse
+from collections import deque
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Set, Tuple
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from project_index import ProjectIndex
+
+ASSETS_DIR = "assets"
+TRANSLATIONS_DIR = "assets/translations"
+# Polices : référencées par ``fontFamily`` (pubspec), pas par leur chemin
+EXCLUDED_ASSET_DIRS = ("assets/fonts",)
+_INTERPOLATION_RE = re.compile(r"\$\{[^}]*\}|\$[A-Za-z_]\w*")
+
+
+class MultiPatternMatcher:
+    """Automate d'Aho-Corasick sur des chaînes de caractères.
+
+    Les transitions sont des dicts par état ; ``outputs[état]`` contient les
+    indices des motifs qui se terminent dans cet état (y compris par les
+    liens d'échec).
+    """
+
+    def __init__(self, patterns: Iterable[str]):
+        self.patterns: List[str] = []
+        self.goto: List[Dict[str, int]] = [{}]
+        self.fail: List[int] = [0]
+        self.outputs: List[List[int]] = [[]]
+        for pattern in patterns:
+            self._add(pattern)
+        self._link()
+
+    def _add(self, pattern: str):
+        state = 0
+        for char in pattern:
+            next_state = self.goto[state].get(char)
+            if next_state is None:
+                next_state = len(self.goto)
+                self.goto[state][char] = next_state
+                self.goto.append({})
+                self.fail.append(0)
+                self.outputs.append([])
+            state = next_state
+        self.outputs[state].append(len(self.patterns))
+        self.patterns.append(pattern)
+
+    def _link(self):
+        """Liens d'échec en largeur ; les sorties des suffixes sont fusionnées."""
+        queue = deque(self.goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self.goto[state].items():
+                queue.append(next_state)
+                fallback = self.fail[state]
+                while fallback and char not in self.goto[fallback]:
+                    fallback = self.fail[fallback]
+                self.fail[next_state] = self.goto[fallback].get(char, 0)
+                self.outputs[next_state] = self.outputs[next_state] + self.outputs[self.fail[next_state]]
+
+    def finditer(self, text: str) -> Iterable[Tuple[int, int]]:
+        """(position de fin exclue, indice du motif) de chaque occurrence."""
+        goto, fail, outputs = self.goto, self.fail, self.outputs
+        state = 0
+        for position, char in enumerate(text):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            for pattern in outputs[state]:
+                yield position + 1, pattern
+
+
+def list_assets(index: ProjectIndex) -> List[str]:
+    """Chemins d'assets candidats (triés)."""
+    return [
+        path for path in index.files_under(ASSETS_DIR)
+        if not path.rsplit("/", 1)[-1].startswith(".")
+        and not any(path.startswith(d + "/") for d in EXCLUDED_ASSET_DIRS)
+    ]
+
+
+def load_translation_keys(index: ProjectIndex) -> Dict[str, List[str]]:
+    """Clés de premier niveau de chaque fichier de traduction, par locale.
+
+    ``TranslationLoader`` charge un dict plat : les valeurs imbriquées ne
+    sont pas des clés.
+    """
+    locales: Dict[str, List[str]] = {}
+    for name in sorted(index.files(TRANSLATIONS_DIR)):
+        if not name.endswith(".json"):
+            continue
+        try:
+            data = json.loads(index.path(f"{TRANSLATIONS_DIR}/{name}").read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            continue
+        if isinstance(data, dict):
+            locales[name[:-len(".json")]] = list(data)
+    return locales
+
+
+def _literal_at(text: str, start: int) -> str:
+    """Littéral de chaîne qui contient ``text[start:]``, si ``start`` suit un guillemet."""
+    quote = text[start - 1] if start > 0 else ""
+    if quote not in ("'", '"'):
+        return ""
+    end = text.find(quote, start)
+    line_end = text.find("\n", start)
+    if end < 0 or (0 <= line_end < end):
+        return ""
+    return text[start:end]
+
+
+def dynamic_pattern(literal: str) -> "re.Pattern":
+    """Expression régulière d'un chemin interpolé (``$x`` / ``${x}`` : un segment)."""
+    parts = _INTERPOLATION_RE.split(literal)
+    return re.compile("[^/]*".join(re.escape(part) for part in parts) + "$")
+
+
+def scan_references(index: ProjectIndex, assets: List[str], keys: Iterable[str]) -> Dict[str, Any]:
+    """Parcourt ``lib/**/*.dart`` une fois et retourne les motifs rencontrés.
+
+    Retourne ``{assets, keys, dynamic, files}`` : assets et clés référencés,
+    chemins interpolés rencontrés et nombre de fichiers lus.
+    """
+    # (motif, type, valeur) : l'indice du motif dans l'automate est sa position
+    patterns: List[Tuple[str, str, str]] = [(path, "asset", path) for path in assets]
+    for key in sorted(set(keys)):
+        patterns.append((f"'{key}'", "key", key))
+        patterns.append((f'"{key}"', "key", key))
+    for directory in sorted({path.rsplit("/", 1)[0] + "/" for path in assets}):
+        patterns.append((directory, "dir", directory))
+    matcher = MultiPatternMatcher(pattern for pattern, _, _ in patterns)
+
+    found_assets: Set[str] = set()
+    found_keys: Set[str] = set()
+    dynamic: Dict[str, List[str]] = {}
+    dart_files = index.files_with_suffix(".dart", under="lib")
+    for rel_path in dart_files:
+        try:
+            text = index.path(rel_path).read_text(encoding="utf-8", errors="replace")
+        except OSError:
+            continue
+        for end, pattern in matcher.finditer(text):
+            _, kind, value = patterns[pattern]
+            if kind == "asset":
+                found_assets.add(value)
+            elif kind == "key":
+                found_keys.add(value)
+            else:
+                literal = _literal_at(text, end - len(value))
+                if "$" in literal:
+                    dynamic.setdefault(literal, []).append(rel_path)
+
+    for literal in dynamic:
+        regex = dynamic_pattern(literal)
+        found_assets.update(path for path in assets if regex.match(path))
+    return {
+        "assets": found_assets,
+        "keys": found_keys,
+        "dynamic": {literal: sorted(set(files)) for literal, files in sorted(dynamic.items())},
+        "files": len(dart_files),
+    }
+
+
+def missing_keys(locales: Dict[str, List[str]]) -> Dict[str, List[str]]:
+    """Clés absentes de chaque locale, par rapport à l'union des clés."""
+    union = set().union(*locales.values()) if locales else set()
+    missing = {locale: sorted(union - set(keys)) for locale, keys in locales.items()}
+    return {locale: keys for locale, keys in missing.items() if keys}
+
+
+def analyze_project(index: ProjectIndex) -> Dict[str, Any]:
+    """Rapport complet pour l'Overseer."""
+    assets = list_assets(index)
+    locales = load_translation_keys(index)
+    keys = sorted(set().union(*locales.values())) if locales else []
+    references = scan_references(index, assets, keys)
+
+    unused_assets = [path for path in assets if path not in references["assets"]]
+    return {
+        "files": references["files"],
+        "assets": {
+            "total": len(assets),
+            "unused": unused_assets,
+            "unused_bytes": sum(index.path(path).stat().st_size for path in unused_assets),
+            "dynamic": references["dynamic"],
+        },
+        "keys": {
+            "total": len(keys),
+            "locales": sorted(locales),
+            "unused": [key for key in keys if key not in references["keys"]],
+            "missing": missing_keys(locales),
+        },
+    }
+
+
+def main():
+    """Point d'entrée principal."""
+    parser = argparse.ArgumentParser(description="Assets et clés de traduction inutilisés")
+    parser.add_argument("--json", action="store_true", help="Sortie JSON")
+    args = parser.parse_args()
+
+    project_root = Path(__file__).parent.parent
+    report = analyze_project(ProjectIndex.build(project_root))
+
+    if args.json:
+        print(json.dumps(report, indent=2, ensure_ascii=False))
+        return 0
+
+    assets, keys = report["assets"], report["keys"]
+    print(f"🧹 {report['files']} fichiers Dart parcourus")
+    print(f"   Assets inutilisés : {len(assets['unused'])}/{assets['total']} "
+          f"({assets['unused_bytes'] / 1024:.1f} Ko)")
+    for path in assets["unused"]:
+        print(f"     - {path}")
+    for literal, files in assets["dynamic"].items():
+        print(f"   Chemin interpolé : '{literal}' ({', '.join(files)})")
+    print(f"   Clés inutilisées : {len(keys['unused'])}/{keys['total']} ({len(keys['locales'])} locales)")
+    for key in keys["unused"]:
+        print(f"     - {key}")
+    for locale, missing in keys["missing"].items():
+        print(f"   Clés absentes de {locale} : {', '.join(missing)}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())